@@ -1,101 +1,150 @@
 import pygame
-import tkinter as tk
-from tkinter import ttk
-import threading
-import time
 import sys
-import random
+import time
 from typing import List, Tuple
-from PIL import Image, ImageDraw  # For creating QR code image
+from render_cache import BackgroundCache, VariantSurfaceCache, text_cache
+from dirty_rects import DirtyRectRenderer
+from idle_scheduler import IdleScheduler
+from frame_stats import FrameStats, FrameStatsOverlay, OVERLAY_KEY
+from exit_report import exit_report
+from lazy_module import LazyModule
+from assets import assets
+from display_host import DisplayHost
+from qr_codes import qr_image, qr_surface
+from pygame_scoreboard import PygameScoreboard
+from canvas_scoreboard import CanvasScoreboard
+from update_scheduler import UpdateScheduler
+from game_clock import TENTHS_BELOW_SECONDS, GameClock
+from match_state import SHOT_CLOCK_SECONDS, TIMEOUT_SECONDS
+from timer_service import Countdown, TimerService
+
+# The first screen is the pygame menu, so tkinter is imported when the host creates its root,
+# and the QR encoder (with NumPy) the first time a payment code is encoded
+tk = LazyModule("tkinter")
+qr_encoder = LazyModule("qr_encoder")
 
 class GameApplication:
-    def __init__(self):
+    def __init__(self, now=time.monotonic):
         self.current_screen = "rumbleverse"  # "rumbleverse", "tablesoccer", or "qrcode"
+        # One window for the whole session; screens are swapped inside it instead of quitting pygame or Tk
+        self.host = DisplayHost(SCREEN_WIDTH, SCREEN_HEIGHT, "RumbleVerse")
         self.rumbleverse_app = None
         self.tablesoccer_app = None
         self.qrcode_window = None
         self.running = True
+        # Every countdown (match clock, timeout, shot clock, idle return, payment code) shares
+        # one heap of deadlines and one after() on the host root, and they all read the time from
+        # now (a fake clock instead of time.monotonic fast-forwards a whole session)
+        self.timers = TimerService(self.host.root, now=now)
+        self.idle_timer = None
+        self.last_input = self.timers.now()
+        self.host.root.bind_all("<ButtonPress>", self.note_input, add="+")
+        self.host.root.bind_all("<KeyPress>", self.note_input, add="+")
         
     def start_rumbleverse(self):
         self.current_screen = "rumbleverse"
-        # Initialize pygame if not already initialized
-        if not pygame.get_init():
-            pygame.init()
-        self.rumbleverse_app = RumbleVerseUI(self)
-        self.rumbleverse_app.run()
+        # The menu is built once and kept; showing it again only redraws it
+        if self.rumbleverse_app is None:
+            self.rumbleverse_app = RumbleVerseUI(self)
+        self.host.show_pygame(self.rumbleverse_app, "rumbleverse")
         
     def start_tablesoccer(self):
         self.current_screen = "tablesoccer"
-        # Properly quit pygame before starting tkinter
-        if pygame.get_init():
-            pygame.quit()
-        self.tablesoccer_app = TableSoccerScoreboard(self)
-        self.tablesoccer_app.run()
+        if SCOREBOARD == "pygame":
+            # Like the menu, the pygame scoreboard is kept; a new match starts from a reset state
+            if self.tablesoccer_app is None:
+                self.tablesoccer_app = PygameScoreboard(self)
+            else:
+                self.tablesoccer_app.reset_game()
+            self.host.show_pygame(self.tablesoccer_app, "tablesoccer")
+        elif SCOREBOARD == "canvas":
+            self.tablesoccer_app = self.host.show(
+                "tablesoccer", lambda frame: CanvasScoreboard(self, frame, size=(SCREEN_WIDTH, SCREEN_HEIGHT)),
+                keep=True)
+        else:
+            self.tablesoccer_app = self.host.show("tablesoccer", lambda frame: TableSoccerScoreboard(self, frame))
+        self.arm_idle_return()
         
     def show_qr_code(self):
         self.current_screen = "qrcode"
-        # Properly quit pygame before starting tkinter
-        if pygame.get_init():
-            pygame.quit()
-        self.qrcode_window = QRCodeWindow(self)
-        self.qrcode_window.run()
+        self.qrcode_window = self.host.show("qrcode", lambda frame: QRCodeWindow(self, frame))
+        self.arm_idle_return()
         
     def back_to_rumbleverse(self):
         print("Returning to Game Mode Selection...")
-        if self.tablesoccer_app and hasattr(self.tablesoccer_app, 'root') and self.tablesoccer_app.root.winfo_exists():
-            self.tablesoccer_app.stop_timer()
-            self.tablesoccer_app.root.quit()  # Use quit() instead of destroy()
-            self.tablesoccer_app.root.destroy()
-        
-        if self.qrcode_window and hasattr(self.qrcode_window, 'root') and self.qrcode_window.root.winfo_exists():
-            self.qrcode_window.root.quit()
-            self.qrcode_window.root.destroy()
-        
-        # Small delay to ensure clean transition
-        time.sleep(0.1)
-        
-        # Restart pygame and rumbleverse
-        try:
-            self.start_rumbleverse()
-        except Exception as e:
-            print(f"Error returning to game modes: {e}")
-            # Fallback: restart the entire application
-            self.restart_application()
-    
-    def restart_application(self):
-        """Fallback method to restart the entire application"""
-        print("Restarting application...")
+        self.timers.cancel(self.idle_timer)
+        self.idle_timer = None
         if self.tablesoccer_app:
-            try:
-                self.tablesoccer_app.root.destroy()
-            except:
-                pass
+            self.tablesoccer_app.stop_timer()
+            self.tablesoccer_app.stop_countdowns()
         if self.qrcode_window:
-            try:
-                self.qrcode_window.root.destroy()
-            except:
-                pass
-        if pygame.get_init():
-            pygame.quit()
+            self.qrcode_window.stop_countdowns()
+        self.start_rumbleverse()
+        
+    def note_input(self, event=None):
+        self.last_input = self.timers.now()
+        
+    def arm_idle_return(self):
+        """Go back to the menu once a game or payment screen has had no input for IDLE_RETURN_SECONDS"""
+        self.note_input()
+        self.timers.cancel(self.idle_timer)
+        self.idle_timer = self.timers.call_at(self.last_input + IDLE_RETURN_SECONDS, self.idle_return)
+        
+    def idle_return(self):
+        # Input only moves last_input; the deadline is pushed back here, not on every tap
+        deadline = self.last_input + IDLE_RETURN_SECONDS
+        if self.timers.now() < deadline:
+            self.idle_timer = self.timers.call_at(deadline, self.idle_return)
+            return
+        if self.match_running():
+            self.idle_timer = self.timers.call_later(IDLE_RETURN_SECONDS, self.idle_return)
+            return
+        self.idle_timer = None
+        print(f"No input for {IDLE_RETURN_SECONDS} s")
+        self.back_to_rumbleverse()
         
-        # Create new application instance
-        new_app = GameApplication()
-        new_app.start_rumbleverse()
+    def match_running(self):
+        """Whether the scoreboard on screen has its game clock running"""
+        if self.current_screen != "tablesoccer" or self.tablesoccer_app is None:
+            return False
+        state = getattr(self.tablesoccer_app, "state", None)
+        return state.clock_running if state is not None else self.tablesoccer_app.timer_running
+        
+    def run(self):
+        # Only the subsystems the screens use; pygame.init() would also start audio and joysticks
+        pygame.display.init()
+        pygame.font.init()
+        self.start_rumbleverse()
+        self.host.run()
 
 # QR Code Window
 class QRCodeWindow:
-    def __init__(self, main_app):
+    def __init__(self, main_app, parent=None, now=time.monotonic):
         self.main_app = main_app
-        self.root = tk.Tk()
-        self.root.title("PaytoPlay - QR Code")
-        self.root.geometry("600x700")
-        self.root.configure(bg='#1e3a5f')
+        if parent is None:
+            # Standalone window; under the display host the screen is built into a page of its root
+            self.root = tk.Tk()
+            self.root.title("PaytoPlay - QR Code")
+            self.root.geometry("600x700")
+            self.root.configure(bg='#1e3a5f')
+            parent = self.root
+        else:
+            self.root = parent.winfo_toplevel()
+        self.parent = parent
+        
+        # Every visit to the payment screen gets its own session code, replaced when it expires
+        # The URL carries the session token, so it is never printed or logged
+        self.session_url = qr_encoder.new_payment_session_url()
+        self.timers = main_app.timers if main_app is not None else TimerService(self.root, now=now)
         
         self.setup_ui()
+        self.session_countdown = Countdown(self.timers, PAYMENT_SESSION_SECONDS,
+                                           self.show_session_time, self.renew_session)
+        self.session_countdown.start()
         
     def setup_ui(self):
         # Create main container
-        main_frame = tk.Frame(self.root, bg='#1e3a5f')
+        main_frame = tk.Frame(self.parent, bg='#1e3a5f')
         main_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Header section
@@ -117,19 +166,23 @@ class QRCodeWindow:
         qr_frame.pack(pady=20)
         
         # Create QR code image
-        qr_size = 400
-        qr_image = self.create_qr_code(qr_size)
+        self.qr_size = 400
+        qr_image = self.create_qr_code(self.qr_size)
         
         # Display QR code
-        self.qr_canvas = tk.Canvas(qr_frame, width=qr_size, height=qr_size, 
+        self.qr_canvas = tk.Canvas(qr_frame, width=self.qr_size, height=self.qr_size, 
                                  bg='white', highlightthickness=0)
         self.qr_canvas.pack()
         
-        # Draw QR code on canvas
-        for y in range(qr_size):
-            for x in range(qr_size):
-                if qr_image.getpixel((x, y)) == 0:  # Black pixel
-                    self.qr_canvas.create_rectangle(x, y, x+1, y+1, fill='black', outline='black')
+        # Draw QR code on canvas as a single image item
+        from PIL import ImageTk  # Only the QR screen needs Pillow
+        self.qr_photo = ImageTk.PhotoImage(qr_image)
+        self.qr_item = self.qr_canvas.create_image(0, 0, image=self.qr_photo, anchor='nw')
+        
+        # Time left on this session's code
+        self.expiry_label = tk.Label(main_frame, text="", font=('Arial', 12), 
+                                   fg='#cccccc', bg='#1e3a5f')
+        self.expiry_label.pack()
         
         # Instructions
         instructions_frame = tk.Frame(main_frame, bg='#4a6fa5', bd=2, relief='raised')
@@ -149,64 +202,28 @@ class QRCodeWindow:
         replace_btn.pack(pady=20)
     
     def create_qr_code(self, size):
-        """Create a QR code image with finder patterns and random data"""
-        # Create a blank image
-        image = Image.new('1', (size, size), 1)  # '1' mode is 1-bit pixels, black and white
-        draw = ImageDraw.Draw(image)
-        
-        # Calculate module size (we'll use a 29x29 QR code pattern)
-        module_size = size // 29
-        
-        # Generate QR code pattern
-        pattern = []
-        random.seed(42)  # Fixed seed for consistent pattern
-        for i in range(29):
-            row = []
-            for j in range(29):
-                # Create finder patterns (the three large squares in corners)
-                if (i < 7 and j < 7) or (i < 7 and j > 21) or (i > 21 and j < 7):
-                    # Outer border of finder pattern
-                    if i == 0 or i == 6 or j == 0 or j == 6 or i == 22 or i == 28 or j == 22 or j == 28:
-                        row.append(0)  # Black
-                    # Inner square of finder pattern
-                    elif i >= 2 and i <= 4 and j >= 2 and j <= 4:
-                        row.append(0)  # Black
-                    elif i >= 2 and i <= 4 and j >= 24 and j <= 26:
-                        row.append(0)  # Black
-                    elif i >= 24 and i <= 26 and j >= 2 and j <= 4:
-                        row.append(0)  # Black
-                    else:
-                        row.append(1)  # White
-                # Timing patterns (the lines connecting finder patterns)
-                elif i == 6 and j % 2 == 0:
-                    row.append(0)  # Black
-                elif j == 6 and i % 2 == 0:
-                    row.append(0)  # Black
-                # Alignment pattern (the smaller square not in a corner)
-                elif 22 <= i <= 26 and 22 <= j <= 26:
-                    if i == 22 or i == 26 or j == 22 or j == 26 or (i == 24 and j == 24):
-                        row.append(0)  # Black
-                    else:
-                        row.append(1)  # White
-                # Format information
-                elif (i < 9 and j == 8) or (i == 8 and j < 9):
-                    row.append(random.choice([0, 1]))
-                # Random data for the rest
-                else:
-                    row.append(random.choice([0, 1]))
-            pattern.append(row)
-        
-        # Draw the QR code pattern
-        for i in range(29):
-            for j in range(29):
-                if pattern[i][j] == 0:  # Black module
-                    draw.rectangle(
-                        [j * module_size, i * module_size, 
-                         (j + 1) * module_size - 1, (i + 1) * module_size - 1], 
-                        fill=0
-                    )
-        
-        return image
+        """Create a scannable QR code image for this session's payment URL"""
+        pattern = qr_encoder.encode(self.session_url)
+        
+        # Largest whole module size that still leaves a four-module quiet zone
+        module_size = size // (len(pattern) + 8)
+        return qr_image(pattern, module_size, dark=1, size=(size, size))
+    
+    def show_session_time(self, seconds):
+        minutes, seconds = divmod(seconds, 60)
+        self.expiry_label.config(text=f"Code valid for {minutes}:{seconds:02d}")
+    
+    def renew_session(self):
+        """Replace the expired session code with a new one and show its QR code"""
+        self.session_url = qr_encoder.new_payment_session_url()
+        print("Payment session expired, showing a new code")
+        from PIL import ImageTk
+        self.qr_photo = ImageTk.PhotoImage(self.create_qr_code(self.qr_size))
+        self.qr_canvas.itemconfig(self.qr_item, image=self.qr_photo)
+        self.session_countdown.start()
+    
+    def stop_countdowns(self):
+        self.session_countdown.cancel()
     
     def show_replace_instructions(self):
         """Show instructions for replacing the QR code"""
@@ -250,17 +267,23 @@ class QRCodeWindow:
         self.root.mainloop()
         
     def on_closing(self):
+        self.stop_countdowns()
         self.root.destroy()
         sys.exit()
 
 # RumbleVerse Game Mode Selection (Modified)
-# Initialize pygame at module level
-pygame.init()
 
 # Constants for RumbleVerse
 SCREEN_WIDTH = 1400
 SCREEN_HEIGHT = 800
 FPS = 60
+DIRTY_RECT_RENDERING = True  # Only push changed regions instead of flipping every frame
+IDLE_MODE = True  # Block on input instead of polling while nothing needs redrawing
+IDLE_FPS = 5
+IDLE_AFTER_SECONDS = 30
+SCOREBOARD = "widgets"  # "widgets" (Tk frames and labels), "canvas" (one Tk canvas, kept) or "pygame"
+IDLE_RETURN_SECONDS = 120  # Back to the menu from a game or payment screen nobody is using
+PAYMENT_SESSION_SECONDS = 300
 
 # Colors
 PURPLE_DARK = (45, 25, 85)
@@ -283,120 +306,120 @@ class GameModeCard:
         self.border_color = border_color if not is_selected else ORANGE
         self.is_selected = is_selected
         self.border_width = 4 if is_selected else 2
+        self.surface_cache = VariantSurfaceCache()
+        self.bounds = self.rect.copy()  # Card plus any overflowing text, for dirty rects
         # Generate QR code pattern for PaytoPlay card
         if title == "PaytoPlay":
             self.qr_pattern = self.generate_qr_pattern()
         
     def generate_qr_pattern(self):
-        """Generate a random QR code-like pattern"""
-        # Create a 15x15 grid for QR code pattern
-        pattern = []
-        random.seed(42)  # Fixed seed for consistent pattern
-        for i in range(15):
-            row = []
-            for j in range(15):
-                # Create QR code-like pattern with finder patterns in corners
-                if (i < 3 and j < 3) or (i < 3 and j > 11) or (i > 11 and j < 3):
-                    # Finder patterns (corner squares)
-                    if (i == 0 or i == 2 or j == 0 or j == 2):
-                        row.append(1)
-                    else:
-                        row.append(0)
-                elif i == 1 and j == 1:
-                    row.append(1)
-                elif i == 1 and j == 13:
-                    row.append(1)
-                elif i == 13 and j == 1:
-                    row.append(1)
-                else:
-                    # Random pattern for data area
-                    row.append(random.choice([0, 1]))
-            pattern.append(row)
-        return pattern
+        """Encode the payment page as a real QR code for the card preview"""
+        return qr_encoder.encode(qr_encoder.PAYMENT_URL).tolist()
         
     def draw_qr_code(self, screen, char_rect):
         """Draw QR code pattern"""
         if not hasattr(self, 'qr_pattern'):
             return
             
-        # Calculate cell size
+        # Calculate cell size, leaving room for the four-module quiet zone scanners need
+        modules = len(self.qr_pattern)
         qr_size = min(char_rect.width - 40, char_rect.height - 40)
-        cell_size = qr_size // 15
-        start_x = char_rect.centerx - (15 * cell_size) // 2
-        start_y = char_rect.centery - (15 * cell_size) // 2
+        cell_size = max(1, qr_size // (modules + 8))
+        quiet_zone = 4 * cell_size
+        start_x = char_rect.centerx - (modules * cell_size) // 2
+        start_y = char_rect.centery - (modules * cell_size) // 2
         
         # Draw white background
-        qr_bg_rect = pygame.Rect(start_x - 5, start_y - 5, 15 * cell_size + 10, 15 * cell_size + 10)
+        qr_bg_rect = pygame.Rect(start_x - quiet_zone, start_y - quiet_zone,
+                                 modules * cell_size + 2 * quiet_zone, modules * cell_size + 2 * quiet_zone)
         pygame.draw.rect(screen, WHITE, qr_bg_rect)
         
-        # Draw QR pattern
-        for i, row in enumerate(self.qr_pattern):
-            for j, cell in enumerate(row):
-                if cell == 1:
-                    cell_rect = pygame.Rect(
-                        start_x + j * cell_size,
-                        start_y + i * cell_size,
-                        cell_size,
-                        cell_size
-                    )
-                    pygame.draw.rect(screen, BLACK, cell_rect)
+        # Draw QR pattern (rasterised once per cell size, then a single blit)
+        screen.blit(qr_surface(self.qr_pattern, cell_size), (start_x, start_y))
         
     def draw(self, screen: pygame.Surface, font_large: pygame.font.Font, font_small: pygame.font.Font):
-        # Draw card background
-        pygame.draw.rect(screen, self.color, self.rect)
-        pygame.draw.rect(screen, self.border_color, self.rect, self.border_width)
+        # The card is composed once per look; selection only swaps which surface is blitted
+        key = (self.title, self.subtitle, self.rect.size, font_large.get_height(), font_small.get_height())
+        variant = (self.is_selected, self.border_color, self.border_width)
+        surface = self.surface_cache.get(key, variant, screen, self.rect.size,
+                                         lambda card: self.paint(card, font_large, font_small))
+        screen.blit(surface, self.rect)
+        
+        # Text wider than the card spills onto the background, so it can't live on the card surface
+        self.bounds = self.rect.copy()
+        for label_surface, label_rect in self.labels(self.rect, font_large, font_small):
+            if not self.rect.contains(label_rect):
+                screen.blit(label_surface, label_rect)
+                self.bounds.union_ip(label_rect)
+        
+    def labels(self, rect: pygame.Rect, font_large: pygame.font.Font, font_small: pygame.font.Font):
+        title_surface = text_cache.render(font_large, self.title, True, WHITE)
+        title_rect = title_surface.get_rect(center=(rect.centerx, rect.bottom - 80))
+        subtitle_surface = text_cache.render(font_small, self.subtitle, True, GRAY)
+        subtitle_rect = subtitle_surface.get_rect(center=(rect.centerx, rect.bottom - 50))
+        return [(title_surface, title_rect), (subtitle_surface, subtitle_rect)]
+        
+    def paint(self, surface: pygame.Surface, font_large: pygame.font.Font, font_small: pygame.font.Font):
+        rect = surface.get_rect()
         
-        # Draw title
-        title_surface = font_large.render(self.title, True, WHITE)
-        title_rect = title_surface.get_rect(center=(self.rect.centerx, self.rect.bottom - 80))
-        screen.blit(title_surface, title_rect)
+        # Draw card background
+        pygame.draw.rect(surface, self.color, rect)
+        pygame.draw.rect(surface, self.border_color, rect, self.border_width)
         
-        # Draw subtitle
-        subtitle_surface = font_small.render(self.subtitle, True, GRAY)
-        subtitle_rect = subtitle_surface.get_rect(center=(self.rect.centerx, self.rect.bottom - 50))
-        screen.blit(subtitle_surface, subtitle_rect)
+        # Draw title and subtitle
+        for label_surface, label_rect in self.labels(rect, font_large, font_small):
+            if rect.contains(label_rect):
+                surface.blit(label_surface, label_rect)
         
         # Draw character placeholder (simplified representation)
-        char_rect = pygame.Rect(self.rect.x + 20, self.rect.y + 20, self.rect.width - 40, self.rect.height - 120)
-        pygame.draw.rect(screen, PURPLE_DARK, char_rect)
+        char_rect = pygame.Rect(rect.x + 20, rect.y + 20, rect.width - 40, rect.height - 120)
+        pygame.draw.rect(surface, PURPLE_DARK, char_rect)
         
         # Add some visual elements to represent characters
         if self.title == "Ranked":
-            pygame.draw.circle(screen, WHITE, (char_rect.centerx, char_rect.centery - 20), 30)
-            pygame.draw.circle(screen, BLACK, (char_rect.centerx - 10, char_rect.centery - 30), 5)
-            pygame.draw.circle(screen, BLACK, (char_rect.centerx + 10, char_rect.centery - 30), 5)
+            pygame.draw.circle(surface, WHITE, (char_rect.centerx, char_rect.centery - 20), 30)
+            pygame.draw.circle(surface, BLACK, (char_rect.centerx - 10, char_rect.centery - 30), 5)
+            pygame.draw.circle(surface, BLACK, (char_rect.centerx + 10, char_rect.centery - 30), 5)
             # Add table soccer indicator for Ranked mode
-            pygame.draw.rect(screen, (34, 139, 34), (char_rect.centerx - 25, char_rect.centery + 10, 50, 20))
-            pygame.draw.circle(screen, WHITE, (char_rect.centerx, char_rect.centery + 20), 8)
+            pygame.draw.rect(surface, (34, 139, 34), (char_rect.centerx - 25, char_rect.centery + 10, 50, 20))
+            pygame.draw.circle(surface, WHITE, (char_rect.centerx, char_rect.centery + 20), 8)
         elif self.title == "Duo":
-            pygame.draw.circle(screen, WHITE, (char_rect.centerx - 25, char_rect.centery), 25)
-            pygame.draw.circle(screen, CYAN, (char_rect.centerx + 25, char_rect.centery), 25)
+            pygame.draw.circle(surface, WHITE, (char_rect.centerx - 25, char_rect.centery), 25)
+            pygame.draw.circle(surface, CYAN, (char_rect.centerx + 25, char_rect.centery), 25)
         elif self.title == "Trio":
-            pygame.draw.circle(screen, WHITE, (char_rect.centerx - 30, char_rect.centery - 10), 20)
-            pygame.draw.circle(screen, CYAN, (char_rect.centerx, char_rect.centery + 10), 20)
-            pygame.draw.circle(screen, ORANGE, (char_rect.centerx + 30, char_rect.centery - 10), 20)
+            pygame.draw.circle(surface, WHITE, (char_rect.centerx - 30, char_rect.centery - 10), 20)
+            pygame.draw.circle(surface, CYAN, (char_rect.centerx, char_rect.centery + 10), 20)
+            pygame.draw.circle(surface, ORANGE, (char_rect.centerx + 30, char_rect.centery - 10), 20)
         elif self.title == "Quad":
-            pygame.draw.circle(screen, WHITE, (char_rect.centerx - 25, char_rect.centery - 15), 18)
-            pygame.draw.circle(screen, CYAN, (char_rect.centerx + 25, char_rect.centery - 15), 18)
-            pygame.draw.circle(screen, ORANGE, (char_rect.centerx - 25, char_rect.centery + 15), 18)
-            pygame.draw.circle(screen, (255, 100, 255), (char_rect.centerx + 25, char_rect.centery + 15), 18)
+            pygame.draw.circle(surface, WHITE, (char_rect.centerx - 25, char_rect.centery - 15), 18)
+            pygame.draw.circle(surface, CYAN, (char_rect.centerx + 25, char_rect.centery - 15), 18)
+            pygame.draw.circle(surface, ORANGE, (char_rect.centerx - 25, char_rect.centery + 15), 18)
+            pygame.draw.circle(surface, (255, 100, 255), (char_rect.centerx + 25, char_rect.centery + 15), 18)
         elif self.title == "PaytoPlay":
             # Draw QR code
-            self.draw_qr_code(screen, char_rect)
+            self.draw_qr_code(surface, char_rect)
 
 class RumbleVerseUI:
     def __init__(self, main_app):
         self.main_app = main_app
-        # Create new display surface
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Draw into the application's persistent window when there is one
+        if main_app is not None:
+            self.screen = main_app.host.display()
+        else:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("RumbleVerse - Game Mode Selection")
         self.clock = pygame.time.Clock()
+        self.background_cache = BackgroundCache(self.paint_background)
+        self.renderer = DirtyRectRenderer(DIRTY_RECT_RENDERING)
+        self.scheduler = IdleScheduler(self.clock, FPS, IDLE_FPS, IDLE_AFTER_SECONDS, IDLE_MODE)
+        self.stats = FrameStats.from_environment()
+        self.overlay = FrameStatsOverlay(self.stats)
         
         # Fonts
-        self.font_title = pygame.font.Font(None, 72)
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 36)
-        self.font_small = pygame.font.Font(None, 24)
+        self.font_title = assets.font(72)
+        self.font_large = assets.font(48)
+        self.font_medium = assets.font(36)
+        self.font_small = assets.font(24)
         
         # Game mode cards
         card_width = 220
@@ -417,14 +440,16 @@ class RumbleVerseUI:
         
         self.selected_mode = 0
         
-    def draw_background(self):
+    def paint_background(self, surface: pygame.Surface, palette):
+        width, height = surface.get_size()
+        dark, light = palette
         # Create gradient background
-        for y in range(SCREEN_HEIGHT):
-            color_ratio = y / SCREEN_HEIGHT
-            r = int(PURPLE_DARK[0] + (PURPLE_LIGHT[0] - PURPLE_DARK[0]) * color_ratio)
-            g = int(PURPLE_DARK[1] + (PURPLE_LIGHT[1] - PURPLE_DARK[1]) * color_ratio)
-            b = int(PURPLE_DARK[2] + (PURPLE_LIGHT[2] - PURPLE_DARK[2]) * color_ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        for y in range(height):
+            color_ratio = y / height
+            r = int(dark[0] + (light[0] - dark[0]) * color_ratio)
+            g = int(dark[1] + (light[1] - dark[1]) * color_ratio)
+            b = int(dark[2] + (light[2] - dark[2]) * color_ratio)
+            pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
         
         # Draw some background elements (simplified city silhouette)
         for i in range(20):
@@ -432,14 +457,19 @@ class RumbleVerseUI:
             building_height = 100 + (i * 23) % 200
             building_width = 50 + (i * 17) % 30
             color_variation = 20 + (i * 13) % 40
-            building_color = (PURPLE_DARK[0] + color_variation, 
-                            PURPLE_DARK[1] + color_variation, 
-                            PURPLE_DARK[2] + color_variation)
-            pygame.draw.rect(self.screen, building_color, 
-                           (building_x, SCREEN_HEIGHT - building_height, building_width, building_height))
+            building_color = (dark[0] + color_variation, 
+                            dark[1] + color_variation, 
+                            dark[2] + color_variation)
+            pygame.draw.rect(surface, building_color, 
+                           (building_x, height - building_height, building_width, building_height))
+    
+    def draw_background(self):
+        # Static gradient and skyline are painted once and reused every frame
+        background = self.background_cache.get(self.screen, (PURPLE_DARK, PURPLE_LIGHT))
+        self.screen.blit(background, (0, 0))
     
     def draw_title(self):
-        title_surface = self.font_title.render("Game Modes", True, CYAN)
+        title_surface = text_cache.render(self.font_title, "Game Modes", True, CYAN)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         self.screen.blit(title_surface, title_rect)
         
@@ -448,7 +478,7 @@ class RumbleVerseUI:
         pygame.draw.line(self.screen, CYAN, (50, line_y), (SCREEN_WIDTH - 50, line_y), 2)
         
         # Add instruction text
-        instruction_surface = self.font_small.render("Click RANKED for Tablesoccer | Click PAYTOPAY to see QR Code", True, WHITE)
+        instruction_surface = text_cache.render(self.font_small, "Click RANKED for Tablesoccer | Click PAYTOPAY to see QR Code", True, WHITE)
         instruction_rect = instruction_surface.get_rect(center=(SCREEN_WIDTH // 2, 140))
         self.screen.blit(instruction_surface, instruction_rect)
     
@@ -468,35 +498,39 @@ class RumbleVerseUI:
             pygame.draw.rect(self.screen, WHITE, key_rect, 2)
             
             # Draw key text
-            key_surface = self.font_small.render(key, True, BLACK)
+            key_surface = text_cache.render(self.font_small, key, True, BLACK)
             key_text_rect = key_surface.get_rect(center=key_rect.center)
             self.screen.blit(key_surface, key_text_rect)
             
             # Draw action text
-            action_surface = self.font_small.render(action, True, WHITE)
+            action_surface = text_cache.render(self.font_small, action, True, WHITE)
             self.screen.blit(action_surface, (x_pos + 70, SCREEN_HEIGHT - 55))
             
             x_pos += 250
     
+    def select_mode(self, index):
+        # Deselect current
+        previous = self.game_modes[self.selected_mode]
+        previous.is_selected = False
+        previous.border_color = WHITE
+        previous.border_width = 2
+        self.renderer.mark(previous.bounds)
+        
+        # Select new
+        self.selected_mode = index
+        mode = self.game_modes[index]
+        mode.is_selected = True
+        mode.border_color = ORANGE
+        mode.border_width = 4
+        self.renderer.mark(mode.bounds)
+    
     def handle_input(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_LEFT and self.selected_mode > 0:
-                self.game_modes[self.selected_mode].is_selected = False
-                self.game_modes[self.selected_mode].border_color = WHITE
-                self.game_modes[self.selected_mode].border_width = 2
-                self.selected_mode -= 1
-                self.game_modes[self.selected_mode].is_selected = True
-                self.game_modes[self.selected_mode].border_color = ORANGE
-                self.game_modes[self.selected_mode].border_width = 4
+                self.select_mode(self.selected_mode - 1)
                 
             elif event.key == pygame.K_RIGHT and self.selected_mode < len(self.game_modes) - 1:
-                self.game_modes[self.selected_mode].is_selected = False
-                self.game_modes[self.selected_mode].border_color = WHITE
-                self.game_modes[self.selected_mode].border_width = 2
-                self.selected_mode += 1
-                self.game_modes[self.selected_mode].is_selected = True
-                self.game_modes[self.selected_mode].border_color = ORANGE
-                self.game_modes[self.selected_mode].border_width = 4
+                self.select_mode(self.selected_mode + 1)
                 
             elif event.key == pygame.K_RETURN:
                 selected_mode = self.game_modes[self.selected_mode].title
@@ -510,19 +544,10 @@ class RumbleVerseUI:
                     return False  # Exit pygame loop
                 
         elif event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
             for i, mode in enumerate(self.game_modes):
                 if mode.rect.collidepoint(mouse_pos):
-                    # Deselect current
-                    self.game_modes[self.selected_mode].is_selected = False
-                    self.game_modes[self.selected_mode].border_color = WHITE
-                    self.game_modes[self.selected_mode].border_width = 2
-                    
-                    # Select new
-                    self.selected_mode = i
-                    mode.is_selected = True
-                    mode.border_color = ORANGE
-                    mode.border_width = 4
+                    self.select_mode(i)
                     
                     # Handle specific mode actions
                     if mode.title == "Ranked":
@@ -536,47 +561,100 @@ class RumbleVerseUI:
                     break
         return True
     
-    def run(self):
-        running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        running = False
-                        pygame.quit()
-                        sys.exit()
-                    else:
-                        if not self.handle_input(event):
-                            return  # Exit to tablesoccer or QR code
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if not self.handle_input(event):
-                        return  # Exit to tablesoccer or QR code
-            
+    def render_frame(self):
+        if self.overlay.visible:
+            self.renderer.mark(self.overlay.rect)
+        if not self.renderer.has_changes:
+            return False
+        
+        if self.renderer.needs_full_redraw:
             # Draw everything
             self.draw_background()
             self.draw_title()
+            self.stats.lap("background")
             
             # Draw game mode cards
             for mode in self.game_modes:
                 mode.draw(self.screen, self.font_large, self.font_medium)
+            self.stats.lap("cards")
             
             self.draw_bottom_ui()
-            
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            self.stats.lap("bottom_ui")
+        else:
+            # Restore the background under each changed region, then redraw the cards on it
+            background = self.background_cache.get(self.screen, (PURPLE_DARK, PURPLE_LIGHT))
+            for rect in self.renderer.rects:
+                self.screen.blit(background, rect, rect)
+            self.stats.lap("background")
+            for mode in self.game_modes:
+                if mode.bounds.collidelist(self.renderer.rects) != -1:
+                    mode.draw(self.screen, self.font_large, self.font_medium)
+            self.stats.lap("cards")
+        
+        if self.overlay.visible:
+            self.overlay.draw(self.screen)
+            self.stats.skip()
+        self.renderer.present()
+        self.stats.lap("present")
+        return True
+    
+    def process(self, events):
+        """Handle one batch of events and draw a frame; False once the screen has handed over"""
+        self.stats.begin_frame()
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.quit()
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    self.quit()
+                elif event.key == OVERLAY_KEY:
+                    self.overlay.toggle()
+                    self.renderer.mark_all()
+                else:
+                    if not self.handle_input(event):
+                        return False  # Exit to tablesoccer or QR code
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if not self.handle_input(event):
+                    return False  # Exit to tablesoccer or QR code
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.renderer.mark_all()
+        
+        self.stats.lap("events")
+        self.stats.end_frame(self.render_frame())
+        return True
+    
+    def busy(self):
+        """Whether the next frame has something to draw"""
+        return self.renderer.has_changes or self.overlay.visible
+    
+    def run(self):
+        while self.process(self.scheduler.poll(self.busy())):
+            self.scheduler.tick()
+    
+    def quit(self):
+        exit_report(self.scheduler.report(), assets.report())
+        self.stats.close()
+        if self.main_app is not None:
+            # The host destroys the Tk root and its pending after() calls, then quits pygame
+            self.main_app.host.close()
+        else:
+            pygame.quit()
+            sys.exit()
 
 # Tablesoccer Scoreboard Application (Modified)
 class TableSoccerScoreboard:
-    def __init__(self, main_app):
+    def __init__(self, main_app, parent=None, now=time.monotonic):
         self.main_app = main_app
-        self.root = tk.Tk()
-        self.root.title("Tablesoccer Scoreboard")
-        self.root.geometry("1200x800")
-        self.root.configure(bg='#1e3a5f')
+        if parent is None:
+            # Standalone window; under the display host the screen is built into a page of its root
+            self.root = tk.Tk()
+            self.root.title("Tablesoccer Scoreboard")
+            self.root.geometry("1200x800")
+            self.root.configure(bg='#1e3a5f')
+            parent = self.root
+        else:
+            self.root = parent.winfo_toplevel()
+        self.parent = parent
         
         # Game state variables
         self.home_score = tk.IntVar(value=0)
@@ -592,13 +670,27 @@ class TableSoccerScoreboard:
         self.game_minutes = tk.IntVar(value=15)
         self.game_seconds = tk.IntVar(value=0)
         self.timer_running = False
-        self.timer_thread = None
+        
+        # The clock tick, the timeout and the shot clock are timers on the application's service;
+        # now only applies to a scoreboard of its own, which gets a service of its own
+        self.timers = main_app.timers if main_app is not None else TimerService(self.root, now=now)
+        # The time left is kept by the clock, on the service's time; game_minutes and game_seconds
+        # follow it in whole seconds
+        self.clock = GameClock(15, 0, now=self.timers.now, tenths_below=TENTHS_BELOW_SECONDS)
+        
+        # Writes to the variables and labels above go through this and reach Tk once per idle moment
+        self.updates = UpdateScheduler(self.root)
+        
+        self.tick_timer = None  # the one pending timer that ticks the running clock
+        self.timeout_team = None
+        self.timeout_countdown = Countdown(self.timers, TIMEOUT_SECONDS, self.show_timeout, self.timeout_over)
+        self.shot_clock = Countdown(self.timers, SHOT_CLOCK_SECONDS, self.show_shot_clock, self.shot_clock_expired)
         
         self.setup_ui()
         
     def setup_ui(self):
         # Create main container
-        main_frame = tk.Frame(self.root, bg='#1e3a5f')
+        main_frame = tk.Frame(self.parent, bg='#1e3a5f')
         main_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Header section
@@ -692,6 +784,9 @@ class TableSoccerScoreboard:
                 fg='white', bg='#4a6fa5', padx=15).pack(side='left')
         tk.Button(serve_frame, text="▶", font=('Arial', 12), bg='#666666', fg='white', 
                  bd=0, padx=10, command=lambda: self.change_serve('AWAY')).pack(side='left')
+        self.shot_clock_label = tk.Label(center_frame, text="", font=('Arial', 10, 'bold'), 
+                                       fg='white', bg='#4a6fa5')
+        self.shot_clock_label.pack()
         
         # Away team score section
         away_frame = tk.Frame(tablesoccer_frame, bg='#4a6fa5')
@@ -810,6 +905,9 @@ class TableSoccerScoreboard:
         whistle_canvas.create_oval(30, 30, 50, 50, fill='white')
         whistle_canvas.create_line(40, 25, 40, 15, fill='#4a6fa5', width=3)
         whistle_canvas.bind("<Button-1>", self.sound_whistle)
+        self.timeout_label = tk.Label(center_stats, text="", font=('Arial', 14, 'bold'), 
+                                    fg='#ffcc00', bg='#1e3a5f')
+        self.timeout_label.pack(pady=(5, 0))
         
         # Away team stats
         away_stats = tk.Frame(stats_frame, bg='#1e3a5f')
@@ -871,13 +969,14 @@ class TableSoccerScoreboard:
         
         minutes_frame = tk.Frame(time_frame, bg='#666666', relief='raised', bd=2)
         minutes_frame.pack(side='left', padx=(0, 5))
-        self.minutes_label = tk.Label(minutes_frame, textvariable=self.game_minutes, 
+        self.minutes_label = tk.Label(minutes_frame, text="15", 
                                     font=('Arial', 24, 'bold'), fg='white', bg='#666666', 
                                     padx=15, pady=10)
         self.minutes_label.pack()
         
-        tk.Label(time_frame, text=":", font=('Arial', 24, 'bold'), 
-                fg='white', bg='#4a6fa5').pack(side='left')
+        self.separator_label = tk.Label(time_frame, text=":", font=('Arial', 24, 'bold'), 
+                                       fg='white', bg='#4a6fa5')
+        self.separator_label.pack(side='left')
         
         seconds_frame = tk.Frame(time_frame, bg='#666666', relief='raised', bd=2)
         seconds_frame.pack(side='left', padx=(5, 0))
@@ -885,6 +984,9 @@ class TableSoccerScoreboard:
                                     font=('Arial', 24, 'bold'), fg='white', bg='#666666', 
                                     padx=15, pady=10)
         self.seconds_label.pack()
+        # Each label is only reconfigured when its own text changes; see update_clock_display
+        self.clock_labels = (self.minutes_label, self.separator_label, self.seconds_label)
+        self.clock_texts = ("15", ":", "00")
         
         # Reset button
         reset_canvas = tk.Canvas(clock_container, width=60, height=60, bg='white', highlightthickness=0)
@@ -917,48 +1019,85 @@ class TableSoccerScoreboard:
     # Game logic methods
     def change_score(self, team, delta):
         if team == 'HOME':
-            new_score = max(0, self.home_score.get() + delta)
-            self.home_score.set(new_score)
+            new_score = max(0, self.updates.get(self.home_score) + delta)
+            self.updates.set(self.home_score, new_score)
         else:
-            new_score = max(0, self.away_score.get() + delta)
-            self.away_score.set(new_score)
+            new_score = max(0, self.updates.get(self.away_score) + delta)
+            self.updates.set(self.away_score, new_score)
             
     def change_sets(self, team, delta):
         if team == 'HOME':
-            new_sets = max(0, self.home_sets.get() + delta)
-            self.home_sets.set(new_sets)
+            new_sets = max(0, self.updates.get(self.home_sets) + delta)
+            self.updates.set(self.home_sets, new_sets)
         else:
-            new_sets = max(0, self.away_sets.get() + delta)
-            self.away_sets.set(new_sets)
+            new_sets = max(0, self.updates.get(self.away_sets) + delta)
+            self.updates.set(self.away_sets, new_sets)
             
     def change_timeouts(self, team, delta):
         if team == 'HOME':
-            new_timeouts = max(0, min(3, self.home_timeouts.get() + delta))
-            self.home_timeouts.set(new_timeouts)
+            old_timeouts = self.updates.get(self.home_timeouts)
+            new_timeouts = max(0, min(3, old_timeouts + delta))
+            self.updates.set(self.home_timeouts, new_timeouts)
         else:
-            new_timeouts = max(0, min(3, self.away_timeouts.get() + delta))
-            self.away_timeouts.set(new_timeouts)
+            old_timeouts = self.updates.get(self.away_timeouts)
+            new_timeouts = max(0, min(3, old_timeouts + delta))
+            self.updates.set(self.away_timeouts, new_timeouts)
+        if new_timeouts < old_timeouts:
+            self.start_timeout(team)
+        elif new_timeouts > old_timeouts and team == self.timeout_team:
+            self.clear_timeout()  # Taken by mistake
             
+    def start_timeout(self, team):
+        # The game clock stands still for the length of the timeout
+        self.stop_timer()
+        self.timeout_team = team
+        self.timeout_countdown.start()
+        
+    def show_timeout(self, seconds):
+        self.updates.configure(self.timeout_label, text=f"{self.timeout_team} TIMEOUT {seconds}")
+        
+    def timeout_over(self):
+        print(f"{self.timeout_team} timeout over")
+        self.clear_timeout()
+        
+    def clear_timeout(self):
+        self.timeout_countdown.cancel()
+        self.timeout_team = None
+        self.updates.configure(self.timeout_label, text="")
+        
     def change_serve(self, team):
-        self.serve_side.set(team)
+        self.updates.set(self.serve_side, team)
         print(f"Ball possession changed to {team}")
+        self.shot_clock.start()
+        
+    def show_shot_clock(self, seconds):
+        self.updates.configure(self.shot_clock_label, text=f"SHOT CLOCK {seconds}")
+        
+    def shot_clock_expired(self):
+        print(f"Shot clock expired for {self.updates.get(self.serve_side)}")
+        
+    def stop_countdowns(self):
+        """Cancel the timeout and the shot clock, e.g. when leaving the screen"""
+        self.clear_timeout()
+        self.shot_clock.cancel()
+        self.updates.configure(self.shot_clock_label, text="")
         
     def next_set(self):
-        current = self.current_set.get()
+        current = self.updates.get(self.current_set)
         if current < 5:
-            self.current_set.set(current + 1)
+            self.updates.set(self.current_set, current + 1)
             self.update_set_label()
             
     def prev_set(self):
-        current = self.current_set.get()
+        current = self.updates.get(self.current_set)
         if current > 1:
-            self.current_set.set(current - 1)
+            self.updates.set(self.current_set, current - 1)
             self.update_set_label()
             
     def update_set_label(self):
-        set_num = self.current_set.get()
+        set_num = self.updates.get(self.current_set)
         ordinals = ["", "1st", "2nd", "3rd", "4th", "5th"]
-        self.set_label.config(text=f"{ordinals[set_num]} Game")
+        self.updates.configure(self.set_label, text=f"{ordinals[set_num]} Game")
         
     def sound_whistle(self, event):
         print("Whistle blown!")
@@ -971,36 +1110,49 @@ class TableSoccerScoreboard:
             self.start_timer()
             
     def start_timer(self):
-        if not self.timer_running:
+        if not self.timer_running and self.clock.start():
             self.timer_running = True
-            self.timer_thread = threading.Thread(target=self.run_timer)
-            self.timer_thread.daemon = True
-            self.timer_thread.start()
+            self.schedule_tick()
             
     def stop_timer(self):
         self.timer_running = False
-        
-    def run_timer(self):
-        while self.timer_running:
-            time.sleep(1)
-            if self.timer_running:
-                current_seconds = self.game_seconds.get()
-                current_minutes = self.game_minutes.get()
-                
-                if current_seconds > 0:
-                    self.game_seconds.set(current_seconds - 1)
-                elif current_minutes > 0:
-                    self.game_minutes.set(current_minutes - 1)
-                    self.game_seconds.set(59)
-                else:
-                    self.timer_running = False
-                    
-                # Update seconds display
-                self.root.after(0, self.update_seconds_display)
+        if self.clock.pause():
+            # The tick for a change just before the stop may still be waiting; show where it stopped
+            self.update_clock_display()
+        self.timers.cancel(self.tick_timer)
+        self.tick_timer = None
+        
+    def schedule_tick(self):
+        # Called on the Tk thread only; wakes up when the shown second changes, and never twice
+        self.timers.cancel(self.tick_timer)
+        self.tick_timer = None
+        delay = self.clock.next_refresh()
+        if delay is not None:
+            self.tick_timer = self.timers.call_later(delay, self.count_down)
                 
-    def update_seconds_display(self):
-        seconds = self.game_seconds.get()
-        self.seconds_label.config(text=f"{seconds:02d}")
+    def count_down(self):
+        """Show the time left on the clock, stopping the timer at zero"""
+        self.tick_timer = None
+        if self.clock.update():
+            self.timer_running = False
+        minutes, seconds = self.clock.display()
+        self.updates.set(self.game_minutes, minutes)
+        self.updates.set(self.game_seconds, seconds)
+        self.update_clock_display()
+        if self.timer_running:
+            self.schedule_tick()
+        
+    def update_clock_display(self):
+        """Redraw the clock labels whose text changed: minutes:seconds, or seconds.tenths at the end"""
+        minutes, seconds, tenths = self.clock.shown()
+        if tenths is None:
+            texts = (str(minutes), ":", f"{seconds:02d}")
+        else:
+            texts = (str(minutes * 60 + seconds), ".", str(tenths))
+        for label, text, shown in zip(self.clock_labels, texts, self.clock_texts):
+            if text != shown:
+                self.updates.configure(label, text=text)
+        self.clock_texts = texts
         
     def reset_timer(self, event):
         self.stop_timer()
@@ -1008,19 +1160,21 @@ class TableSoccerScoreboard:
         
     def set_timer(self, minutes, seconds):
         self.stop_timer()
-        self.game_minutes.set(minutes)
-        self.game_seconds.set(seconds)
-        self.update_seconds_display()
+        self.clock.set(minutes, seconds)
+        self.updates.set(self.game_minutes, minutes)
+        self.updates.set(self.game_seconds, seconds)
+        self.update_clock_display()
         
     def reset_game(self):
         self.stop_timer()
-        self.home_score.set(0)
-        self.away_score.set(0)
-        self.home_sets.set(0)
-        self.away_sets.set(0)
-        self.home_timeouts.set(2)
-        self.away_timeouts.set(2)
-        self.current_set.set(1)
+        self.stop_countdowns()
+        self.updates.set(self.home_score, 0)
+        self.updates.set(self.away_score, 0)
+        self.updates.set(self.home_sets, 0)
+        self.updates.set(self.away_sets, 0)
+        self.updates.set(self.home_timeouts, 2)
+        self.updates.set(self.away_timeouts, 2)
+        self.updates.set(self.current_set, 1)
         self.update_set_label()
         self.set_timer(15, 0)
         
@@ -1035,6 +1189,8 @@ class TableSoccerScoreboard:
         
     def on_closing(self):
         self.stop_timer()
+        self.stop_countdowns()
+        exit_report(self.updates.report(), self.timers.report())
         self.root.destroy()
         sys.exit()
 
@@ -1049,4 +1205,4 @@ if __name__ == "__main__":
     print("=====================================")
     
     app = GameApplication()
-    app.start_rumbleverse()
+    app.run()
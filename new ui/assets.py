@@ -0,0 +1,331 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+import pygame
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+# Process-wide font and image registry shared by the pygame menus
+
+PRELOAD_WORKERS = 2
+
+# Scaled images survive restarts here; ASSET_CACHE_DIR="" turns the disk cache off
+ASSET_CACHE_DIR = os.environ.get("ASSET_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "samball", "assets"))
+ASSET_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+
+class DiskImageCache:
+    """Scaled images stored as raw pixels, so a restart skips decoding and resampling.
+
+    Entries are keyed by source path, source mtime, target size and pixel
+    format, so replacing the source file or changing the resolution simply
+    misses. Each entry is written to a temporary file and renamed into place,
+    so a crash or a second process never reads half an entry. Past max_bytes
+    the least recently used entries are deleted. Safe to use from the preload
+    workers.
+    """
+
+    def __init__(self, directory: Optional[str] = ASSET_CACHE_DIR, max_bytes: int = ASSET_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def entry(self, source: str, size: Optional[Tuple[int, int]], pixel_format: str) -> Optional[str]:
+        """File for source scaled to size in pixel_format; None with the cache off or no source"""
+        if not self.directory:
+            return None
+        try:
+            mtime = os.stat(source).st_mtime_ns
+        except OSError:
+            return None
+        key = f"{os.path.abspath(source)}|{mtime}|{size}|{pixel_format}"
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest() + ".px")
+
+    def load(self, entry: str) -> Optional[Tuple[Tuple[int, int], bytes]]:
+        """(size, pixels) stored in entry, or None on a miss"""
+        try:
+            with open(entry, "rb") as f:
+                width, height, length = (int(field) for field in f.readline().split())
+                pixels = f.read()
+            if len(pixels) != length:
+                raise ValueError("truncated entry")
+            os.utime(entry)  # Mark as recently used for eviction
+        except (OSError, ValueError):
+            self._count("misses")
+            return None
+        self._count("hits")
+        return (width, height), pixels
+
+    def store(self, entry: str, size: Tuple[int, int], pixels: bytes):
+        temporary = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temporary = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+            with os.fdopen(fd, "wb") as f:
+                f.write(f"{size[0]} {size[1]} {len(pixels)}\n".encode())
+                f.write(pixels)
+            os.replace(temporary, entry)
+        except OSError as e:
+            print(f"Asset cache disabled, cannot write to {self.directory}: {e}")
+            self.directory = None
+            if temporary is not None and os.path.exists(temporary):
+                os.remove(temporary)
+            return
+        self._count("writes")
+        self._trim()
+
+    def _trim(self):
+        directory = self.directory
+        if not directory:
+            return
+        with self._lock:
+            entries = []
+            for item in os.scandir(directory):
+                if item.name.endswith(".px"):
+                    stat = item.stat()
+                    entries.append((stat.st_mtime, stat.st_size, item.path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass  # Already evicted by another process
+                total -= size
+                self.evictions += 1
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class AssetRegistry:
+    """Loads fonts and images once and hands out shared handles.
+
+    The menus are rebuilt every time the player comes back from a match, so
+    without this every re-entry reloads the same fonts and re-decodes and
+    re-scales the same images. Fonts are keyed by file and pixel size and
+    images by path and target size; callers pass already scaled sizes, so a
+    different scale factor simply gets its own entries. Handles are shared:
+    callers must not draw on a returned image.
+
+    Fonts stay valid as long as pygame.font is initialised, so screens that
+    hand over to Tk should close the window with pygame.display.quit() rather
+    than pygame.quit().
+
+    Images a screen is going to need can be preloaded: preload() and
+    preload_photo() decode and scale them on a small worker pool, and
+    collect(), called from the UI thread while it is idle, turns finished
+    work into display-format surfaces and Tk PhotoImages. image() and photo()
+    only block when an asset was never preloaded or is still in flight.
+    Workers never touch the display or Tk; everything they hand back is
+    finished on the UI thread.
+
+    Decoded and scaled images also go to a DiskImageCache, so after a
+    restart they are read back as raw pixels instead of being resampled.
+    """
+
+    def __init__(self):
+        self.fonts: Dict[Tuple, pygame.font.Font] = {}
+        self.images: Dict[Tuple, pygame.Surface] = {}
+        self.photos: Dict[Tuple, object] = {}
+        self.pending: Dict[Tuple, Future] = {}
+        self.load_ms: Dict[Tuple, float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.preloaded = 0
+        self.load_time_ms = 0.0
+        self.wait_ms = 0.0
+        self.disk = DiskImageCache()
+        self.photo_master = None  # Tk root for PhotoImages made in collect(); without it they are made in photo()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._watching_quit = False
+
+    def font(self, size: int, name: Optional[str] = None) -> pygame.font.Font:
+        if not self._watching_quit:
+            # pygame.quit() invalidates every Font; it also drops its quit callbacks, so register again each time
+            pygame.register_quit(self._forget_fonts)
+            self._watching_quit = True
+        if not pygame.font.get_init():
+            pygame.font.init()
+        key = ("font", name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            start = time.perf_counter()
+            font = pygame.font.Font(name, size)
+            self._loaded(key, start)
+            self.fonts[key] = font
+        else:
+            self.hits += 1
+        return font
+
+    def image(self, path: str, size: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+        """Load an image, scaled to size if given; load errors propagate and are not cached"""
+        key = ("image", path, tuple(size) if size else None)
+        finished = key in self.pending and self._finish(key, wait=True)
+        image = self.images.get(key)
+        if image is None:
+            start = time.perf_counter()
+            image = self._display_ready(_decode_image(path, key[2], self.disk)[0])
+            self._loaded(key, start)
+            self.images[key] = image
+        elif not finished:
+            self.hits += 1
+        return image
+
+    def photo(self, path: str, size: Tuple[int, int]):
+        """Tk PhotoImage of the image resized to size; call on the Tk thread once a root exists"""
+        key = ("photo", path, tuple(size))
+        finished = key in self.pending and self._finish(key, wait=True)
+        photo = self.photos.get(key)
+        if photo is None:
+            start = time.perf_counter()
+            photo = self._make_photo(_decode_photo(path, key[2], self.disk)[0])
+            self._loaded(key, start)
+            self.photos[key] = photo
+        elif hasattr(photo, "resize"):
+            # Decoded by a worker before Tk was up; wrap it now
+            photo = self.photos[key] = self._make_photo(photo)
+        elif not finished:
+            self.hits += 1
+        return photo
+
+    def preload(self, path: str, size: Optional[Tuple[int, int]] = None):
+        """Start decoding and scaling an image for image() on a worker thread"""
+        key = ("image", path, tuple(size) if size else None)
+        if key not in self.images and key not in self.pending:
+            self.pending[key] = self.submit(_decode_image, path, key[2], self.disk)
+
+    def preload_photo(self, path: str, size: Tuple[int, int]):
+        """Start decoding and resampling an image for photo() on a worker thread"""
+        key = ("photo", path, tuple(size))
+        if key not in self.photos and key not in self.pending:
+            self.pending[key] = self.submit(_decode_photo, path, key[2], self.disk)
+
+    def submit(self, work: Callable, *args) -> Future:
+        """Run work(*args) on the preload pool; it must not touch the display or Tk"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(PRELOAD_WORKERS, thread_name_prefix="preload")
+        return self._pool.submit(work, *args)
+
+    def collect(self) -> int:
+        """Finish every completed preload on the calling (UI) thread; never blocks"""
+        done = [key for key, future in self.pending.items() if future.done()]
+        for key in done:
+            self._finish(key, wait=False)
+        return len(done)
+
+    def shutdown(self):
+        """Drop queued preloads; call when the application exits"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        self.pending.clear()
+
+    def _finish(self, key: Tuple, wait: bool) -> bool:
+        future = self.pending.pop(key)
+        start = time.perf_counter()
+        try:
+            result, decode_ms = future.result()
+        except Exception as e:
+            # Left to the blocking path, which raises the error to the screen that needs the asset
+            print(f"Preloading {key[1]} failed: {e}")
+            return False
+        if wait:
+            self.wait_ms += (time.perf_counter() - start) * 1000.0
+        if key[0] == "image":
+            self.images[key] = self._display_ready(result)
+        else:
+            self.photos[key] = self._make_photo(result) if self.photo_master is not None else result
+        self.load_ms[key] = decode_ms
+        self.load_time_ms += decode_ms
+        self.preloaded += 1
+        return True
+
+    def _make_photo(self, image):
+        from PIL import ImageTk
+        return ImageTk.PhotoImage(image, master=self.photo_master)
+
+    @staticmethod
+    def _display_ready(surface: pygame.Surface) -> pygame.Surface:
+        # Converting needs the display; without one the surface is kept in its file format
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            return surface.convert_alpha()
+        return surface
+
+    def _forget_fonts(self):
+        self.fonts.clear()
+        self._watching_quit = False
+
+    def _loaded(self, key: Tuple, start: float):
+        self.load_ms[key] = (time.perf_counter() - start) * 1000.0
+        self.load_time_ms += self.load_ms[key]
+        self.misses += 1
+
+    def checkpoint(self) -> Tuple[int, int, float, int, float]:
+        """Counters to pass to report() to cover only what happened after this call"""
+        return self.hits, self.misses, self.load_time_ms, self.preloaded, self.wait_ms
+
+    def report(self, since: Tuple[int, int, float, int, float] = (0, 0, 0.0, 0, 0.0)) -> str:
+        hits, misses, load_ms, preloaded, wait_ms = (now - before for now, before in zip(self.checkpoint(), since))
+        return (f"Assets: {misses} loaded in {load_ms:.1f} ms, {preloaded} preloaded "
+                f"({wait_ms:.1f} ms waited), {hits} reused "
+                f"({len(self.fonts)} fonts, {len(self.images)} images, {len(self.photos)} photos cached, "
+                f"{self.disk.hits} read from disk)")
+
+    def slowest(self, count: int = 5):
+        """The assets that took longest to load, as (key, ms) pairs"""
+        return sorted(self.load_ms.items(), key=lambda item: item[1], reverse=True)[:count]
+
+
+def _decode_image(path: str, size: Optional[Tuple[int, int]], disk: DiskImageCache):
+    """Worker side of image(): the scaled surface and how long it took"""
+    start = time.perf_counter()
+    entry = disk.entry(path, size, "RGBA")
+    cached = disk.load(entry) if entry else None
+    if cached:
+        image = pygame.image.frombytes(cached[1], cached[0], "RGBA")
+    else:
+        image = pygame.image.load(path)
+        if size:
+            image = pygame.transform.scale(image, size)
+        if entry:
+            disk.store(entry, image.get_size(), pygame.image.tobytes(image, "RGBA"))
+    return image, (time.perf_counter() - start) * 1000.0
+
+
+def _decode_photo(path: str, size: Tuple[int, int], disk: DiskImageCache):
+    """Worker side of photo(): the resampled PIL image and how long it took"""
+    from PIL import Image
+    start = time.perf_counter()
+    entry = disk.entry(path, size, "PIL RGBA")
+    cached = disk.load(entry) if entry else None
+    if cached:
+        image = Image.frombytes("RGBA", cached[0], cached[1])
+    else:
+        with Image.open(path) as image:
+            image = image.convert("RGBA").resize(size, Image.Resampling.LANCZOS)
+        if entry:
+            disk.store(entry, image.size, image.tobytes())
+    return image, (time.perf_counter() - start) * 1000.0
+
+
+# Shared by every screen in the process
+assets = AssetRegistry()
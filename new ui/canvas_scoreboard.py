@@ -0,0 +1,305 @@
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from lazy_module import LazyModule
+from match_state import TEAMS, MatchState
+from timer_service import TimerService
+
+# Tablesoccer scoreboard drawn on one Tk canvas instead of a tree of Frames and Labels
+
+tk = LazyModule("tkinter")
+
+BACKGROUND = '#1e3a5f'
+PANEL = '#4a6fa5'
+MINUS = '#8b4a6b'
+NEUTRAL = '#666666'
+CAPTION = '#cccccc'
+PITCH = '#228B22'
+HIGHLIGHT = '#ffa500'
+
+BUTTON_TAG = "button"
+ACTION_PREFIX = "action:"
+
+
+class CanvasScoreboard:
+    """The tablesoccer scoreboard as items on a single tk.Canvas.
+
+    Every label, value and button is a canvas item created once in
+    setup_ui(). Changes to the MatchState are applied with itemconfig on the
+    items that show the changed fields, so an update never creates widgets or
+    runs Tk geometry management. Buttons are a rectangle and a text sharing an
+    "action:<name>" tag; one binding on the "button" tag dispatches clicks by
+    that tag.
+
+    While the clock runs, the application's TimerService wakes the screen on
+    the Tk thread when the shown time changes; the timeout and the shot clock
+    of the MatchState count down on the same service.
+    """
+
+    def __init__(self, main_app, parent=None, state: Optional[MatchState] = None,
+                 size: Optional[Tuple[int, int]] = None, sport: str = "TABLESOCCER",
+                 teams: Tuple[str, str] = ("BULLDOGS", "FALCONS"), now: Callable[[], float] = time.monotonic):
+        self.main_app = main_app
+        if parent is None:
+            # Standalone window; under the display host the screen is built into a page of its root
+            self.root = tk.Tk()
+            self.root.title("Tablesoccer Scoreboard")
+            self.root.geometry("1200x800")
+            parent = self.root
+        else:
+            self.root = parent.winfo_toplevel()
+        self.parent = parent
+        # One after() for all the application's timers; a standalone window has its own service
+        self.timers = main_app.timers if main_app is not None else TimerService(self.root, now=now)
+        self.state = state or MatchState(timers=self.timers)
+        self.state.on_change = self.refresh
+        self.sport = sport
+        self.teams = teams
+        width, height = size or (1200, 800)
+        self.unit = min(width / 1200, height / 800)
+        self.left = (width / self.unit - 1200) / 2
+
+        self.actions: Dict[str, Callable[[], None]] = {}
+        # Field of the MatchState -> (item, function giving its text)
+        self.bindings: Dict[str, List[Tuple[int, Callable[[], str]]]] = {}
+        self.shown: Dict[int, str] = {}
+        self.tick_id = None
+
+        self.canvas = tk.Canvas(parent, width=width, height=height, bg=BACKGROUND, highlightthickness=0)
+        self.canvas.pack(fill='both', expand=True)
+        self.setup_ui()
+        self.canvas.tag_bind(BUTTON_TAG, "<Button-1>", self.on_press)
+        self.refresh()
+
+    # Layout helpers, in the coordinates of a 1200x800 design
+    def xy(self, *coordinates) -> List[float]:
+        u = self.unit
+        return [(value + self.left) * u if i % 2 == 0 else value * u for i, value in enumerate(coordinates)]
+
+    def font(self, size: int, bold: bool = True):
+        return ('Arial', max(6, round(size * self.unit)), 'bold') if bold else ('Arial', max(6, round(size * self.unit)))
+
+    def text(self, x, y, text, size, color='white', bold=True, anchor='center', tags=()) -> int:
+        return self.canvas.create_text(*self.xy(x, y), text=text, font=self.font(size, bold), fill=color,
+                                       anchor=anchor, tags=tags)
+
+    def box(self, x, y, w, h, fill, outline='', width=0, tags=()) -> int:
+        return self.canvas.create_rectangle(*self.xy(x, y, x + w, y + h), fill=fill, outline=outline,
+                                            width=width, tags=tags)
+
+    def button(self, name, x, y, w, h, text, action, fill=PANEL, color='white', size=16) -> int:
+        """A rectangle and its label, both tagged for hit-testing; returns the rectangle"""
+        tags = (BUTTON_TAG, ACTION_PREFIX + name)
+        self.actions[name] = action
+        rect = self.box(x, y, w, h, fill, tags=tags)
+        self.text(x + w / 2, y + h / 2, text, size, color, tags=tags)
+        return rect
+
+    def bind_text(self, item: int, field: str, text: Callable[[], str]):
+        """Keep item showing text(), updated whenever field changes"""
+        self.bindings.setdefault(field, []).append((item, text))
+
+    def setup_ui(self):
+        state = self.state
+        self.create_header()
+        self.create_tablesoccer_section(state)
+        self.create_control_section(state)
+        self.create_sets_timeouts_section(state)
+        self.create_game_clock_section(state)
+
+    def create_header(self):
+        self.button("back", 20, 20, 240, 40, "← Back to Game Modes", self.back_to_rumbleverse, size=12)
+        self.text(290, 40, self.teams[0], 18, anchor='w')
+        self.button("reset", 1130, 20, 50, 40, "↻", self.reset_game, size=16)
+        self.text(1100, 40, self.teams[1], 18, anchor='e')
+
+    def create_tablesoccer_section(self, state):
+        self.box(20, 80, 1160, 240, PANEL, outline='white', width=2)
+        for team, x in zip(TEAMS, (220, 980)):
+            score = self.text(x, 175, "", 72)
+            self.bind_text(score, "score", lambda team=team: str(state.scores[team]))
+            self.text(x, 270, f"{team} TEAM", 12, CAPTION, bold=False)
+
+        # The table
+        canvas, xy = self.canvas, self.xy
+        canvas.create_rectangle(*xy(560, 110, 640, 170), fill=PITCH, outline='white', width=3)
+        canvas.create_line(*xy(600, 110, 600, 170), fill='white', width=2)
+        canvas.create_rectangle(*xy(555, 130, 560, 150), fill='white', outline='white')
+        canvas.create_rectangle(*xy(640, 130, 645, 150), fill='white', outline='white')
+        canvas.create_oval(*xy(595, 135, 605, 145), fill='white', outline='black')
+        self.text(600, 190, self.sport, 10)
+        self.text(600, 220, "V/S", 16)
+
+        self.possession = {
+            "HOME": self.button("possession_home", 480, 255, 50, 36, "◀",
+                                lambda: state.change_possession("HOME"), NEUTRAL, size=12),
+            "AWAY": self.button("possession_away", 670, 255, 50, 36, "▶",
+                                lambda: state.change_possession("AWAY"), NEUTRAL, size=12),
+        }
+        self.text(600, 273, "POSSESSION", 10)
+        shot_clock = self.text(600, 305, "", 10, HIGHLIGHT)
+        self.bind_text(shot_clock, "shot_clock", lambda: state.shot_clock_text)
+
+    def create_control_section(self, state):
+        for team, x, signs in (("HOME", 40, (1, -1)), ("AWAY", 960, (-1, 1))):
+            self.text(x + 95, 345, "GOALS", 10, CAPTION, bold=False)
+            for i, delta in enumerate(signs):
+                self.button(f"score_{team.lower()}_{i}", x + i * 100, 360, 90, 56, f"{delta:+d}",
+                            lambda team=team, delta=delta: state.change_score(team, delta),
+                            PANEL if delta > 0 else MINUS)
+
+        self.box(450, 345, 300, 80, PANEL, outline='white', width=2)
+        self.button("prev_game", 470, 367, 40, 36, "◀", state.prev_game, 'white', PANEL, 12)
+        game = self.text(600, 385, "", 16)
+        self.bind_text(game, "game", lambda: state.game_label)
+        self.button("next_game", 690, 367, 40, 36, "▶", state.next_game, 'white', PANEL, 12)
+
+    def create_sets_timeouts_section(self, state):
+        timeout = self.text(600, 448, "", 12, HIGHLIGHT)
+        self.bind_text(timeout, "timeout", lambda: state.timeout_text)
+        for team, x in (("HOME", 40), ("AWAY", 830)):
+            for caption, field, values, change, dx in (("GAMES WON", "sets", state.sets, state.change_sets, 0),
+                                                       ("TIME OUTS", "timeouts", state.timeouts,
+                                                        state.change_timeouts, 170)):
+                self.text(x + dx + 80, 455, caption, 10, CAPTION, bold=False)
+                self.box(x + dx, 470, 160, 70, PANEL, outline='white', width=2)
+                self.button(f"{field}_{team.lower()}_minus", x + dx + 10, 490, 32, 30, "−",
+                            lambda team=team, change=change: change(team, -1), 'white', PANEL, 12)
+                value = self.text(x + dx + 80, 505, "", 24)
+                self.bind_text(value, field, lambda team=team, values=values: str(values[team]))
+                self.button(f"{field}_{team.lower()}_plus", x + dx + 118, 490, 32, 30, "+",
+                            lambda team=team, change=change: change(team, 1), 'white', PANEL, 12)
+
+        # Whistle
+        tags = (BUTTON_TAG, ACTION_PREFIX + "whistle")
+        self.actions["whistle"] = self.sound_whistle
+        canvas, xy = self.canvas, self.xy
+        canvas.create_rectangle(*xy(560, 465, 640, 545), fill='white', outline='', tags=tags)
+        canvas.create_oval(*xy(570, 475, 630, 535), fill='white', outline=PANEL, width=2, tags=tags)
+        canvas.create_oval(*xy(585, 490, 615, 520), fill=PANEL, outline='', tags=tags)
+        canvas.create_oval(*xy(590, 495, 610, 515), fill='white', outline='', tags=tags)
+        canvas.create_line(*xy(600, 490, 600, 480), fill=PANEL, width=3, tags=tags)
+
+    def create_game_clock_section(self, state):
+        self.box(20, 580, 1160, 120, PANEL, outline='white', width=2)
+        canvas, xy = self.canvas, self.xy
+
+        # Play/pause, one button with both icons; refresh() shows the right one
+        tags = (BUTTON_TAG, ACTION_PREFIX + "toggle_clock")
+        self.actions["toggle_clock"] = self.toggle_timer
+        canvas.create_rectangle(*xy(240, 610, 300, 670), fill='white', outline='', tags=tags)
+        canvas.create_oval(*xy(245, 615, 295, 665), fill='white', outline=PANEL, width=2, tags=tags)
+        self.play_icon = canvas.create_polygon(*xy(262, 628, 262, 652, 282, 640), fill=PANEL, tags=tags)
+        self.pause_icon = [canvas.create_rectangle(*xy(x, 628, x + 7, 652), fill=PANEL, outline='', tags=tags)
+                           for x in (260, 273)]
+
+        self.text(390, 640, "GAME CLOCK", 12)
+        self.box(470, 610, 90, 60, NEUTRAL, outline='white', width=2)
+        minutes = self.text(515, 640, "", 24)
+        self.bind_text(minutes, "time", lambda: state.clock_parts[0])
+        separator = self.text(575, 640, "", 24)
+        self.bind_text(separator, "time", lambda: state.clock_parts[1])
+        self.box(590, 610, 90, 60, NEUTRAL, outline='white', width=2)
+        seconds = self.text(635, 640, "", 24)
+        self.bind_text(seconds, "time", lambda: state.clock_parts[2])
+
+        tags = (BUTTON_TAG, ACTION_PREFIX + "reset_clock")
+        self.actions["reset_clock"] = state.reset_clock
+        canvas.create_rectangle(*xy(710, 610, 770, 670), fill='white', outline='', tags=tags)
+        canvas.create_oval(*xy(715, 615, 765, 665), fill='white', outline=PANEL, width=2, tags=tags)
+        canvas.create_arc(*xy(725, 625, 755, 655), start=45, extent=270, style='arc', outline=PANEL, width=3,
+                          tags=tags)
+        canvas.create_polygon(*xy(752, 628, 758, 634, 752, 640), fill=PANEL, tags=tags)
+
+        for name, x, minutes in (("preset_1", 810, 1), ("preset_15", 890, 15)):
+            self.button(name, x, 610, 70, 60, "", lambda minutes=minutes: state.set_clock(minutes, 0), NEUTRAL)
+            tags = (BUTTON_TAG, ACTION_PREFIX + name)
+            self.text(x + 35, 632, str(minutes), 16, tags=tags)
+            self.text(x + 35, 655, "min", 8, bold=False, tags=tags)
+
+    # Input
+    def on_press(self, event):
+        """Dispatch a click on any button by its action tag"""
+        for tag in self.canvas.gettags("current"):
+            if tag.startswith(ACTION_PREFIX):
+                self.actions[tag[len(ACTION_PREFIX):]]()
+                self.refresh()
+                return
+
+    # Drawing
+    def refresh(self):
+        """Apply the fields changed since the last refresh to their items"""
+        changes = self.state.take_changes()
+        canvas = self.canvas
+        for field in changes:
+            for item, text in self.bindings.get(field, ()):
+                value = text()
+                if self.shown.get(item) != value:
+                    canvas.itemconfig(item, text=value)
+                    self.shown[item] = value
+        if "possession" in changes:
+            for team, rect in self.possession.items():
+                canvas.itemconfig(rect, fill=HIGHLIGHT if team == self.state.possession else NEUTRAL)
+        if "clock" in changes:
+            running = self.state.clock_running
+            canvas.itemconfig(self.play_icon, state='hidden' if running else 'normal')
+            for item in self.pause_icon:
+                canvas.itemconfig(item, state='normal' if running else 'hidden')
+            self.schedule_tick()
+
+    # Clock
+    def schedule_tick(self):
+        """Wake up when the shown time changes next, while the clock runs"""
+        self.timers.cancel(self.tick_id)
+        self.tick_id = None
+        delay = self.state.clock_refresh()
+        if delay is not None:
+            self.tick_id = self.timers.call_later(delay, self.tick)
+
+    def tick(self):
+        self.tick_id = None
+        self.state.update_clock()
+        self.refresh()
+        if self.tick_id is None:
+            self.schedule_tick()
+
+    def toggle_timer(self):
+        self.state.toggle_clock()
+
+    def stop_timer(self):
+        self.state.stop_clock()
+        self.refresh()
+
+    def stop_countdowns(self):
+        self.state.stop_countdowns()
+        self.refresh()
+
+    # Actions
+    def sound_whistle(self):
+        print("Whistle blown!")
+
+    def reset_game(self):
+        self.state.reset()
+        self.refresh()
+
+    def reset(self):
+        """Called when the kept screen is shown again: a new match"""
+        self.reset_game()
+
+    def back_to_rumbleverse(self):
+        print("Back button clicked - returning to game modes...")
+        self.stop_timer()
+        self.stop_countdowns()
+        self.main_app.back_to_rumbleverse()
+
+    def run(self):
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.root.mainloop()
+
+    def on_closing(self):
+        self.stop_timer()
+        self.stop_countdowns()
+        self.root.destroy()
+
+
+if __name__ == "__main__":
+    CanvasScoreboard(None).run()
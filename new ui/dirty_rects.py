@@ -0,0 +1,51 @@
+import pygame
+
+# Dirty-rectangle presentation for the pygame menus
+
+
+class DirtyRectRenderer:
+    """Tracks which parts of the screen changed since the last present().
+
+    Screens mark the rects they touched (for example the old and new card on a
+    selection change) and present() pushes only those rects to the display
+    with pygame.display.update(). Frames with nothing marked are skipped
+    entirely, and mark_all() falls back to a full flip for the first frame,
+    window exposes and anything else that invalidates the whole screen.
+    With enabled=False every frame is a full redraw, like the old loops.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.full_redraw = True
+        self.rects = []
+        self.frames_flipped = 0
+        self.frames_updated = 0
+        self.frames_skipped = 0
+
+    def mark(self, rect):
+        if not self.full_redraw:
+            self.rects.append(pygame.Rect(rect))
+
+    def mark_all(self):
+        self.full_redraw = True
+        self.rects = []
+
+    @property
+    def has_changes(self) -> bool:
+        return not self.enabled or self.full_redraw or bool(self.rects)
+
+    @property
+    def needs_full_redraw(self) -> bool:
+        return not self.enabled or self.full_redraw
+
+    def present(self):
+        if self.needs_full_redraw:
+            pygame.display.flip()
+            self.frames_flipped += 1
+        elif self.rects:
+            pygame.display.update(self.rects)
+            self.frames_updated += 1
+        else:
+            self.frames_skipped += 1
+        self.full_redraw = False
+        self.rects = []
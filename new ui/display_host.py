@@ -0,0 +1,214 @@
+import os
+import sys
+import time
+import pygame
+from typing import Callable, Dict, List, Optional, Tuple
+from exit_report import exit_report
+from lazy_module import LazyModule
+
+# One persistent window for the whole application; screens are swapped inside it
+
+# tkinter is imported when the host creates its root, not when an entry point imports this module
+tk = LazyModule("tkinter")
+
+PYGAME_PAGE = "pygame"
+
+# Tk keysyms that differ from pygame key names
+TK_KEY_NAMES = {"Return": "return", "KP_Enter": "enter", "Escape": "escape", "BackSpace": "backspace"}
+
+
+class DisplayHost:
+    """Keeps a single Tk root and a single pygame display alive for the process.
+
+    Tk screens are built into page frames of the persistent root instead of
+    their own tk.Tk(), and the pygame menu draws into an embedded page
+    (SDL_WINDOWID), so navigating never quits pygame or destroys the root.
+    root.mainloop() runs exactly once; the pygame screen is stepped from
+    root.after and its input arrives through Tk bindings, which are posted to
+    the pygame event queue.
+
+    Where SDL cannot draw into a foreign window (Wayland, the dummy driver)
+    the pygame window is opened once next to the Tk root and the two are
+    hidden and shown instead of torn down.
+
+    A pygame screen needs process(events) -> bool, returning False once it has
+    handed over to another page, busy() -> bool, and an IdleScheduler as
+    .scheduler. The screen is stepped at its frame rate only while busy;
+    otherwise the pump is not rescheduled until input, an expose or wake().
+    A Tk screen shown with keep=True is built once and gets reset() on later
+    visits.
+
+    Every transition is timed from the navigation call until the new screen
+    has been drawn.
+    """
+
+    def __init__(self, width: int, height: int, title: str = "", background: str = '#1e3a5f', embed: bool = True):
+        self.size = (width, height)
+        self.background = background
+        self.embed = embed
+        self.root = tk.Tk()
+        self.root.title(title)
+        self.root.geometry(f"{width}x{height}")
+        self.root.configure(bg=background)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.pages: Dict[str, tk.Frame] = {}
+        self.current: Optional[str] = None
+        self.pygame_screen = None
+        self.kept: Dict[str, object] = {}
+        self.pygame_name = PYGAME_PAGE
+        self.screen: Optional[pygame.Surface] = None
+        self.embedded = False
+        self.transitions: List[Tuple[str, str, float]] = []
+        self._transition: Optional[Tuple[str, str, float]] = None
+        self._pump_id = None
+
+    def page(self, name: str) -> "tk.Frame":
+        frame = self.pages.get(name)
+        if frame is None:
+            frame = tk.Frame(self.root, bg=self.background)
+            frame.place(x=0, y=0, relwidth=1, relheight=1)
+            self.pages[name] = frame
+        return frame
+
+    def display(self) -> pygame.Surface:
+        """The pygame display surface, created on first use and kept for the process"""
+        if self.screen is None:
+            frame = self.page(PYGAME_PAGE)
+            if self.embed:
+                # The frame needs a mapped native window before SDL can draw into it
+                frame.tkraise()
+                self.root.update()
+                os.environ["SDL_WINDOWID"] = str(frame.winfo_id())
+                try:
+                    self.screen = pygame.display.set_mode(self.size)
+                    self.embedded = True
+                except pygame.error as e:
+                    print(f"Cannot embed pygame in the Tk window ({e}), using a separate window")
+                    del os.environ["SDL_WINDOWID"]
+            if self.screen is None:
+                self.screen = pygame.display.set_mode(self.size)
+            if self.embedded:
+                frame.bind("<Button-1>", self._forward_click)
+                frame.bind("<Expose>", lambda e: self._post(pygame.event.Event(pygame.WINDOWEXPOSED)))
+                self.root.bind("<KeyPress>", self._forward_key)
+        return self.screen
+
+    def show(self, name: str, build: Callable[["tk.Frame"], object], keep: bool = False):
+        """Swap to a Tk screen; build(frame) creates it inside a freshly emptied page.
+
+        With keep the screen built on the first visit is shown again instead.
+        """
+        self._begin(name)
+        self._cancel_pump()
+        frame = self.page(name)
+        screen = self.kept.get(name) if keep else None
+        if screen is None:
+            for widget in frame.winfo_children():
+                widget.destroy()
+            screen = build(frame)
+            if keep:
+                self.kept[name] = screen
+        elif hasattr(screen, "reset"):
+            screen.reset()
+
+        if self.screen is not None and not self.embedded:
+            pygame.display.iconify()
+            self.root.deiconify()
+        frame.tkraise()
+        self.current = name
+        self.root.update_idletasks()
+        self._finish()
+        return screen
+
+    def show_pygame(self, screen, name: str = PYGAME_PAGE):
+        """Swap to the pygame screen; it is redrawn in full on its first frame"""
+        self._begin(name)
+        self.pygame_name = name
+        self.display()
+        self.pygame_screen = screen
+        if self.embedded:
+            self.page(PYGAME_PAGE).tkraise()
+        else:
+            self.root.withdraw()
+            if self.current is not None:
+                # set_mode() on the existing window brings it back from iconify()
+                self.screen = pygame.display.set_mode(self.size)
+        self.current = PYGAME_PAGE
+        self._post(pygame.event.Event(pygame.WINDOWEXPOSED))
+
+    def run(self):
+        """The one and only event loop"""
+        self.root.mainloop()
+
+    def close(self):
+        self._cancel_pump()
+        exit_report(self.report())
+        self.root.destroy()
+        pygame.quit()
+        sys.exit()
+
+    def _pump(self):
+        self._pump_id = None
+        if self.current != PYGAME_PAGE:
+            return
+        started = time.perf_counter()
+        scheduler = self.pygame_screen.scheduler
+        if not self.pygame_screen.process(scheduler.poll(True)):
+            return  # The screen navigated to a Tk page
+        scheduler.tick(sleep=False)
+        if self._transition:
+            self._finish()
+
+        delay = scheduler.next_delay(self.pygame_screen.busy())
+        if delay is not None:
+            spent_ms = int((time.perf_counter() - started) * 1000)
+            self._schedule_pump(max(1, int(delay * 1000) - spent_ms))
+
+    def wake(self):
+        """Step the pygame screen soon, e.g. after a timer changed what it shows"""
+        if self.current == PYGAME_PAGE and self._pump_id is None:
+            self._schedule_pump()
+
+    def _schedule_pump(self, delay_ms: int = 0):
+        self._cancel_pump()
+        self._pump_id = self.root.after(delay_ms, self._pump)
+
+    def _cancel_pump(self):
+        if self._pump_id is not None:
+            self.root.after_cancel(self._pump_id)
+            self._pump_id = None
+
+    def _post(self, event: pygame.event.Event):
+        """Queue a pygame event and step the pygame screen straight away"""
+        if self.current == PYGAME_PAGE:
+            pygame.event.post(event)
+            self._schedule_pump()
+
+    def _forward_key(self, event):
+        try:
+            key = pygame.key.key_code(TK_KEY_NAMES.get(event.keysym, event.keysym.lower()))
+        except ValueError:
+            return
+        self._post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=event.char, scancode=0))
+
+    def _forward_click(self, event):
+        self._post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(event.x, event.y), button=1))
+
+    def _begin(self, target: str):
+        source = self.pygame_name if self.current == PYGAME_PAGE else self.current
+        self._transition = (source or "start", target, time.perf_counter())
+
+    def _finish(self):
+        source, target, started = self._transition
+        self._transition = None
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        self.transitions.append((source, target, elapsed_ms))
+
+    def report(self) -> str:
+        by_route: Dict[Tuple[str, str], List[float]] = {}
+        for source, target, elapsed_ms in self.transitions:
+            by_route.setdefault((source, target), []).append(elapsed_ms)
+        routes = ", ".join(f"{source} -> {target} x{len(times)} mean {sum(times) / len(times):.1f} ms max {max(times):.1f} ms"
+                           for (source, target), times in by_route.items())
+        return f"Transitions: {routes or 'none'}"
@@ -0,0 +1,10 @@
+import os
+
+# Profiling counters printed when an application exits; a kiosk exit stays quiet unless asked
+
+
+def exit_report(*reports: str):
+    """Print each report when FRAME_STATS is set, the same switch as the frame timing sinks"""
+    if os.environ.get("FRAME_STATS"):
+        for report in reports:
+            print(report)
@@ -0,0 +1,224 @@
+import os
+import sys
+import time
+import pygame
+from typing import Dict, List, Optional, Sequence
+from assets import assets
+
+# Per-phase frame timing for the pygame menu loops
+
+PHASES = ("events", "background", "cards", "bottom_ui", "present")
+
+# Upper bucket edges in milliseconds for histogram(); the last bucket is open ended
+HISTOGRAM_EDGES_MS = (1.0, 2.0, 4.0, 8.0, 16.7, 33.3, 50.0, 100.0)
+
+OVERLAY_KEY = pygame.K_F3
+
+
+class MemorySink:
+    """Keeps every recorded frame in a list, for tests and tools"""
+
+    def __init__(self):
+        self.frames: List[Dict[str, float]] = []
+
+    def write(self, frame: int, timings: Dict[str, float]):
+        self.frames.append(dict(timings, frame=frame))
+
+    def close(self):
+        pass
+
+
+class StdoutSink:
+    """Prints a one-line summary every `every` recorded frames"""
+
+    def __init__(self, stats: "FrameStats", every: int = 300):
+        self.stats = stats
+        self.every = every
+
+    def write(self, frame: int, timings: Dict[str, float]):
+        if frame % self.every == 0:
+            summary = self.stats.summary()
+            phases = ", ".join(f"{phase} {summary[phase]['p95']:.2f}" for phase in self.stats.phases)
+            print(f"Frame {frame}: p95 ms {phases}, total {summary['total']['p95']:.2f}")
+
+    def close(self):
+        sys.stdout.flush()
+
+
+class FileSink:
+    """Appends one CSV line per recorded frame"""
+
+    def __init__(self, path: str, phases: Sequence[str] = PHASES):
+        self.phases = tuple(phases)
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, "a")
+        if new_file:
+            self.file.write(",".join(("frame",) + self.phases + ("total",)) + "\n")
+
+    def write(self, frame: int, timings: Dict[str, float]):
+        values = [f"{timings.get(phase, 0.0):.3f}" for phase in self.phases]
+        self.file.write(",".join([str(frame)] + values + [f"{timings['total']:.3f}"]) + "\n")
+
+    def close(self):
+        self.file.close()
+
+
+class FrameStats:
+    """Records how long each phase of a frame takes into a fixed-size ring buffer.
+
+    The loop calls begin_frame() once input is available, lap(phase) after
+    each phase and end_frame() once the frame is presented. Only the last
+    `capacity` frames are kept, so the buffer never grows on a kiosk that
+    runs for days. Every recorded frame is also passed to the sinks.
+    """
+
+    def __init__(self, capacity: int = 600, sinks: Optional[list] = None,
+                 phases: Sequence[str] = PHASES, enabled: bool = True):
+        self.capacity = capacity
+        self.phases = tuple(phases)
+        self.sinks = list(sinks or [])
+        self.enabled = enabled
+        self.samples = [[0.0] * (len(self.phases) + 1) for _ in range(capacity)]
+        self.index = 0
+        self.count = 0
+        self.frames = 0
+        self.current = [0.0] * len(self.phases)
+        self._frame_start = 0.0
+        self._mark = 0.0
+
+    @classmethod
+    def from_environment(cls, capacity: int = 600, phases: Sequence[str] = PHASES) -> "FrameStats":
+        """Build stats with sinks from FRAME_STATS, e.g. "stdout", "memory" or "file:/tmp/frames.csv".
+
+        Several sinks can be combined with commas. Without FRAME_STATS the
+        ring buffer is still filled for the overlay but nothing is written.
+        """
+        stats = cls(capacity, phases=phases)
+        for spec in filter(None, os.environ.get("FRAME_STATS", "").split(",")):
+            kind, _, argument = spec.strip().partition(":")
+            if kind == "stdout":
+                stats.sinks.append(StdoutSink(stats, int(argument) if argument else 300))
+            elif kind == "file":
+                stats.sinks.append(FileSink(argument or "frame_stats.csv", stats.phases))
+            elif kind == "memory":
+                stats.sinks.append(MemorySink())
+            else:
+                print(f"Unknown FRAME_STATS sink: {spec}")
+        return stats
+
+    def begin_frame(self):
+        self._frame_start = self._mark = time.perf_counter()
+        self.current = [0.0] * len(self.phases)
+
+    def lap(self, phase: str):
+        """Charge the time since the previous lap (or begin_frame) to phase"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.current[self.phases.index(phase)] += (now - self._mark) * 1000.0
+        self._mark = now
+
+    def skip(self):
+        """Leave the time since the last lap out of every phase, e.g. drawing the overlay"""
+        self._mark = time.perf_counter()
+
+    def end_frame(self, record: bool = True):
+        """Store the frame; frames that drew nothing can be dropped with record=False"""
+        if not self.enabled or not record:
+            return
+        total = (time.perf_counter() - self._frame_start) * 1000.0
+        row = self.samples[self.index]
+        row[:len(self.phases)] = self.current
+        row[-1] = total
+        self.index = (self.index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.frames += 1
+
+        if self.sinks:
+            timings = dict(zip(self.phases, self.current), total=total)
+            for sink in self.sinks:
+                sink.write(self.frames, timings)
+
+    def values(self, phase: str = "total") -> List[float]:
+        """Recorded times of one phase (or the whole frame), oldest first"""
+        column = len(self.phases) if phase == "total" else self.phases.index(phase)
+        start = (self.index - self.count) % self.capacity
+        return [self.samples[(start + i) % self.capacity][column] for i in range(self.count)]
+
+    def latest(self) -> Dict[str, float]:
+        if not self.count:
+            return {}
+        row = self.samples[(self.index - 1) % self.capacity]
+        return dict(zip(self.phases + ("total",), row))
+
+    def histogram(self, phase: str = "total", edges: Sequence[float] = HISTOGRAM_EDGES_MS) -> List[int]:
+        """Frame counts per bucket; bucket i holds times up to edges[i], the last one the rest"""
+        counts = [0] * (len(edges) + 1)
+        for value in self.values(phase):
+            for i, edge in enumerate(edges):
+                if value <= edge:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+        return counts
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        result = {}
+        for phase in self.phases + ("total",):
+            values = sorted(self.values(phase))
+            if not values:
+                result[phase] = {"mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+                continue
+            result[phase] = {
+                "mean": sum(values) / len(values),
+                "p50": values[len(values) // 2],
+                "p95": values[min(len(values) - 1, int(len(values) * 0.95))],
+                "max": values[-1],
+            }
+        return result
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+class FrameStatsOverlay:
+    """Small opaque panel with the latest phase timings and a frame time histogram.
+
+    Hidden by default; toggle() is bound to OVERLAY_KEY in the menu loops.
+    """
+
+    def __init__(self, stats: FrameStats, position=(10, 10), width: int = 250):
+        self.stats = stats
+        self.visible = False
+        self.font = assets.font(20)
+        line_height = self.font.get_linesize()
+        self.rect = pygame.Rect(position, (width, line_height * (len(stats.phases) + 2) + 50))
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def draw(self, screen: pygame.Surface):
+        pygame.draw.rect(screen, (0, 0, 0), self.rect)
+        pygame.draw.rect(screen, (64, 224, 255), self.rect, 1)
+
+        latest = self.stats.latest()
+        p95 = self.stats.summary()["total"]["p95"]
+        lines = [f"{phase:<11}{latest.get(phase, 0.0):7.2f} ms" for phase in self.stats.phases]
+        lines.append(f"{'total':<11}{latest.get('total', 0.0):7.2f} ms  p95 {p95:.2f}")
+        x, y = self.rect.x + 8, self.rect.y + 6
+        for line in lines:
+            screen.blit(self.font.render(line, True, (255, 255, 255)), (x, y))
+            y += self.font.get_linesize()
+
+        # Histogram of total frame time, one bar per bucket
+        counts = self.stats.histogram()
+        tallest = max(counts) or 1
+        bar_width = (self.rect.width - 16) // len(counts)
+        bottom = self.rect.bottom - 8
+        for i, count in enumerate(counts):
+            height = int(36 * count / tallest)
+            over_budget = i >= HISTOGRAM_EDGES_MS.index(16.7) + 1
+            colour = (255, 109, 1) if over_budget else (52, 168, 83)
+            pygame.draw.rect(screen, colour, (x + i * bar_width, bottom - height, bar_width - 2, height))
@@ -0,0 +1,127 @@
+import math
+import time
+from typing import Callable, Optional, Tuple
+
+TENTHS_BELOW_SECONDS = 60  # The scoreboards show tenths of a second in the final minute
+
+# Match countdown on monotonic deadlines rather than counted sleeps
+
+
+class GameClock:
+    """A countdown that derives the time left from a monotonic start time.
+
+    While running, remaining() is the time left when the clock was last
+    started minus the time since then, read from now() (time.monotonic by
+    default). Nothing is decremented per tick, so late or missed refreshes,
+    scheduling jitter and any number of pauses cannot make the clock drift:
+    pause() keeps the exact fraction of a second that was left.
+
+    display() gives the whole minutes and seconds a countdown shows (rounded
+    up, so 15:00 stays until a full second has passed). next_refresh() is how
+    long until that display changes, for a caller that sleeps or schedules
+    its next redraw instead of polling; refresh sets the display step, e.g.
+    0.1 for tenths. update() stops the clock at exactly zero.
+
+    With tenths_below set, shown() switches to tenths of a second once less
+    than that is left (59.9 follows 1:00) and next_refresh() follows: one
+    wakeup a second before, ten in the final stretch.
+    """
+
+    def __init__(self, minutes: int = 15, seconds: float = 0, refresh: float = 1.0,
+                 now: Callable[[], float] = time.monotonic, tenths_below: float = 0.0):
+        self.now = now
+        self.refresh = refresh
+        self.tenths_below = tenths_below
+        self.left = minutes * 60 + seconds  # seconds left when last started, or while paused
+        self.started_at: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self.started_at is not None
+
+    def remaining(self) -> float:
+        if self.started_at is None:
+            return self.left
+        return max(0.0, self.left - (self.now() - self.started_at))
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def start(self) -> bool:
+        if self.running or self.left <= 0:
+            return False
+        self.started_at = self.now()
+        return True
+
+    def pause(self) -> bool:
+        if not self.running:
+            return False
+        self.left = self.remaining()
+        self.started_at = None
+        return True
+
+    def toggle(self):
+        if not self.pause():
+            self.start()
+
+    def set(self, minutes: int, seconds: float = 0):
+        """Stop the clock and set the time left, e.g. to a preset"""
+        self.started_at = None
+        self.left = minutes * 60 + seconds
+
+    def update(self) -> bool:
+        """Stop at zero once the time is up; True when this call did so"""
+        if self.running and self.remaining() <= 0:
+            self.started_at = None
+            self.left = 0
+            return True
+        return False
+
+    def display(self) -> Tuple[int, int]:
+        """Whole minutes and seconds left, rounded up as a countdown shows them"""
+        return divmod(math.ceil(round(self.remaining(), 6)), 60)
+
+    def in_tenths(self, remaining: Optional[float] = None) -> bool:
+        """Whether the time left is shown in tenths, i.e. it is below tenths_below"""
+        if remaining is None:
+            remaining = self.remaining()
+        return math.ceil(round(remaining * 10, 6)) < self.tenths_below * 10
+
+    def shown(self) -> Tuple[int, int, Optional[int]]:
+        """(minutes, seconds, tenths) as the display shows them; tenths is None above tenths_below"""
+        remaining = self.remaining()
+        if not self.in_tenths(remaining):
+            minutes, seconds = divmod(math.ceil(round(remaining, 6)), 60)
+            return minutes, seconds, None
+        seconds, tenths = divmod(math.ceil(round(remaining * 10, 6)), 10)
+        minutes, seconds = divmod(seconds, 60)
+        return minutes, seconds, tenths
+
+    def next_refresh(self) -> Optional[float]:
+        """Seconds until the display changes, or None while stopped"""
+        if not self.running:
+            return None
+        remaining = self.remaining()
+        if remaining <= 0:
+            return 0.0
+        if self.in_tenths(remaining):
+            return remaining - (math.ceil(round(remaining * 10, 6)) - 1) / 10
+        steps = math.ceil(round(remaining / self.refresh, 6))
+        change = (steps - 1) * self.refresh
+        if self.tenths_below:
+            change = max(change, self.tenths_below - 0.1)  # the first tenth shown
+        return remaining - change
+
+
+class FakeClock:
+    """A now() that only moves when told to, for checks and simulations"""
+
+    def __init__(self, start: float = 0.0):
+        self.time = start
+
+    def __call__(self) -> float:
+        return self.time
+
+    def advance(self, seconds: float):
+        self.time += seconds
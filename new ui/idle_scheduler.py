@@ -0,0 +1,125 @@
+import time
+import pygame
+from typing import List, Optional
+
+# Event-driven frame pacing for the pygame menus
+
+INPUT_EVENTS = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION,
+                pygame.FINGERDOWN, pygame.FINGERMOTION)
+
+
+class IdleScheduler:
+    """Replaces the poll-and-tick-at-60-FPS menu loop.
+
+    poll() is used in place of pygame.event.get(). While the screen has
+    something to redraw the loop runs at full frame rate as before; when it
+    does not, poll() blocks in pygame.event.wait() until input arrives or one
+    frame period has passed. After idle_after seconds without input the frame
+    period drops to idle_fps, and the first touch or key brings it straight
+    back. tick() replaces clock.tick(FPS) and also collects CPU use per mode
+    and the latency from an idle wake-up to the first presented frame.
+    """
+
+    def __init__(self, clock: pygame.time.Clock, fps: int = 60, idle_fps: int = 5,
+                 idle_after: float = 30.0, enabled: bool = True):
+        self.clock = clock
+        self.fps = fps
+        self.idle_fps = idle_fps
+        self.idle_after = idle_after
+        self.enabled = enabled
+        self.idle = False
+        self.waited = False
+        self.last_input = time.monotonic()
+        self.wake_time = None
+        self.wake_latencies: List[float] = []
+        self.cpu_seconds = {"active": 0.0, "idle": 0.0}
+        self.wall_seconds = {"active": 0.0, "idle": 0.0}
+        self.frames = {"active": 0, "idle": 0}
+        self._last_wall = time.perf_counter()
+        self._last_cpu = time.process_time()
+
+    @property
+    def mode(self) -> str:
+        return "idle" if self.idle else "active"
+
+    @property
+    def frame_rate(self) -> int:
+        return self.idle_fps if self.idle else self.fps
+
+    def next_delay(self, busy: bool) -> Optional[float]:
+        """Seconds until the next frame for a loop that waits elsewhere, None to wait for input"""
+        if busy or not self.enabled:
+            return 1.0 / self.frame_rate
+        return None
+
+    def poll(self, busy: bool = True) -> list:
+        """Return pending events, blocking first if there is nothing to draw"""
+        self.idle = self.enabled and time.monotonic() - self.last_input >= self.idle_after
+
+        if busy or not self.enabled:
+            self.waited = False
+            events = pygame.event.get()
+        else:
+            self.waited = True
+            first = pygame.event.wait(1000 // self.frame_rate)
+            events = [] if first.type == pygame.NOEVENT else [first]
+            events.extend(pygame.event.get())
+
+        for event in events:
+            if event.type in INPUT_EVENTS:
+                if self.idle and self.wake_time is None:
+                    self.wake_time = time.perf_counter()
+                self.last_input = time.monotonic()
+        return events
+
+    def tick(self, sleep: bool = True):
+        """Finish a frame: record stats and pace the loop for the current mode.
+
+        Loops that wait somewhere else, like the display host's Tk timer, pass
+        sleep=False so the clock only measures.
+        """
+        if self.wake_time is not None:
+            self.wake_latencies.append(time.perf_counter() - self.wake_time)
+            self.wake_time = None
+
+        mode = self.mode
+        if self.waited or not sleep:
+            # event.wait() already slept for this frame
+            self.clock.tick()
+        else:
+            self.clock.tick(self.frame_rate)
+
+        now_wall = time.perf_counter()
+        now_cpu = time.process_time()
+        self.wall_seconds[mode] += now_wall - self._last_wall
+        self.cpu_seconds[mode] += now_cpu - self._last_cpu
+        self.frames[mode] += 1
+        self._last_wall = now_wall
+        self._last_cpu = now_cpu
+
+        if self.idle and time.monotonic() - self.last_input < self.idle_after:
+            self.idle = False
+
+    def stats(self) -> dict:
+        result = {}
+        for mode in ("active", "idle"):
+            wall = self.wall_seconds[mode]
+            result[mode] = {
+                "seconds": round(wall, 2),
+                "frames": self.frames[mode],
+                "cpu_percent": round(100.0 * self.cpu_seconds[mode] / wall, 1) if wall else 0.0,
+            }
+        latencies = sorted(self.wake_latencies)
+        result["wakes"] = len(latencies)
+        result["wake_latency_ms"] = {
+            "mean": round(1000.0 * sum(latencies) / len(latencies), 2) if latencies else None,
+            "max": round(1000.0 * latencies[-1], 2) if latencies else None,
+        }
+        return result
+
+    def report(self) -> str:
+        stats = self.stats()
+        return ("Frame pacing: active {0[active][cpu_percent]}% CPU over {0[active][seconds]}s, "
+                "idle {0[idle][cpu_percent]}% CPU over {0[idle][seconds]}s, "
+                "{0[wakes]} wakes, wake-to-frame mean {0[wake_latency_ms][mean]} ms "
+                "max {0[wake_latency_ms][max]} ms").format(stats)
@@ -0,0 +1,26 @@
+import importlib
+import time
+from typing import Callable, Optional
+
+# Modules imported on first use, so an entry point does not pay for tkinter or NumPy before its first screen
+
+
+class LazyModule:
+    """Stands in for a module and imports it on first attribute access.
+
+    on_import, if given, is called with the module name and the milliseconds
+    the import took, e.g. to add it to a start-up profile.
+    """
+
+    def __init__(self, name: str, on_import: Optional[Callable[[str, float], None]] = None):
+        self.name = name
+        self.on_import = on_import
+        self.module = None
+
+    def __getattr__(self, attribute: str):
+        if self.module is None:
+            started = time.perf_counter()
+            self.module = importlib.import_module(self.name)
+            if self.on_import is not None:
+                self.on_import(self.name, (time.perf_counter() - started) * 1000.0)
+        return getattr(self.module, attribute)
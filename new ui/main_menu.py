@@ -1,14 +1,21 @@
 import pygame
 import sys
 from typing import List, Tuple
-
-# Initialize Pygame
-pygame.init()
+from render_cache import BackgroundCache, VariantSurfaceCache, text_cache
+from dirty_rects import DirtyRectRenderer
+from idle_scheduler import IdleScheduler
+from frame_stats import FrameStats, FrameStatsOverlay, OVERLAY_KEY
+from exit_report import exit_report
+from assets import assets
 
 # Constants
 SCREEN_WIDTH = 1400
 SCREEN_HEIGHT = 800
 FPS = 60
+DIRTY_RECT_RENDERING = True  # Only push changed regions instead of flipping every frame
+IDLE_MODE = True  # Block on input instead of polling while nothing needs redrawing
+IDLE_FPS = 5
+IDLE_AFTER_SECONDS = 30
 
 # Colors
 PURPLE_DARK = (45, 25, 85)
@@ -31,46 +38,67 @@ class GameModeCard:
         self.border_color = border_color if not is_selected else ORANGE
         self.is_selected = is_selected
         self.border_width = 4 if is_selected else 2
+        self.surface_cache = VariantSurfaceCache()
+        self.bounds = self.rect.copy()  # Card plus any overflowing text, for dirty rects
         
     def draw(self, screen: pygame.Surface, font_large: pygame.font.Font, font_small: pygame.font.Font):
-        # Draw card background
-        pygame.draw.rect(screen, self.color, self.rect)
-        pygame.draw.rect(screen, self.border_color, self.rect, self.border_width)
+        # The card is composed once per look; selection only swaps which surface is blitted
+        key = (self.title, self.subtitle, self.rect.size, font_large.get_height(), font_small.get_height())
+        variant = (self.is_selected, self.border_color, self.border_width)
+        surface = self.surface_cache.get(key, variant, screen, self.rect.size,
+                                         lambda card: self.paint(card, font_large, font_small))
+        screen.blit(surface, self.rect)
         
-        # Draw title
-        title_surface = font_large.render(self.title, True, WHITE)
-        title_rect = title_surface.get_rect(center=(self.rect.centerx, self.rect.bottom - 80))
-        screen.blit(title_surface, title_rect)
+        # Text wider than the card spills onto the background, so it can't live on the card surface
+        self.bounds = self.rect.copy()
+        for label_surface, label_rect in self.labels(self.rect, font_large, font_small):
+            if not self.rect.contains(label_rect):
+                screen.blit(label_surface, label_rect)
+                self.bounds.union_ip(label_rect)
         
-        # Draw subtitle
-        subtitle_surface = font_small.render(self.subtitle, True, GRAY)
-        subtitle_rect = subtitle_surface.get_rect(center=(self.rect.centerx, self.rect.bottom - 50))
-        screen.blit(subtitle_surface, subtitle_rect)
+    def labels(self, rect: pygame.Rect, font_large: pygame.font.Font, font_small: pygame.font.Font):
+        title_surface = text_cache.render(font_large, self.title, True, WHITE)
+        title_rect = title_surface.get_rect(center=(rect.centerx, rect.bottom - 80))
+        subtitle_surface = text_cache.render(font_small, self.subtitle, True, GRAY)
+        subtitle_rect = subtitle_surface.get_rect(center=(rect.centerx, rect.bottom - 50))
+        return [(title_surface, title_rect), (subtitle_surface, subtitle_rect)]
+        
+    def paint(self, surface: pygame.Surface, font_large: pygame.font.Font, font_small: pygame.font.Font):
+        rect = surface.get_rect()
+        
+        # Draw card background
+        pygame.draw.rect(surface, self.color, rect)
+        pygame.draw.rect(surface, self.border_color, rect, self.border_width)
+        
+        # Draw title and subtitle
+        for label_surface, label_rect in self.labels(rect, font_large, font_small):
+            if rect.contains(label_rect):
+                surface.blit(label_surface, label_rect)
         
         # Draw character placeholder
-        char_rect = pygame.Rect(self.rect.x + 20, self.rect.y + 20, self.rect.width - 40, self.rect.height - 120)
-        pygame.draw.rect(screen, PURPLE_DARK, char_rect)
+        char_rect = pygame.Rect(rect.x + 20, rect.y + 20, rect.width - 40, rect.height - 120)
+        pygame.draw.rect(surface, PURPLE_DARK, char_rect)
         
         if self.title == "Solo":
-            pygame.draw.circle(screen, WHITE, (char_rect.centerx, char_rect.centery - 20), 30)
-            pygame.draw.circle(screen, BLACK, (char_rect.centerx - 10, char_rect.centery - 30), 5)
-            pygame.draw.circle(screen, BLACK, (char_rect.centerx + 10, char_rect.centery - 30), 5)
+            pygame.draw.circle(surface, WHITE, (char_rect.centerx, char_rect.centery - 20), 30)
+            pygame.draw.circle(surface, BLACK, (char_rect.centerx - 10, char_rect.centery - 30), 5)
+            pygame.draw.circle(surface, BLACK, (char_rect.centerx + 10, char_rect.centery - 30), 5)
         elif self.title == "Duo":
-            pygame.draw.circle(screen, WHITE, (char_rect.centerx - 25, char_rect.centery), 25)
-            pygame.draw.circle(screen, CYAN, (char_rect.centerx + 25, char_rect.centery), 25)
+            pygame.draw.circle(surface, WHITE, (char_rect.centerx - 25, char_rect.centery), 25)
+            pygame.draw.circle(surface, CYAN, (char_rect.centerx + 25, char_rect.centery), 25)
         elif self.title == "Trio":
-            pygame.draw.circle(screen, WHITE, (char_rect.centerx - 30, char_rect.centery - 10), 20)
-            pygame.draw.circle(screen, CYAN, (char_rect.centerx, char_rect.centery + 10), 20)
-            pygame.draw.circle(screen, ORANGE, (char_rect.centerx + 30, char_rect.centery - 10), 20)
+            pygame.draw.circle(surface, WHITE, (char_rect.centerx - 30, char_rect.centery - 10), 20)
+            pygame.draw.circle(surface, CYAN, (char_rect.centerx, char_rect.centery + 10), 20)
+            pygame.draw.circle(surface, ORANGE, (char_rect.centerx + 30, char_rect.centery - 10), 20)
         elif self.title == "Quad":
-            pygame.draw.circle(screen, WHITE, (char_rect.centerx - 25, char_rect.centery - 15), 18)
-            pygame.draw.circle(screen, CYAN, (char_rect.centerx + 25, char_rect.centery - 15), 18)
-            pygame.draw.circle(screen, ORANGE, (char_rect.centerx - 25, char_rect.centery + 15), 18)
-            pygame.draw.circle(screen, (255, 100, 255), (char_rect.centerx + 25, char_rect.centery + 15), 18)
+            pygame.draw.circle(surface, WHITE, (char_rect.centerx - 25, char_rect.centery - 15), 18)
+            pygame.draw.circle(surface, CYAN, (char_rect.centerx + 25, char_rect.centery - 15), 18)
+            pygame.draw.circle(surface, ORANGE, (char_rect.centerx - 25, char_rect.centery + 15), 18)
+            pygame.draw.circle(surface, (255, 100, 255), (char_rect.centerx + 25, char_rect.centery + 15), 18)
         elif self.title == "Playground":
             for i in range(5):
                 building_height = 40 + (i * 15) % 60
-                pygame.draw.rect(screen, CYAN, 
+                pygame.draw.rect(surface, CYAN, 
                                  (char_rect.x + i * 30, char_rect.bottom - building_height, 25, building_height))
 
 class RumbleVerseUI:
@@ -78,11 +106,16 @@ class RumbleVerseUI:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Foosball - Game Mode Selection")
         self.clock = pygame.time.Clock()
-        
-        self.font_title = pygame.font.Font(None, 72)
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 36)
-        self.font_small = pygame.font.Font(None, 24)
+        self.background_cache = BackgroundCache(self.paint_background)
+        self.renderer = DirtyRectRenderer(DIRTY_RECT_RENDERING)
+        self.scheduler = IdleScheduler(self.clock, FPS, IDLE_FPS, IDLE_AFTER_SECONDS, IDLE_MODE)
+        self.stats = FrameStats.from_environment()
+        self.overlay = FrameStatsOverlay(self.stats)
+
+        self.font_title = assets.font(72)
+        self.font_large = assets.font(48)
+        self.font_medium = assets.font(36)
+        self.font_small = assets.font(24)
         
         card_width = 220
         card_height = 400
@@ -102,27 +135,34 @@ class RumbleVerseUI:
         
         self.selected_mode = 0
         
-    def draw_background(self):
-        for y in range(SCREEN_HEIGHT):
-            color_ratio = y / SCREEN_HEIGHT
-            r = int(PURPLE_DARK[0] + (PURPLE_LIGHT[0] - PURPLE_DARK[0]) * color_ratio)
-            g = int(PURPLE_DARK[1] + (PURPLE_LIGHT[1] - PURPLE_DARK[1]) * color_ratio)
-            b = int(PURPLE_DARK[2] + (PURPLE_LIGHT[2] - PURPLE_DARK[2]) * color_ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+    def paint_background(self, surface: pygame.Surface, palette):
+        width, height = surface.get_size()
+        dark, light = palette
+        for y in range(height):
+            color_ratio = y / height
+            r = int(dark[0] + (light[0] - dark[0]) * color_ratio)
+            g = int(dark[1] + (light[1] - dark[1]) * color_ratio)
+            b = int(dark[2] + (light[2] - dark[2]) * color_ratio)
+            pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
         
         for i in range(20):
             building_x = i * 70
             building_height = 100 + (i * 23) % 200
             building_width = 50 + (i * 17) % 30
             color_variation = 20 + (i * 13) % 40
-            building_color = (PURPLE_DARK[0] + color_variation, 
-                              PURPLE_DARK[1] + color_variation, 
-                              PURPLE_DARK[2] + color_variation)
-            pygame.draw.rect(self.screen, building_color, 
-                             (building_x, SCREEN_HEIGHT - building_height, building_width, building_height))
+            building_color = (dark[0] + color_variation, 
+                              dark[1] + color_variation, 
+                              dark[2] + color_variation)
+            pygame.draw.rect(surface, building_color, 
+                             (building_x, height - building_height, building_width, building_height))
+    
+    def draw_background(self):
+        # Static gradient and skyline are painted once and reused every frame
+        background = self.background_cache.get(self.screen, (PURPLE_DARK, PURPLE_LIGHT))
+        self.screen.blit(background, (0, 0))
     
     def draw_title(self):
-        title_surface = self.font_title.render("Game Modes", True, CYAN)
+        title_surface = text_cache.render(self.font_title, "Game Modes", True, CYAN)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         self.screen.blit(title_surface, title_rect)
         
@@ -136,33 +176,35 @@ class RumbleVerseUI:
             pygame.draw.rect(self.screen, GRAY, key_rect)
             pygame.draw.rect(self.screen, WHITE, key_rect, 2)
             
-            key_surface = self.font_small.render(key, True, BLACK)
+            key_surface = text_cache.render(self.font_small, key, True, BLACK)
             self.screen.blit(key_surface, key_surface.get_rect(center=key_rect.center))
             
-            action_surface = self.font_small.render(action, True, WHITE)
+            action_surface = text_cache.render(self.font_small, action, True, WHITE)
             self.screen.blit(action_surface, (x_pos + 50, SCREEN_HEIGHT - 55))
             
             x_pos += 200
     
+    def select_mode(self, index):
+        previous = self.game_modes[self.selected_mode]
+        previous.is_selected = False
+        previous.border_color = WHITE
+        previous.border_width = 2
+        self.renderer.mark(previous.bounds)
+
+        self.selected_mode = index
+        mode = self.game_modes[index]
+        mode.is_selected = True
+        mode.border_color = ORANGE
+        mode.border_width = 4
+        self.renderer.mark(mode.bounds)
+
     def handle_input(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_LEFT and self.selected_mode > 0:
-                self.game_modes[self.selected_mode].is_selected = False
-                self.game_modes[self.selected_mode].border_color = WHITE
-                self.game_modes[self.selected_mode].border_width = 2
-                self.selected_mode -= 1
-                self.game_modes[self.selected_mode].is_selected = True
-                self.game_modes[self.selected_mode].border_color = ORANGE
-                self.game_modes[self.selected_mode].border_width = 4
+                self.select_mode(self.selected_mode - 1)
 
             elif event.key == pygame.K_RIGHT and self.selected_mode < len(self.game_modes) - 1:
-                self.game_modes[self.selected_mode].is_selected = False
-                self.game_modes[self.selected_mode].border_color = WHITE
-                self.game_modes[self.selected_mode].border_width = 2
-                self.selected_mode += 1
-                self.game_modes[self.selected_mode].is_selected = True
-                self.game_modes[self.selected_mode].border_color = ORANGE
-                self.game_modes[self.selected_mode].border_width = 4
+                self.select_mode(self.selected_mode + 1)
 
             elif event.key == pygame.K_RETURN:
                 selected_title = self.game_modes[self.selected_mode].title
@@ -189,43 +231,82 @@ class RumbleVerseUI:
             mouse_pos = pygame.mouse.get_pos()
             for i, mode in enumerate(self.game_modes):
                 if mode.rect.collidepoint(mouse_pos):
-                    self.game_modes[self.selected_mode].is_selected = False
-                    self.game_modes[self.selected_mode].border_color = WHITE
-                    self.game_modes[self.selected_mode].border_width = 2
-
-                    self.selected_mode = i
-                    mode.is_selected = True
-                    mode.border_color = ORANGE
-                    mode.border_width = 4
+                    self.select_mode(i)
                     break
-    
-    def run(self):
-        running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        running = False
-                    else:
-                        self.handle_input(event)
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    self.handle_input(event)
-            
+
+    def render_frame(self):
+        if self.overlay.visible:
+            self.renderer.mark(self.overlay.rect)
+        if not self.renderer.has_changes:
+            return False
+
+        if self.renderer.needs_full_redraw:
             self.draw_background()
             self.draw_title()
+            self.stats.lap("background")
             for mode in self.game_modes:
                 mode.draw(self.screen, self.font_large, self.font_medium)
+            self.stats.lap("cards")
             self.draw_bottom_ui()
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            self.stats.lap("bottom_ui")
+        else:
+            # Restore the background under each changed region, then redraw the cards on it
+            background = self.background_cache.get(self.screen, (PURPLE_DARK, PURPLE_LIGHT))
+            for rect in self.renderer.rects:
+                self.screen.blit(background, rect, rect)
+            self.stats.lap("background")
+            for mode in self.game_modes:
+                if mode.bounds.collidelist(self.renderer.rects) != -1:
+                    mode.draw(self.screen, self.font_large, self.font_medium)
+            self.stats.lap("cards")
+
+        if self.overlay.visible:
+            self.overlay.draw(self.screen)
+            self.stats.skip()
+        self.renderer.present()
+        self.stats.lap("present")
+        return True
+
+    def process(self, events):
+        """Handle one batch of events and draw a frame; False once the player quits"""
+        self.stats.begin_frame()
+        for event in events:
+            if event.type == pygame.QUIT:
+                return False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    return False
+                elif event.key == OVERLAY_KEY:
+                    self.overlay.toggle()
+                    self.renderer.mark_all()
+                else:
+                    self.handle_input(event)
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                self.handle_input(event)
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.renderer.mark_all()
+
+        self.stats.lap("events")
+        self.stats.end_frame(self.render_frame())
+        return True
+
+    def busy(self):
+        """Whether the next frame has something to draw"""
+        return self.renderer.has_changes or self.overlay.visible
+
+    def run(self):
+        while self.process(self.scheduler.poll(self.busy())):
+            self.scheduler.tick()
         
+        exit_report(self.scheduler.report(), assets.report())
+        self.stats.close()
         pygame.quit()
         sys.exit()
 
 # Run the application
 if __name__ == "__main__":
+    pygame.display.init()
+    pygame.font.init()
     game = RumbleVerseUI()
     print("RumbleVerse Game Mode Selection - Use arrow keys to navigate, Enter to select, Esc to quit")
     game.run()
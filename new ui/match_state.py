@@ -0,0 +1,232 @@
+import time
+from typing import Callable, Dict, Optional, Set, Tuple
+from game_clock import TENTHS_BELOW_SECONDS, GameClock
+from timer_service import Countdown, TimerService
+
+# Scoreboard state and rules, independent of the toolkit that draws them
+
+TEAMS = ("HOME", "AWAY")
+ORDINALS = ["", "1st", "2nd", "3rd", "4th", "5th"]
+MAX_GAMES = 5
+MAX_TIMEOUTS = 3
+START_TIMEOUTS = 2
+START_CLOCK = (15, 0)
+TIMEOUT_SECONDS = 30
+SHOT_CLOCK_SECONDS = 15
+
+# Fields reported by take_changes(); "clock" is the clock's running state, "time" the time it shows
+FIELDS = ("score", "sets", "timeouts", "possession", "game", "clock", "time", "timeout", "shot_clock")
+
+
+class MatchState:
+    """Scores, games won, timeouts, possession, current game and clock of one match.
+
+    The actions follow the rules of the Tk scoreboards: scores and games won
+    never go below zero, timeouts stay between 0 and MAX_TIMEOUTS and the
+    current game between 1 and MAX_GAMES. Every action records which fields
+    it changed, so a renderer can redraw only those parts; see take_changes().
+
+    The clock is a GameClock read from now (time.monotonic by default).
+    Whoever draws it calls update_clock() when clock_refresh() says the shown
+    time changes, rather than the state running a thread of its own. In the
+    final minute the time is shown in tenths and changes ten times a second;
+    those ticks only report "time", so only the digits need redrawing.
+
+    With a TimerService the clock reads the service's time, and taking a
+    timeout or changing possession starts the timeout (the clock stands
+    still) and the shot clock as Countdowns on it, as on the Tk scoreboard.
+    Their ticks come from the service rather than from an action, so they
+    call on_change() for the renderer to pick up.
+    """
+
+    def __init__(self, now: Callable[[], float] = time.monotonic, timers: Optional[TimerService] = None):
+        self.changes: Set[str] = set()
+        self.timers = timers
+        if timers is not None:
+            now = timers.now
+        self.clock = GameClock(*START_CLOCK, now=now, tenths_below=TENTHS_BELOW_SECONDS)
+        self.shown_clock: Optional[Tuple[int, int, Optional[int]]] = None
+        self.on_change: Optional[Callable[[], None]] = None
+        self.timeout_team: Optional[str] = None
+        self.timeout_left: Optional[int] = None
+        self.shot_clock_left: Optional[int] = None
+        self.timeout_countdown = self.shot_clock = None
+        if timers is not None:
+            self.timeout_countdown = Countdown(timers, TIMEOUT_SECONDS, self._show_timeout, self._timeout_over)
+            self.shot_clock = Countdown(timers, SHOT_CLOCK_SECONDS, self._show_shot_clock, self._shot_clock_expired)
+        self.reset()
+
+    def reset(self):
+        """Back to the start of a match: 0-0, game one, two timeouts each, clock stopped at 15:00"""
+        self.scores: Dict[str, int] = {team: 0 for team in TEAMS}
+        self.sets: Dict[str, int] = {team: 0 for team in TEAMS}
+        self.timeouts: Dict[str, int] = {team: START_TIMEOUTS for team in TEAMS}
+        self.possession = "HOME"
+        self.game = 1
+        self.clock.set(*START_CLOCK)
+        self.stop_countdowns()
+        self.changes.update(FIELDS)
+
+    def take_changes(self) -> Set[str]:
+        """Fields changed since the last call"""
+        changes, self.changes = self.changes, set()
+        return changes
+
+    def change_score(self, team: str, delta: int):
+        self._adjust(self.scores, team, delta, "score")
+
+    def change_sets(self, team: str, delta: int):
+        self._adjust(self.sets, team, delta, "sets")
+
+    def change_timeouts(self, team: str, delta: int):
+        before = self.timeouts[team]
+        self._adjust(self.timeouts, team, delta, "timeouts", MAX_TIMEOUTS)
+        if self.timeout_countdown is None:
+            return
+        if self.timeouts[team] < before:
+            self.start_timeout(team)
+        elif self.timeouts[team] > before and team == self.timeout_team:
+            self.clear_timeout()  # Taken by mistake
+
+    def change_possession(self, team: str):
+        if team != self.possession:
+            self.possession = team
+            self.changes.add("possession")
+        if self.shot_clock is not None:
+            self.shot_clock.start()
+
+    # Timeout and shot clock, with a TimerService
+    def start_timeout(self, team: str):
+        # The game clock stands still for the length of the timeout
+        self.stop_clock()
+        self.timeout_team = team
+        self.timeout_countdown.start()
+
+    def _show_timeout(self, seconds: int):
+        self.timeout_left = seconds
+        self._changed("timeout")
+
+    def _timeout_over(self):
+        print(f"{self.timeout_team} timeout over")
+        self.clear_timeout()
+
+    def clear_timeout(self):
+        if self.timeout_countdown is not None:
+            self.timeout_countdown.cancel()
+        if self.timeout_team is not None:
+            self.timeout_team = self.timeout_left = None
+            self._changed("timeout")
+
+    def _show_shot_clock(self, seconds: int):
+        self.shot_clock_left = seconds
+        self._changed("shot_clock")
+
+    def _shot_clock_expired(self):
+        print(f"Shot clock expired for {self.possession}")
+
+    def stop_countdowns(self):
+        """Cancel the timeout and the shot clock, e.g. when leaving the screen"""
+        self.clear_timeout()
+        if self.shot_clock is not None:
+            self.shot_clock.cancel()
+        if self.shot_clock_left is not None:
+            self.shot_clock_left = None
+            self.changes.add("shot_clock")
+
+    @property
+    def timeout_text(self) -> str:
+        return f"{self.timeout_team} TIMEOUT {self.timeout_left}" if self.timeout_team else ""
+
+    @property
+    def shot_clock_text(self) -> str:
+        return "" if self.shot_clock_left is None else f"SHOT CLOCK {self.shot_clock_left}"
+
+    def next_game(self):
+        if self.game < MAX_GAMES:
+            self.game += 1
+            self.changes.add("game")
+
+    def prev_game(self):
+        if self.game > 1:
+            self.game -= 1
+            self.changes.add("game")
+
+    @property
+    def game_label(self) -> str:
+        return f"{ORDINALS[self.game]} Game"
+
+    @property
+    def clock_running(self) -> bool:
+        return self.clock.running
+
+    @property
+    def minutes(self) -> int:
+        return self.clock.display()[0]
+
+    @property
+    def seconds(self) -> int:
+        return self.clock.display()[1]
+
+    @property
+    def clock_parts(self) -> Tuple[str, str, str]:
+        """The shown time as ("MM", ":", "SS"), or ("SS", ".", "t") in the final minute"""
+        minutes, seconds, tenths = self.clock.shown()
+        if tenths is None:
+            return f"{minutes:02d}", ":", f"{seconds:02d}"
+        return f"{minutes * 60 + seconds:02d}", ".", str(tenths)
+
+    @property
+    def clock_text(self) -> str:
+        return "".join(self.clock_parts)
+
+    def start_clock(self):
+        if self.clock.start():
+            self.changes.add("clock")
+
+    def stop_clock(self):
+        if self.clock.pause():
+            # The paused time can be past the last one shown, e.g. between two tenths
+            self.shown_clock = self.clock.shown()
+            self.changes.update(("clock", "time"))
+
+    def toggle_clock(self):
+        if self.clock_running:
+            self.stop_clock()
+        else:
+            self.start_clock()
+
+    def set_clock(self, minutes: int, seconds: int):
+        """Stop the clock and set it, e.g. to a preset"""
+        self.clock.set(minutes, seconds)
+        self.changes.update(("clock", "time"))
+
+    def reset_clock(self):
+        self.set_clock(*START_CLOCK)
+
+    def update_clock(self):
+        """Record a time change once the shown time moved on; the clock stops itself at 00:00"""
+        stopped = self.clock.update()
+        shown = self.clock.shown()
+        if stopped:
+            self.changes.add("clock")
+        if stopped or shown != self.shown_clock:
+            self.shown_clock = shown
+            self.changes.add("time")
+
+    def clock_refresh(self) -> Optional[float]:
+        """Seconds until update_clock() has something new to show, None while stopped"""
+        return self.clock.next_refresh()
+
+    def _changed(self, field: str):
+        """Record a change made by a countdown and tell the renderer, which did not cause it"""
+        self.changes.add(field)
+        if self.on_change is not None:
+            self.on_change()
+
+    def _adjust(self, values: Dict[str, int], team: str, delta: int, field: str, limit: Optional[int] = None):
+        value = max(0, values[team] + delta)
+        if limit is not None:
+            value = min(limit, value)
+        if value != values[team]:
+            values[team] = value
+            self.changes.add(field)
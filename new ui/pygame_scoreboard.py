@@ -0,0 +1,410 @@
+import sys
+import time
+import pygame
+from typing import Callable, List, Optional, Sequence, Tuple
+from assets import assets
+from dirty_rects import DirtyRectRenderer
+from exit_report import exit_report
+from frame_stats import FrameStats, FrameStatsOverlay, OVERLAY_KEY
+from idle_scheduler import IdleScheduler
+from match_state import TEAMS, MatchState
+from render_cache import text_cache
+from timer_service import TimerService
+
+# Scoreboard drawn with pygame, so match play stays on the display host's pygame page
+
+FPS = 30
+IDLE_FPS = 5
+IDLE_AFTER_SECONDS = 30
+PHASES = ("events", "panels", "present")
+
+# The Tk scoreboards' palette
+BACKGROUND = (30, 58, 95)      # '#1e3a5f'
+PANEL = (74, 111, 165)         # '#4a6fa5'
+MINUS = (139, 74, 107)         # '#8b4a6b'
+NEUTRAL = (102, 102, 102)      # '#666666'
+CAPTION = (204, 204, 204)      # '#cccccc'
+PITCH = (34, 139, 34)          # '#228B22'
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+ORANGE = (255, 165, 0)
+
+# Shapes drawn instead of text, since the default font has no arrow glyphs
+LEFT, RIGHT, BACK, RESET, PLAY = "left", "right", "back", "reset", "play"
+
+
+class Button:
+    """A touch target: a filled rect with a label or an icon, calling action when hit"""
+
+    def __init__(self, rect: pygame.Rect, label: str, action: Callable[[], None],
+                 fill=PANEL, color=WHITE, icon: Optional[str] = None):
+        self.rect = rect
+        self.label = label
+        self.action = action
+        self.fill = fill
+        self.color = color
+        self.icon = icon
+
+    def draw(self, surface: pygame.Surface, font: pygame.font.Font, fill=None):
+        pygame.draw.rect(surface, fill or self.fill, self.rect, border_radius=6)
+        if self.icon:
+            draw_icon(surface, self.icon, self.rect, self.color)
+        if self.label:
+            text = text_cache.render(font, self.label, True, self.color)
+            if self.icon == BACK:
+                # Label next to the arrow
+                center = (self.rect.x + self.rect.height + (self.rect.width - self.rect.height) // 2, self.rect.centery)
+            else:
+                center = self.rect.center
+            surface.blit(text, text.get_rect(center=center))
+
+
+class Panel:
+    """A screen region that is redrawn as a whole when one of its fields changes"""
+
+    def __init__(self, rect: pygame.Rect, fields: Sequence[str], paint: Callable[[pygame.Surface], None]):
+        self.rect = rect
+        self.fields = set(fields)
+        self.paint = paint
+
+
+def draw_icon(surface: pygame.Surface, icon: str, rect: pygame.Rect, color):
+    size = rect.height // 4
+    cx, cy = rect.center
+    if icon == LEFT:
+        points = [(cx - size, cy), (cx + size, cy - size), (cx + size, cy + size)]
+    elif icon == RIGHT:
+        points = [(cx + size, cy), (cx - size, cy - size), (cx - size, cy + size)]
+    elif icon == PLAY:
+        points = [(cx + size, cy), (cx - size, cy - size), (cx - size, cy + size)]
+    elif icon == BACK:
+        cx = rect.x + rect.height // 2
+        points = [(cx - size, cy), (cx + size // 2, cy - size), (cx + size // 2, cy + size)]
+    elif icon == RESET:
+        pygame.draw.arc(surface, color, rect.inflate(-rect.width // 2, -rect.height // 2), 0.6, 5.8, 3)
+        tip = (rect.centerx + rect.width // 4, rect.centery - 2)
+        points = [tip, (tip[0] - size // 2, tip[1] - size // 2), (tip[0] + size // 2, tip[1] - size // 2)]
+    else:
+        return
+    pygame.draw.polygon(surface, color, points)
+
+
+def draw_pause(surface: pygame.Surface, rect: pygame.Rect, color):
+    size = rect.height // 4
+    for dx in (-size, size // 3):
+        pygame.draw.rect(surface, color, (rect.centerx + dx, rect.centery - size, size * 2 // 3, size * 2))
+
+
+class PygameScoreboard:
+    """The tablesoccer (or volleyball) scoreboard rendered directly in pygame.
+
+    Same layout and actions as the Tk scoreboards - goals, games won,
+    timeouts, possession, game number and the match clock with its presets -
+    but drawn into the application's persistent pygame display, so entering
+    a match needs no switch to the Tk toolkit. The state lives in a
+    MatchState; only the panels whose fields changed are repainted and
+    pushed to the display.
+
+    Fits the display host like the menus: process(events) returns False once
+    the player went back. The clock tick, the timeout and the shot clock are
+    timers on the application's TimerService, which the host's Tk loop runs;
+    standalone the board has a service of its own and runs it from process().
+    """
+
+    def __init__(self, main_app, state: Optional[MatchState] = None, sport: str = "TABLESOCCER",
+                 teams: Tuple[str, str] = ("BULLDOGS", "FALCONS"), size: Tuple[int, int] = (1400, 800),
+                 now: Callable[[], float] = time.monotonic):
+        self.main_app = main_app
+        if main_app is not None:
+            self.screen = main_app.host.display()
+        else:
+            self.screen = pygame.display.set_mode(size)
+        self.own_timers = main_app is None
+        self.timers = TimerService(now=now) if self.own_timers else main_app.timers
+        self.state = state or MatchState(timers=self.timers)
+        self.state.on_change = self.wake
+        self.tick_timer = None
+        self.sport = sport
+        self.teams = teams
+        self.clock = pygame.time.Clock()
+        self.renderer = DirtyRectRenderer()
+        self.scheduler = IdleScheduler(self.clock, FPS, IDLE_FPS, IDLE_AFTER_SECONDS)
+        self.stats = FrameStats.from_environment(phases=PHASES)
+        self.overlay = FrameStatsOverlay(self.stats)
+        self.handed_over = False
+
+        width, height = self.screen.get_size()
+        self.unit = unit = min(width / 1200, height / 800)
+        self.fonts = {size: assets.font(max(8, int(size * unit))) for size in (14, 18, 22, 28, 36, 64, 150)}
+        self.buttons: List[Button] = []
+        self.panels: List[Panel] = []
+        self.layout(width, height)
+
+    def scaled(self, x, y, w, h) -> pygame.Rect:
+        return pygame.Rect(int(x * self.unit), int(y * self.unit), int(w * self.unit), int(h * self.unit))
+
+    def button(self, rect, label, action, fill=PANEL, color=WHITE, icon=None) -> Button:
+        button = Button(rect, label, action, fill, color, icon)
+        self.buttons.append(button)
+        return button
+
+    def layout(self, width: int, height: int):
+        s = self.scaled
+        # Centre the 1200x800 design horizontally on wider screens
+        left = (width / self.unit - 1200) / 2
+        state = self.state
+
+        # Header: back, team names, reset
+        header = pygame.Rect(0, 0, width, int(80 * self.unit))
+        self.back_button = self.button(s(left + 20, 18, 280, 44), "Back to Game Modes", self.back, icon=BACK)
+        self.reset_button = self.button(s(left + 1136, 18, 44, 44), "", self.reset_game, icon=RESET)
+        self.panels.append(Panel(header, (), self.paint_header))
+
+        # Scores, table and possession
+        self.score_rect = s(left + 20, 90, 1160, 270)
+        self.possession_buttons = {
+            "HOME": self.button(s(left + 470, 300, 44, 36), "", lambda: state.change_possession("HOME"),
+                                NEUTRAL, icon=LEFT),
+            "AWAY": self.button(s(left + 686, 300, 44, 36), "", lambda: state.change_possession("AWAY"),
+                                NEUTRAL, icon=RIGHT),
+        }
+        self.panels.append(Panel(self.score_rect, ("score", "possession", "shot_clock"), self.paint_scores))
+
+        # Goals and game number
+        goals = s(left + 20, 370, 1160, 110)
+        self.goal_buttons = []
+        for team, x, signs in (("HOME", 40, (1, -1)), ("AWAY", 960, (-1, 1))):
+            for i, delta in enumerate(signs):
+                self.goal_buttons.append(self.button(s(left + x + i * 100, 400, 90, 60), f"{delta:+d}",
+                            lambda team=team, delta=delta: state.change_score(team, delta),
+                            PANEL if delta > 0 else MINUS))
+        self.game_rect = s(left + 450, 385, 300, 80)
+        self.game_buttons = [self.button(s(left + 465, 403, 44, 44), "", state.prev_game, WHITE, PANEL, LEFT),
+                             self.button(s(left + 691, 403, 44, 44), "", state.next_game, WHITE, PANEL, RIGHT)]
+        self.panels.append(Panel(goals, ("game",), self.paint_goals))
+
+        # Games won, timeouts and the whistle
+        stats = s(left + 20, 490, 1160, 130)
+        self.counters = []
+        self.counter_buttons = []
+        for team, x in (("HOME", 40), ("AWAY", 820)):
+            for caption, values, change, dx in (("GAMES WON", state.sets, state.change_sets, 0),
+                                                ("TIME OUTS", state.timeouts, state.change_timeouts, 180)):
+                box = s(left + x + dx, 530, 160, 70)
+                self.counters.append((caption, box, values, team))
+                self.counter_buttons += [
+                    self.button(s(left + x + dx + 8, 549, 32, 32), "-",
+                                lambda team=team, change=change: change(team, -1), WHITE, PANEL),
+                    self.button(s(left + x + dx + 120, 549, 32, 32), "+",
+                                lambda team=team, change=change: change(team, 1), WHITE, PANEL),
+                ]
+        self.whistle_button = self.button(s(left + 520, 520, 160, 70), "WHISTLE", self.sound_whistle, WHITE, PANEL)
+        self.panels.append(Panel(stats, ("sets", "timeouts", "timeout"), self.paint_stats))
+
+        # Match clock and presets
+        clock = s(left + 20, 630, 1160, 150)
+        self.play_button = self.button(s(left + 300, 660, 90, 90), "", state.toggle_clock, WHITE, PANEL, PLAY)
+        self.clock_rect = s(left + 410, 650, 380, 110)
+        self.clock_buttons = [
+            self.button(s(left + 810, 660, 90, 90), "", state.reset_clock, WHITE, PANEL, RESET),
+            self.button(s(left + 930, 670, 80, 70), "1 min", lambda: state.set_clock(1, 0), NEUTRAL),
+            self.button(s(left + 1030, 670, 80, 70), "15 min", lambda: state.set_clock(15, 0), NEUTRAL),
+        ]
+        self.panels.append(Panel(clock, ("clock",), self.paint_clock))
+        # Ticks of the running clock only repaint the time, ten times a second in the final minute
+        self.panels.append(Panel(self.clock_rect, ("time",), self.paint_time))
+
+    # Painting, one method per panel; each fills its own rect first
+    def text(self, size: int, text: str, color, **position):
+        surface = text_cache.render(self.fonts[size], text, True, color)
+        self.screen.blit(surface, surface.get_rect(**position))
+
+    def paint_header(self, screen: pygame.Surface):
+        for button in (self.back_button, self.reset_button):
+            button.draw(screen, self.fonts[18])
+        self.text(28, self.teams[0], WHITE, midleft=(self.back_button.rect.right + int(30 * self.unit),
+                                                     self.back_button.rect.centery))
+        self.text(28, self.teams[1], WHITE, midright=(self.reset_button.rect.left - int(30 * self.unit),
+                                                      self.reset_button.rect.centery))
+
+    def paint_scores(self, screen: pygame.Surface):
+        rect = self.score_rect
+        pygame.draw.rect(screen, PANEL, rect)
+        pygame.draw.rect(screen, WHITE, rect, 2)
+        u = self.unit
+        for team, x in zip(TEAMS, (rect.x + rect.width // 6, rect.right - rect.width // 6)):
+            self.text(150, str(self.state.scores[team]), WHITE, center=(x, rect.y + int(110 * u)))
+            self.text(18, f"{team} TEAM", CAPTION, center=(x, rect.y + int(215 * u)))
+
+        # The table, as on the Tk canvas
+        table = pygame.Rect(0, 0, int(80 * u), int(60 * u))
+        table.center = (rect.centerx, rect.y + int(70 * u))
+        pygame.draw.rect(screen, PITCH, table)
+        pygame.draw.rect(screen, WHITE, table, max(1, int(3 * u)))
+        pygame.draw.line(screen, WHITE, table.midtop, table.midbottom, max(1, int(2 * u)))
+        for goal_x in (table.left - int(5 * u), table.right):
+            pygame.draw.rect(screen, WHITE, (goal_x, table.centery - int(10 * u), int(5 * u), int(20 * u)))
+        pygame.draw.circle(screen, WHITE, table.center, max(2, int(5 * u)))
+        self.text(14, self.sport, WHITE, center=(rect.centerx, table.bottom + int(18 * u)))
+        self.text(28, "V/S", WHITE, center=(rect.centerx, table.bottom + int(50 * u)))
+
+        for team, button in self.possession_buttons.items():
+            button.draw(screen, self.fonts[18], ORANGE if team == self.state.possession else None)
+        self.text(14, "POSSESSION", WHITE, center=(rect.centerx, self.possession_buttons["HOME"].rect.centery))
+        if self.state.shot_clock_text:
+            self.text(14, self.state.shot_clock_text, ORANGE, center=(rect.centerx, rect.bottom - int(12 * u)))
+
+    def paint_goals(self, screen: pygame.Surface):
+        for first in self.goal_buttons[::2]:
+            self.text(14, "GOALS", CAPTION, bottomleft=(first.rect.x, first.rect.y - int(4 * self.unit)))
+        for button in self.goal_buttons:
+            button.draw(screen, self.fonts[28])
+        pygame.draw.rect(screen, PANEL, self.game_rect, border_radius=6)
+        for button in self.game_buttons:
+            button.draw(screen, self.fonts[18])
+        self.text(28, self.state.game_label, WHITE, center=self.game_rect.center)
+
+    def paint_stats(self, screen: pygame.Surface):
+        u = self.unit
+        for caption, box, values, team in self.counters:
+            self.text(14, caption, CAPTION, midbottom=(box.centerx, box.y - int(4 * u)))
+            pygame.draw.rect(screen, PANEL, box, border_radius=6)
+            self.text(36, str(values[team]), WHITE, center=box.center)
+        for button in self.counter_buttons + [self.whistle_button]:
+            button.draw(screen, self.fonts[22])
+        if self.state.timeout_text:
+            self.text(18, self.state.timeout_text, ORANGE,
+                      midbottom=(self.whistle_button.rect.centerx, self.whistle_button.rect.y - int(4 * u)))
+
+    def paint_clock(self, screen: pygame.Surface):
+        running = self.state.clock_running
+        self.play_button.draw(screen, self.fonts[18])
+        if running:
+            pygame.draw.rect(screen, WHITE, self.play_button.rect.inflate(-8, -8), border_radius=6)
+            draw_pause(screen, self.play_button.rect, PANEL)
+        self.paint_time(screen)
+        for button in self.clock_buttons:
+            button.draw(screen, self.fonts[18])
+
+    def paint_time(self, screen: pygame.Surface):
+        pygame.draw.rect(screen, WHITE, self.clock_rect, border_radius=10)
+        self.text(64, self.state.clock_text, ORANGE if self.state.clock_running else PANEL,
+                  center=self.clock_rect.center)
+
+    # Actions that are not plain state changes
+    def sound_whistle(self):
+        print("Whistle blown!")
+
+    def reset_game(self):
+        self.state.reset()
+
+    def stop_timer(self):
+        """Called by the application when it leaves the scoreboard"""
+        self.state.stop_clock()
+        self.schedule_tick()
+
+    def stop_countdowns(self):
+        self.state.stop_countdowns()
+
+    # Clock
+    def schedule_tick(self):
+        """Wake up when the shown time changes next, while the clock runs"""
+        self.timers.cancel(self.tick_timer)
+        self.tick_timer = None
+        delay = self.state.clock_refresh()
+        if delay is not None:
+            self.tick_timer = self.timers.call_later(delay, self.tick)
+
+    def tick(self):
+        self.tick_timer = None
+        self.state.update_clock()
+        self.schedule_tick()
+        self.wake()
+
+    def wake(self):
+        """A timer changed the state; under the display host, have it draw a frame"""
+        if self.main_app is not None and self.state.changes:
+            self.main_app.host.wake()
+
+    def back(self):
+        print("Back button clicked - returning to game modes...")
+        if self.main_app is not None:
+            self.handed_over = True
+            self.main_app.back_to_rumbleverse()
+
+    def handle_click(self, position) -> bool:
+        for button in self.buttons:
+            if button.rect.collidepoint(position):
+                button.action()
+                return True
+        return False
+
+    def render_frame(self) -> bool:
+        changes = self.state.take_changes()
+        if "clock" in changes:
+            self.schedule_tick()
+        if self.renderer.needs_full_redraw:
+            self.screen.fill(BACKGROUND)
+            panels = self.panels
+        else:
+            panels = [panel for panel in self.panels if panel.fields & changes]
+            for panel in panels:
+                self.screen.fill(BACKGROUND, panel.rect)
+                self.renderer.mark(panel.rect)
+        if self.overlay.visible:
+            self.renderer.mark(self.overlay.rect)
+        if not self.renderer.has_changes:
+            return False
+
+        for panel in panels:
+            panel.paint(self.screen)
+        self.stats.lap("panels")
+        if self.overlay.visible:
+            self.overlay.draw(self.screen)
+            self.stats.skip()
+        self.renderer.present()
+        self.stats.lap("present")
+        return True
+
+    def process(self, events) -> bool:
+        """Handle one batch of events and draw a frame; False once the player went back"""
+        self.handed_over = False
+        self.stats.begin_frame()
+        for event in events:
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                exit_report(self.scheduler.report())
+                self.stats.close()
+                if self.main_app is not None:
+                    self.main_app.host.close()
+                else:
+                    pygame.quit()
+                    sys.exit()
+            elif event.type == pygame.KEYDOWN and event.key == OVERLAY_KEY:
+                self.overlay.toggle()
+                self.renderer.mark_all()
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                self.handle_click(event.pos)
+                if self.handed_over:
+                    return False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.renderer.mark_all()
+        if self.own_timers:
+            self.timers.run_due()
+        self.stats.lap("events")
+        self.stats.end_frame(self.render_frame())
+        return True
+
+    def busy(self) -> bool:
+        """Whether the next frame has something to draw"""
+        return bool(self.state.changes) or self.renderer.has_changes or self.overlay.visible
+
+    def run(self):
+        """Standalone loop, without the display host; it also wakes for the board's own timers"""
+        while self.process(self.scheduler.poll(self.busy() or bool(self.timers.pending()))):
+            self.scheduler.tick()
+
+
+if __name__ == "__main__":
+    pygame.display.init()
+    pygame.font.init()
+    PygameScoreboard(None).run()
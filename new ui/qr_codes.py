@@ -0,0 +1,68 @@
+import pygame
+from functools import lru_cache
+from typing import TYPE_CHECKING, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Rasterisation of QR module matrices for the pygame cards and the Tk QR window
+
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+
+
+def matrix_key(matrix: Sequence[Sequence[int]]) -> Tuple[Tuple[int, ...], ...]:
+    """Hashable copy of a module matrix (list of rows) for use as a cache key"""
+    return tuple(tuple(int(cell) for cell in row) for row in matrix)
+
+
+def _module_bytes(matrix: Tuple[Tuple[int, ...], ...], dark: int, dark_value: bytes, light_value: bytes) -> bytes:
+    return b"".join(dark_value if cell == dark else light_value for row in matrix for cell in row)
+
+
+@lru_cache(maxsize=32)
+def _qr_surface(matrix, module_size, dark, dark_color, light_color):
+    rows, cols = len(matrix), len(matrix[0])
+    # One pixel per module, then a single nearest-neighbour scale up to the module size
+    pixels = _module_bytes(matrix, dark, bytes(dark_color), bytes(light_color))
+    surface = pygame.image.frombuffer(pixels, (cols, rows), "RGB")
+    surface = pygame.transform.scale(surface, (cols * module_size, rows * module_size))
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    return surface
+
+
+def qr_surface(matrix: Sequence[Sequence[int]], module_size: int, dark: int = 1,
+               dark_color: Tuple[int, int, int] = BLACK,
+               light_color: Tuple[int, int, int] = WHITE) -> pygame.Surface:
+    """Return a pygame surface of the matrix with module_size pixels per module.
+
+    Cells equal to dark are painted dark_color, everything else light_color.
+    Surfaces are cached per matrix, module size and colours, so drawing a QR
+    code is one blit. The returned surface is shared and must not be drawn on.
+    """
+    return _qr_surface(matrix_key(matrix), module_size, dark, tuple(dark_color), tuple(light_color))
+
+
+@lru_cache(maxsize=16)
+def _qr_image(matrix, module_size, dark, size):
+    from PIL import Image  # Imported on first use so the pygame screens start without Pillow
+
+    rows, cols = len(matrix), len(matrix[0])
+    modules = Image.frombytes("L", (cols, rows), _module_bytes(matrix, dark, b"\x00", b"\xff"))
+    modules = modules.resize((cols * module_size, rows * module_size), Image.NEAREST).convert("1")
+    if size is None:
+        return modules
+    image = Image.new("1", size, 1)
+    image.paste(modules, ((size[0] - modules.width) // 2, (size[1] - modules.height) // 2))
+    return image
+
+
+def qr_image(matrix: Sequence[Sequence[int]], module_size: int, dark: int = 1, size=None) -> "Image.Image":
+    """Return a 1-bit PIL image of the matrix with module_size pixels per module.
+
+    With size the modules are centred on a white canvas of that size.
+    Images are cached per matrix, module size and canvas size; copy before
+    modifying the result.
+    """
+    return _qr_image(matrix_key(matrix), module_size, dark, tuple(size) if size is not None else None)
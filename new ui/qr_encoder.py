@@ -0,0 +1,338 @@
+import secrets
+import numpy as np
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+# Byte-mode QR code encoder (versions 1-10) for the PaytoPlay payment codes
+
+PAYMENT_URL = "https://www.samball.io/pay"
+
+# Format bits for each error correction level, as stored in the format information
+EC_LEVEL_BITS = {"L": 1, "M": 0, "Q": 3, "H": 2}
+
+# (EC codewords per block, [(block count, data codewords per block), ...]) per version and level
+EC_BLOCKS: Dict[int, Dict[str, Tuple[int, List[Tuple[int, int]]]]] = {
+    1: {"L": (7, [(1, 19)]), "M": (10, [(1, 16)]), "Q": (13, [(1, 13)]), "H": (17, [(1, 9)])},
+    2: {"L": (10, [(1, 34)]), "M": (16, [(1, 28)]), "Q": (22, [(1, 22)]), "H": (28, [(1, 16)])},
+    3: {"L": (15, [(1, 55)]), "M": (26, [(1, 44)]), "Q": (18, [(2, 17)]), "H": (22, [(2, 13)])},
+    4: {"L": (20, [(1, 80)]), "M": (18, [(2, 32)]), "Q": (26, [(2, 24)]), "H": (16, [(4, 9)])},
+    5: {"L": (26, [(1, 108)]), "M": (24, [(2, 43)]), "Q": (18, [(2, 15), (2, 16)]), "H": (22, [(2, 11), (2, 12)])},
+    6: {"L": (18, [(2, 68)]), "M": (16, [(4, 27)]), "Q": (24, [(4, 19)]), "H": (28, [(4, 15)])},
+    7: {"L": (20, [(2, 78)]), "M": (18, [(4, 31)]), "Q": (18, [(2, 14), (4, 15)]), "H": (26, [(4, 13), (1, 14)])},
+    8: {"L": (24, [(2, 97)]), "M": (22, [(2, 38), (2, 39)]), "Q": (22, [(4, 18), (2, 19)]), "H": (26, [(4, 14), (2, 15)])},
+    9: {"L": (30, [(2, 116)]), "M": (22, [(3, 36), (2, 37)]), "Q": (20, [(4, 16), (4, 17)]), "H": (24, [(4, 12), (4, 13)])},
+    10: {"L": (18, [(2, 68), (2, 69)]), "M": (26, [(4, 43), (1, 44)]), "Q": (24, [(6, 19), (2, 20)]), "H": (28, [(6, 15), (2, 16)])},
+}
+
+ALIGNMENT_POSITIONS = {
+    1: [], 2: [6, 18], 3: [6, 22], 4: [6, 26], 5: [6, 30],
+    6: [6, 34], 7: [6, 22, 38], 8: [6, 24, 42], 9: [6, 26, 46], 10: [6, 28, 50],
+}
+
+MAX_VERSION = max(EC_BLOCKS)
+
+# GF(256) antilog/log tables over the QR primitive polynomial x^8 + x^4 + x^3 + x^2 + 1.
+# GF_EXP is doubled so GF_EXP[a + b] never needs a modulo.
+GF_EXP = [0] * 512
+GF_LOG = [0] * 256
+_value = 1
+for _power in range(255):
+    GF_EXP[_power] = _value
+    GF_LOG[_value] = _power
+    _value <<= 1
+    if _value & 0x100:
+        _value ^= 0x11D
+for _power in range(255, 512):
+    GF_EXP[_power] = GF_EXP[_power - 255]
+
+
+def _generator_polynomial(degree: int) -> List[int]:
+    """Coefficients of (x - a^0)(x - a^1)...(x - a^(degree-1)), highest power first"""
+    poly = [1]
+    for i in range(degree):
+        product = [0] * (len(poly) + 1)
+        for j, coefficient in enumerate(poly):
+            product[j] ^= coefficient
+            if coefficient:
+                product[j + 1] ^= GF_EXP[GF_LOG[coefficient] + i]
+        poly = product
+    return poly
+
+
+# Generator polynomials for every block size in EC_BLOCKS, stored as logs without the leading 1
+RS_GENERATOR_LOGS = {
+    degree: [GF_LOG[c] for c in _generator_polynomial(degree)[1:]]
+    for degree in sorted({levels[level][0] for levels in EC_BLOCKS.values() for level in levels})
+}
+
+
+def _rs_remainder(data: List[int], degree: int) -> List[int]:
+    generator = RS_GENERATOR_LOGS[degree]
+    remainder = [0] * degree
+    for byte in data:
+        factor = byte ^ remainder[0]
+        remainder = remainder[1:] + [0]
+        if factor:
+            factor_log = GF_LOG[factor]
+            for i, coefficient_log in enumerate(generator):
+                remainder[i] ^= GF_EXP[factor_log + coefficient_log]
+    return remainder
+
+
+def _data_capacity(version: int, level: str) -> int:
+    return sum(count * size for count, size in EC_BLOCKS[version][level][1])
+
+
+def _encode_codewords(payload: bytes, version: int, level: str) -> List[int]:
+    """Byte-mode bit stream, padded and interleaved with its error correction codewords"""
+    capacity_bits = _data_capacity(version, level) * 8
+    bits = [0, 1, 0, 0]
+    count_bits = 8 if version < 10 else 16
+    bits += [(len(payload) >> i) & 1 for i in reversed(range(count_bits))]
+    for byte in payload:
+        bits += [(byte >> i) & 1 for i in reversed(range(8))]
+    bits += [0] * min(4, capacity_bits - len(bits))
+    bits += [0] * (-len(bits) % 8)
+
+    data = [int("".join(map(str, bits[i:i + 8])), 2) for i in range(0, len(bits), 8)]
+    pad = 0xEC
+    while len(data) < capacity_bits // 8:
+        data.append(pad)
+        pad ^= 0xEC ^ 0x11
+
+    ec_per_block, groups = EC_BLOCKS[version][level]
+    blocks = []
+    offset = 0
+    for count, size in groups:
+        for _ in range(count):
+            blocks.append(data[offset:offset + size])
+            offset += size
+    ec_blocks = [_rs_remainder(block, ec_per_block) for block in blocks]
+
+    result = []
+    for i in range(max(len(block) for block in blocks)):
+        result += [block[i] for block in blocks if i < len(block)]
+    for i in range(ec_per_block):
+        result += [block[i] for block in ec_blocks]
+    return result
+
+
+def _bch_bits(value: int, value_bits: int, generator: int, generator_degree: int) -> int:
+    remainder = value << generator_degree
+    for shift in reversed(range(value_bits)):
+        if remainder & (1 << (shift + generator_degree)):
+            remainder ^= generator << shift
+    return (value << generator_degree) | remainder
+
+
+@lru_cache(maxsize=None)
+def _function_patterns(version: int):
+    """Finder, timing, alignment and version patterns of a symbol, plus the data module path.
+
+    Returns (modules, reserved, rows, cols). reserved marks every function module
+    including the format areas; rows/cols list the data module positions in
+    placement order. Cached per version, so later codes only fill in data.
+    """
+    size = version * 4 + 17
+    modules = np.zeros((size, size), dtype=bool)
+    reserved = np.zeros((size, size), dtype=bool)
+
+    # Timing patterns
+    modules[6, :] = np.arange(size) % 2 == 0
+    modules[:, 6] = np.arange(size) % 2 == 0
+    reserved[6, :] = True
+    reserved[:, 6] = True
+
+    # Finder patterns with their light separators
+    offsets = np.arange(-4, 5)
+    ring = np.maximum(np.abs(offsets)[:, None], np.abs(offsets)[None, :])
+    finder = (ring != 2) & (ring != 4)
+    for row, col in ((3, 3), (3, size - 4), (size - 4, 3)):
+        top, left = row - 4, col - 4
+        r0, c0 = max(top, 0), max(left, 0)
+        r1, c1 = min(top + 9, size), min(left + 9, size)
+        modules[r0:r1, c0:c1] = finder[r0 - top:r1 - top, c0 - left:c1 - left]
+        reserved[r0:r1, c0:c1] = True
+
+    # Alignment patterns, skipping the three that would overlap a finder
+    alignment = np.maximum(np.abs(offsets[2:7])[:, None], np.abs(offsets[2:7])[None, :]) != 1
+    positions = ALIGNMENT_POSITIONS[version]
+    last = len(positions) - 1
+    for i, row in enumerate(positions):
+        for j, col in enumerate(positions):
+            if (i, j) in ((0, 0), (0, last), (last, 0)):
+                continue
+            modules[row - 2:row + 3, col - 2:col + 3] = alignment
+            reserved[row - 2:row + 3, col - 2:col + 3] = True
+
+    # Format information areas and the dark module
+    reserved[8, :9] = reserved[:9, 8] = True
+    reserved[8, size - 8:] = reserved[size - 8:, 8] = True
+
+    # Version information
+    if version >= 7:
+        bits = _bch_bits(version, 6, 0x1F25, 12)
+        for i in range(18):
+            a, b = size - 11 + i % 3, i // 3
+            modules[b, a] = modules[a, b] = (bits >> i) & 1
+            reserved[b, a] = reserved[a, b] = True
+
+    # Zigzag data path: two-column strips from the right, alternating up and down
+    rows, cols = [], []
+    right = size - 1
+    while right >= 1:
+        if right == 6:
+            right = 5
+        upward = ((right + 1) & 2) == 0
+        for vertical in range(size):
+            row = size - 1 - vertical if upward else vertical
+            for col in (right, right - 1):
+                if not reserved[row, col]:
+                    rows.append(row)
+                    cols.append(col)
+        right -= 2
+
+    modules.setflags(write=False)
+    reserved.setflags(write=False)
+    return modules, reserved, np.array(rows), np.array(cols)
+
+
+@lru_cache(maxsize=None)
+def _mask_patterns(version: int) -> np.ndarray:
+    """The eight data masks for a version as one (8, size, size) boolean array"""
+    size = version * 4 + 17
+    i, j = np.indices((size, size))
+    masks = np.array([
+        (i + j) % 2 == 0,
+        i % 2 == 0,
+        j % 3 == 0,
+        (i + j) % 3 == 0,
+        (i // 2 + j // 3) % 2 == 0,
+        (i * j) % 2 + (i * j) % 3 == 0,
+        ((i * j) % 2 + (i * j) % 3) % 2 == 0,
+        ((i + j) % 2 + (i * j) % 3) % 2 == 0,
+    ])
+    masks &= ~_function_patterns(version)[1]
+    masks.setflags(write=False)
+    return masks
+
+
+def _draw_format_bits(symbols: np.ndarray, level: str):
+    """Write the format information of all eight masks into a (8, size, size) stack"""
+    size = symbols.shape[1]
+    for mask in range(8):
+        bits = _bch_bits(EC_LEVEL_BITS[level] << 3 | mask, 5, 0x537, 10) ^ 0x5412
+        symbol = symbols[mask]
+        for i in range(15):
+            dark = (bits >> i) & 1
+            # Copy around the top-left finder
+            if i < 6:
+                symbol[i, 8] = dark
+            elif i < 8:
+                symbol[i + 1, 8] = dark
+            elif i == 8:
+                symbol[8, 7] = dark
+            else:
+                symbol[8, 14 - i] = dark
+            # Copy split between the top-right and bottom-left finders
+            if i < 8:
+                symbol[8, size - 1 - i] = dark
+            else:
+                symbol[size - 15 + i, 8] = dark
+        symbol[size - 8, 8] = True
+
+
+# 1:1:3:1:1 dark/light runs with four light modules on one side and at least one on the other,
+# as 12-bit codes of a sliding window
+_FINDER_LIKE = (0b010111010000, 0b000010111010)
+
+
+def _penalties(symbols: np.ndarray) -> np.ndarray:
+    """ISO 18004 penalty score of each symbol in a (n, size, size) stack, evaluated together"""
+    count, size, _ = symbols.shape
+    scores = np.zeros(count, dtype=np.int64)
+    lines = np.concatenate([symbols, symbols.transpose(0, 2, 1)], axis=1)
+
+    # Rule 1: runs of five or more same-coloured modules in a row or column.
+    # Every line is padded with -1 so runs never continue into the next line or symbol.
+    values = np.pad(lines.astype(np.int8), ((0, 0), (0, 0), (1, 1)), constant_values=-1).ravel()
+    starts = np.flatnonzero(np.diff(values)) + 1
+    lengths = np.diff(starts)
+    long_runs = (values[starts[:-1]] >= 0) & (lengths >= 5)
+    symbol_index = starts[:-1][long_runs] // (lines.shape[1] * (size + 2))
+    scores += np.bincount(symbol_index, weights=lengths[long_runs] - 2, minlength=count).astype(np.int64)
+
+    # Rule 2: 2x2 blocks of one colour
+    same = ((symbols[:, :-1, :-1] == symbols[:, 1:, :-1]) &
+            (symbols[:, :-1, :-1] == symbols[:, :-1, 1:]) &
+            (symbols[:, :-1, :-1] == symbols[:, 1:, 1:]))
+    scores += 3 * same.sum(axis=(1, 2))
+
+    # Rule 3: finder-like patterns, treating the area outside the symbol as light
+    padded = np.pad(lines, ((0, 0), (0, 0), (4, 4)), constant_values=False).astype(np.int16)
+    width = padded.shape[2] - 11
+    codes = np.zeros(padded.shape[:2] + (width,), dtype=np.int16)
+    for k in range(12):
+        codes = (codes << 1) | padded[:, :, k:k + width]
+    for pattern in _FINDER_LIKE:
+        scores += 40 * (codes == pattern).sum(axis=(1, 2))
+
+    # Rule 4: deviation of the dark proportion from 50%
+    total = size * size
+    dark = symbols.sum(axis=(1, 2))
+    scores += 10 * ((np.abs(dark * 20 - total * 10) + total - 1) // total - 1)
+    return scores
+
+
+def encode(text: str, level: str = "M") -> np.ndarray:
+    """Encode text as a QR code and return its modules as a uint8 matrix (1 = dark).
+
+    Uses byte mode with the smallest version that fits at the requested error
+    correction level and picks the mask with the lowest penalty score. The
+    matrix has no quiet zone; leave four light modules around it when drawing.
+    """
+    payload = text.encode("utf-8")
+    for version in range(1, MAX_VERSION + 1):
+        count_bits = 8 if version < 10 else 16
+        if 4 + count_bits + len(payload) * 8 <= _data_capacity(version, level) * 8:
+            break
+    else:
+        raise ValueError(f"Text too long for a version {MAX_VERSION} QR code: {len(payload)} bytes")
+
+    codewords = np.array(_encode_codewords(payload, version, level), dtype=np.uint8)
+    modules, _, rows, cols = _function_patterns(version)
+    data_bits = np.unpackbits(codewords).astype(bool)
+
+    symbol = modules.copy()
+    symbol[rows[:len(data_bits)], cols[:len(data_bits)]] = data_bits
+
+    # Apply all eight masks at once and keep the one with the lowest penalty
+    symbols = symbol[None, :, :] ^ _mask_patterns(version)
+    _draw_format_bits(symbols, level)
+    best = int(np.argmin(_penalties(symbols)))
+    return symbols[best].astype(np.uint8)
+
+
+def new_payment_session_url(base_url: str = PAYMENT_URL) -> str:
+    """Payment URL with a fresh, unguessable session token for one kiosk session"""
+    return f"{base_url}?session={secrets.token_urlsafe(9)}"
+
+
+if __name__ == "__main__":
+    import time
+
+    # Table sanity check: data + EC codewords must fill every version exactly
+    for version, levels in EC_BLOCKS.items():
+        size = version * 4 + 17
+        raw_bits = int((~_function_patterns(version)[1]).sum())
+        for level, (ec, groups) in levels.items():
+            blocks = sum(count for count, _ in groups)
+            assert _data_capacity(version, level) + ec * blocks == raw_bits // 8, (version, level)
+
+    url = new_payment_session_url()
+    encode(url)
+    start = time.perf_counter()
+    for _ in range(100):
+        matrix = encode(new_payment_session_url())
+    elapsed = (time.perf_counter() - start) / 100
+    print(f"{url} -> {matrix.shape[0]}x{matrix.shape[0]} modules, {elapsed * 1000:.2f} ms per code")
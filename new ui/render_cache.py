@@ -0,0 +1,138 @@
+import pygame
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+# Render caches shared by the pygame menus (main_menu, scorecard, Gamemode UI, tablesoccer v7)
+
+
+class BackgroundCache:
+    """Keeps a pre-rendered copy of a static screen background.
+
+    The painter draws the background once into an offscreen surface which is
+    then converted to the display format, so every frame only needs one blit.
+    The cached surface is rebuilt whenever the screen size, pixel depth or
+    palette changes.
+    """
+
+    def __init__(self, painter: Callable[[pygame.Surface, Tuple], None]):
+        self.painter = painter
+        self.surface: Optional[pygame.Surface] = None
+        self.key = None
+        self.builds = 0
+
+    def get(self, screen: pygame.Surface, palette: Tuple) -> pygame.Surface:
+        key = (screen.get_size(), screen.get_bitsize(), tuple(palette))
+        if key != self.key:
+            surface = pygame.Surface(screen.get_size())
+            self.painter(surface, palette)
+            # Match the display format so the per-frame blit is a plain copy
+            self.surface = surface.convert(screen)
+            self.key = key
+            self.builds += 1
+        return self.surface
+
+    def invalidate(self):
+        """Force the background to be repainted on the next get()"""
+        self.surface = None
+        self.key = None
+
+
+class TextSurfaceCache:
+    """LRU cache of rendered text surfaces.
+
+    render() takes the same arguments as pygame.font.Font.render with the font
+    in front, and only rasterises a string the first time a given font, size,
+    text, colour, antialias and background combination is seen. Entries are
+    evicted least-recently-used first once the cached pixel data exceeds
+    max_bytes. Cached surfaces are shared, so callers must not draw on them.
+    """
+
+    def __init__(self, max_bytes: int = 4 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color, background=None) -> pygame.Surface:
+        # Font objects are keyed by identity; the height keeps different sizes apart
+        key = (font, font.get_height(), text, tuple(color), antialias,
+               tuple(background) if background is not None else None)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        size = self._surface_bytes(surface)
+        if size <= self.max_bytes:
+            self.entries[key] = surface
+            self.bytes_used += size
+            self._evict()
+        return surface
+
+    def _evict(self):
+        while self.bytes_used > self.max_bytes and self.entries:
+            _, surface = self.entries.popitem(last=False)
+            self.bytes_used -= self._surface_bytes(surface)
+            self.evictions += 1
+
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes_used = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.bytes_used,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class VariantSurfaceCache:
+    """Pre-composed surfaces for a widget that switches between a few looks.
+
+    A menu card only ever differs between its selected and unselected border,
+    so each look is painted once into an offscreen surface and drawing the
+    card becomes a single blit. key describes everything the painted content
+    depends on (title, subtitle, size); when it changes all variants are
+    dropped and repainted on demand.
+    """
+
+    def __init__(self):
+        self.key = None
+        self.variants = {}
+        self.builds = 0
+
+    def get(self, key, variant, screen: pygame.Surface, size: Tuple[int, int],
+            painter: Callable[[pygame.Surface], None]) -> pygame.Surface:
+        if key != self.key:
+            self.variants = {}
+            self.key = key
+        surface = self.variants.get(variant)
+        if surface is None:
+            surface = pygame.Surface(size)
+            painter(surface)
+            surface = surface.convert(screen)
+            self.variants[variant] = surface
+            self.builds += 1
+        return surface
+
+    def invalidate(self):
+        self.key = None
+        self.variants = {}
+
+
+# Shared by every menu in the process so repeated strings are rasterised once
+text_cache = TextSurfaceCache()
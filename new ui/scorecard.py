@@ -1,42 +1,59 @@
 import pygame
 import tkinter as tk
 from tkinter import ttk
-import threading
-import time
+import math
 import sys
+import time
 from typing import List, Tuple
+from render_cache import BackgroundCache, VariantSurfaceCache, text_cache
+from dirty_rects import DirtyRectRenderer
+from idle_scheduler import IdleScheduler
+from frame_stats import FrameStats, FrameStatsOverlay, OVERLAY_KEY
+from exit_report import exit_report
+from assets import assets
+from display_host import DisplayHost
+from update_scheduler import UpdateScheduler
+from game_clock import TENTHS_BELOW_SECONDS, GameClock
 
 class GameApplication:
-    def __init__(self):
+    def __init__(self, now=time.monotonic):
         self.current_screen = "rumbleverse"  # "rumbleverse" or "volleyball"
+        # One window for the whole session; screens are swapped inside it instead of quitting pygame or Tk
+        self.host = DisplayHost(SCREEN_WIDTH, SCREEN_HEIGHT, "RumbleVerse")
         self.rumbleverse_app = None
         self.volleyball_app = None
+        self.now = now  # what the scoreboard's clock reads the time from
         
     def start_rumbleverse(self):
         self.current_screen = "rumbleverse"
-        self.rumbleverse_app = RumbleVerseUI(self)
-        self.rumbleverse_app.run()
+        # The menu is built once and kept; showing it again only redraws it
+        if self.rumbleverse_app is None:
+            self.rumbleverse_app = RumbleVerseUI(self)
+        self.host.show_pygame(self.rumbleverse_app, "rumbleverse")
         
     def start_volleyball(self):
         self.current_screen = "volleyball"
-        if self.rumbleverse_app:
-            pygame.quit()
-        self.volleyball_app = VolleyballScoreboard(self)
-        self.volleyball_app.run()
+        self.volleyball_app = self.host.show("volleyball", lambda frame: VolleyballScoreboard(self, frame, self.now))
         
     def back_to_rumbleverse(self):
-        if self.volleyball_app:
-            self.volleyball_app.root.destroy()
-        pygame.init()
         self.start_rumbleverse()
+        
+    def run(self):
+        pygame.display.init()
+        pygame.font.init()
+        self.start_rumbleverse()
+        self.host.run()
 
 # RumbleVerse Game Mode Selection (Modified)
-pygame.init()
 
 # Constants for RumbleVerse
 SCREEN_WIDTH = 1400
 SCREEN_HEIGHT = 800
 FPS = 60
+DIRTY_RECT_RENDERING = True  # Only push changed regions instead of flipping every frame
+IDLE_MODE = True  # Block on input instead of polling while nothing needs redrawing
+IDLE_FPS = 5
+IDLE_AFTER_SECONDS = 30
 
 # Colors
 PURPLE_DARK = (45, 25, 85)
@@ -59,65 +76,95 @@ class GameModeCard:
         self.border_color = border_color if not is_selected else ORANGE
         self.is_selected = is_selected
         self.border_width = 4 if is_selected else 2
+        self.surface_cache = VariantSurfaceCache()
+        self.bounds = self.rect.copy()  # Card plus any overflowing text, for dirty rects
         
     def draw(self, screen: pygame.Surface, font_large: pygame.font.Font, font_small: pygame.font.Font):
-        # Draw card background
-        pygame.draw.rect(screen, self.color, self.rect)
-        pygame.draw.rect(screen, self.border_color, self.rect, self.border_width)
+        # The card is composed once per look; selection only swaps which surface is blitted
+        key = (self.title, self.subtitle, self.rect.size, font_large.get_height(), font_small.get_height())
+        variant = (self.is_selected, self.border_color, self.border_width)
+        surface = self.surface_cache.get(key, variant, screen, self.rect.size,
+                                         lambda card: self.paint(card, font_large, font_small))
+        screen.blit(surface, self.rect)
+        
+        # Text wider than the card spills onto the background, so it can't live on the card surface
+        self.bounds = self.rect.copy()
+        for label_surface, label_rect in self.labels(self.rect, font_large, font_small):
+            if not self.rect.contains(label_rect):
+                screen.blit(label_surface, label_rect)
+                self.bounds.union_ip(label_rect)
+        
+    def labels(self, rect: pygame.Rect, font_large: pygame.font.Font, font_small: pygame.font.Font):
+        title_surface = text_cache.render(font_large, self.title, True, WHITE)
+        title_rect = title_surface.get_rect(center=(rect.centerx, rect.bottom - 80))
+        subtitle_surface = text_cache.render(font_small, self.subtitle, True, GRAY)
+        subtitle_rect = subtitle_surface.get_rect(center=(rect.centerx, rect.bottom - 50))
+        return [(title_surface, title_rect), (subtitle_surface, subtitle_rect)]
+        
+    def paint(self, surface: pygame.Surface, font_large: pygame.font.Font, font_small: pygame.font.Font):
+        rect = surface.get_rect()
         
-        # Draw title
-        title_surface = font_large.render(self.title, True, WHITE)
-        title_rect = title_surface.get_rect(center=(self.rect.centerx, self.rect.bottom - 80))
-        screen.blit(title_surface, title_rect)
+        # Draw card background
+        pygame.draw.rect(surface, self.color, rect)
+        pygame.draw.rect(surface, self.border_color, rect, self.border_width)
         
-        # Draw subtitle
-        subtitle_surface = font_small.render(self.subtitle, True, GRAY)
-        subtitle_rect = subtitle_surface.get_rect(center=(self.rect.centerx, self.rect.bottom - 50))
-        screen.blit(subtitle_surface, subtitle_rect)
+        # Draw title and subtitle
+        for label_surface, label_rect in self.labels(rect, font_large, font_small):
+            if rect.contains(label_rect):
+                surface.blit(label_surface, label_rect)
         
         # Draw character placeholder (simplified representation)
-        char_rect = pygame.Rect(self.rect.x + 20, self.rect.y + 20, self.rect.width - 40, self.rect.height - 120)
-        pygame.draw.rect(screen, PURPLE_DARK, char_rect)
+        char_rect = pygame.Rect(rect.x + 20, rect.y + 20, rect.width - 40, rect.height - 120)
+        pygame.draw.rect(surface, PURPLE_DARK, char_rect)
         
         # Add some visual elements to represent characters
         if self.title == "Solo":
-            pygame.draw.circle(screen, WHITE, (char_rect.centerx, char_rect.centery - 20), 30)
-            pygame.draw.circle(screen, BLACK, (char_rect.centerx - 10, char_rect.centery - 30), 5)
-            pygame.draw.circle(screen, BLACK, (char_rect.centerx + 10, char_rect.centery - 30), 5)
+            pygame.draw.circle(surface, WHITE, (char_rect.centerx, char_rect.centery - 20), 30)
+            pygame.draw.circle(surface, BLACK, (char_rect.centerx - 10, char_rect.centery - 30), 5)
+            pygame.draw.circle(surface, BLACK, (char_rect.centerx + 10, char_rect.centery - 30), 5)
             # Add volleyball indicator for Solo mode
-            pygame.draw.circle(screen, (255, 215, 0), (char_rect.centerx, char_rect.centery + 20), 15)
-            pygame.draw.arc(screen, WHITE, (char_rect.centerx - 15, char_rect.centery + 5, 30, 30), 0.5, 2.5, 3)
+            pygame.draw.circle(surface, (255, 215, 0), (char_rect.centerx, char_rect.centery + 20), 15)
+            pygame.draw.arc(surface, WHITE, (char_rect.centerx - 15, char_rect.centery + 5, 30, 30), 0.5, 2.5, 3)
         elif self.title == "Duo":
-            pygame.draw.circle(screen, WHITE, (char_rect.centerx - 25, char_rect.centery), 25)
-            pygame.draw.circle(screen, CYAN, (char_rect.centerx + 25, char_rect.centery), 25)
+            pygame.draw.circle(surface, WHITE, (char_rect.centerx - 25, char_rect.centery), 25)
+            pygame.draw.circle(surface, CYAN, (char_rect.centerx + 25, char_rect.centery), 25)
         elif self.title == "Trio":
-            pygame.draw.circle(screen, WHITE, (char_rect.centerx - 30, char_rect.centery - 10), 20)
-            pygame.draw.circle(screen, CYAN, (char_rect.centerx, char_rect.centery + 10), 20)
-            pygame.draw.circle(screen, ORANGE, (char_rect.centerx + 30, char_rect.centery - 10), 20)
+            pygame.draw.circle(surface, WHITE, (char_rect.centerx - 30, char_rect.centery - 10), 20)
+            pygame.draw.circle(surface, CYAN, (char_rect.centerx, char_rect.centery + 10), 20)
+            pygame.draw.circle(surface, ORANGE, (char_rect.centerx + 30, char_rect.centery - 10), 20)
         elif self.title == "Quad":
-            pygame.draw.circle(screen, WHITE, (char_rect.centerx - 25, char_rect.centery - 15), 18)
-            pygame.draw.circle(screen, CYAN, (char_rect.centerx + 25, char_rect.centery - 15), 18)
-            pygame.draw.circle(screen, ORANGE, (char_rect.centerx - 25, char_rect.centery + 15), 18)
-            pygame.draw.circle(screen, (255, 100, 255), (char_rect.centerx + 25, char_rect.centery + 15), 18)
+            pygame.draw.circle(surface, WHITE, (char_rect.centerx - 25, char_rect.centery - 15), 18)
+            pygame.draw.circle(surface, CYAN, (char_rect.centerx + 25, char_rect.centery - 15), 18)
+            pygame.draw.circle(surface, ORANGE, (char_rect.centerx - 25, char_rect.centery + 15), 18)
+            pygame.draw.circle(surface, (255, 100, 255), (char_rect.centerx + 25, char_rect.centery + 15), 18)
         elif self.title == "Playground":
             # Draw city silhouette
             for i in range(5):
                 building_height = 40 + (i * 15) % 60
-                pygame.draw.rect(screen, CYAN, 
+                pygame.draw.rect(surface, CYAN, 
                                (char_rect.x + i * 30, char_rect.bottom - building_height, 25, building_height))
 
 class RumbleVerseUI:
     def __init__(self, main_app):
         self.main_app = main_app
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Draw into the application's persistent window when there is one
+        if main_app is not None:
+            self.screen = main_app.host.display()
+        else:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("RumbleVerse - Game Mode Selection")
         self.clock = pygame.time.Clock()
+        self.background_cache = BackgroundCache(self.paint_background)
+        self.renderer = DirtyRectRenderer(DIRTY_RECT_RENDERING)
+        self.scheduler = IdleScheduler(self.clock, FPS, IDLE_FPS, IDLE_AFTER_SECONDS, IDLE_MODE)
+        self.stats = FrameStats.from_environment()
+        self.overlay = FrameStatsOverlay(self.stats)
         
         # Fonts
-        self.font_title = pygame.font.Font(None, 72)
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 36)
-        self.font_small = pygame.font.Font(None, 24)
+        self.font_title = assets.font(72)
+        self.font_large = assets.font(48)
+        self.font_medium = assets.font(36)
+        self.font_small = assets.font(24)
         
         # Game mode cards
         card_width = 220
@@ -138,14 +185,16 @@ class RumbleVerseUI:
         
         self.selected_mode = 0
         
-    def draw_background(self):
+    def paint_background(self, surface: pygame.Surface, palette):
+        width, height = surface.get_size()
+        dark, light = palette
         # Create gradient background
-        for y in range(SCREEN_HEIGHT):
-            color_ratio = y / SCREEN_HEIGHT
-            r = int(PURPLE_DARK[0] + (PURPLE_LIGHT[0] - PURPLE_DARK[0]) * color_ratio)
-            g = int(PURPLE_DARK[1] + (PURPLE_LIGHT[1] - PURPLE_DARK[1]) * color_ratio)
-            b = int(PURPLE_DARK[2] + (PURPLE_LIGHT[2] - PURPLE_DARK[2]) * color_ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        for y in range(height):
+            color_ratio = y / height
+            r = int(dark[0] + (light[0] - dark[0]) * color_ratio)
+            g = int(dark[1] + (light[1] - dark[1]) * color_ratio)
+            b = int(dark[2] + (light[2] - dark[2]) * color_ratio)
+            pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
         
         # Draw some background elements (simplified city silhouette)
         for i in range(20):
@@ -153,14 +202,19 @@ class RumbleVerseUI:
             building_height = 100 + (i * 23) % 200
             building_width = 50 + (i * 17) % 30
             color_variation = 20 + (i * 13) % 40
-            building_color = (PURPLE_DARK[0] + color_variation, 
-                            PURPLE_DARK[1] + color_variation, 
-                            PURPLE_DARK[2] + color_variation)
-            pygame.draw.rect(self.screen, building_color, 
-                           (building_x, SCREEN_HEIGHT - building_height, building_width, building_height))
+            building_color = (dark[0] + color_variation, 
+                            dark[1] + color_variation, 
+                            dark[2] + color_variation)
+            pygame.draw.rect(surface, building_color, 
+                           (building_x, height - building_height, building_width, building_height))
+    
+    def draw_background(self):
+        # Static gradient and skyline are painted once and reused every frame
+        background = self.background_cache.get(self.screen, (PURPLE_DARK, PURPLE_LIGHT))
+        self.screen.blit(background, (0, 0))
     
     def draw_title(self):
-        title_surface = self.font_title.render("Game Modes", True, CYAN)
+        title_surface = text_cache.render(self.font_title, "Game Modes", True, CYAN)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         self.screen.blit(title_surface, title_rect)
         
@@ -169,7 +223,7 @@ class RumbleVerseUI:
         pygame.draw.line(self.screen, CYAN, (50, line_y), (SCREEN_WIDTH - 50, line_y), 2)
         
         # Add instruction text
-        instruction_surface = self.font_small.render("Click SOLO to open Foosball Scoreboard", True, WHITE)
+        instruction_surface = text_cache.render(self.font_small, "Click SOLO to open Foosball Scoreboard", True, WHITE)
         instruction_rect = instruction_surface.get_rect(center=(SCREEN_WIDTH // 2, 140))
         self.screen.blit(instruction_surface, instruction_rect)
     
@@ -189,35 +243,39 @@ class RumbleVerseUI:
             pygame.draw.rect(self.screen, WHITE, key_rect, 2)
             
             # Draw key text
-            key_surface = self.font_small.render(key, True, BLACK)
+            key_surface = text_cache.render(self.font_small, key, True, BLACK)
             key_text_rect = key_surface.get_rect(center=key_rect.center)
             self.screen.blit(key_surface, key_text_rect)
             
             # Draw action text
-            action_surface = self.font_small.render(action, True, WHITE)
+            action_surface = text_cache.render(self.font_small, action, True, WHITE)
             self.screen.blit(action_surface, (x_pos + 70, SCREEN_HEIGHT - 55))
             
             x_pos += 250
     
+    def select_mode(self, index):
+        # Deselect current
+        previous = self.game_modes[self.selected_mode]
+        previous.is_selected = False
+        previous.border_color = WHITE
+        previous.border_width = 2
+        self.renderer.mark(previous.bounds)
+        
+        # Select new
+        self.selected_mode = index
+        mode = self.game_modes[index]
+        mode.is_selected = True
+        mode.border_color = ORANGE
+        mode.border_width = 4
+        self.renderer.mark(mode.bounds)
+    
     def handle_input(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_LEFT and self.selected_mode > 0:
-                self.game_modes[self.selected_mode].is_selected = False
-                self.game_modes[self.selected_mode].border_color = WHITE
-                self.game_modes[self.selected_mode].border_width = 2
-                self.selected_mode -= 1
-                self.game_modes[self.selected_mode].is_selected = True
-                self.game_modes[self.selected_mode].border_color = ORANGE
-                self.game_modes[self.selected_mode].border_width = 4
+                self.select_mode(self.selected_mode - 1)
                 
             elif event.key == pygame.K_RIGHT and self.selected_mode < len(self.game_modes) - 1:
-                self.game_modes[self.selected_mode].is_selected = False
-                self.game_modes[self.selected_mode].border_color = WHITE
-                self.game_modes[self.selected_mode].border_width = 2
-                self.selected_mode += 1
-                self.game_modes[self.selected_mode].is_selected = True
-                self.game_modes[self.selected_mode].border_color = ORANGE
-                self.game_modes[self.selected_mode].border_width = 4
+                self.select_mode(self.selected_mode + 1)
                 
             elif event.key == pygame.K_RETURN:
                 selected_mode = self.game_modes[self.selected_mode].title
@@ -227,19 +285,10 @@ class RumbleVerseUI:
                     return False  # Exit pygame loop
                 
         elif event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
             for i, mode in enumerate(self.game_modes):
                 if mode.rect.collidepoint(mouse_pos):
-                    # Deselect current
-                    self.game_modes[self.selected_mode].is_selected = False
-                    self.game_modes[self.selected_mode].border_color = WHITE
-                    self.game_modes[self.selected_mode].border_width = 2
-                    
-                    # Select new
-                    self.selected_mode = i
-                    mode.is_selected = True
-                    mode.border_color = ORANGE
-                    mode.border_width = 4
+                    self.select_mode(i)
                     
                     # If Solo is clicked, open volleyball scoreboard
                     if mode.title == "Solo":
@@ -249,46 +298,100 @@ class RumbleVerseUI:
                     break
         return True
     
-    def run(self):
-        running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        running = False
-                    else:
-                        if not self.handle_input(event):
-                            return  # Exit to volleyball
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if not self.handle_input(event):
-                        return  # Exit to volleyball
-            
+    def render_frame(self):
+        if self.overlay.visible:
+            self.renderer.mark(self.overlay.rect)
+        if not self.renderer.has_changes:
+            return False
+        
+        if self.renderer.needs_full_redraw:
             # Draw everything
             self.draw_background()
             self.draw_title()
+            self.stats.lap("background")
             
             # Draw game mode cards
             for mode in self.game_modes:
                 mode.draw(self.screen, self.font_large, self.font_medium)
+            self.stats.lap("cards")
             
             self.draw_bottom_ui()
-            
-            pygame.display.flip()
-            self.clock.tick(FPS)
-        
-        pygame.quit()
-        sys.exit()
+            self.stats.lap("bottom_ui")
+        else:
+            # Restore the background under each changed region, then redraw the cards on it
+            background = self.background_cache.get(self.screen, (PURPLE_DARK, PURPLE_LIGHT))
+            for rect in self.renderer.rects:
+                self.screen.blit(background, rect, rect)
+            self.stats.lap("background")
+            for mode in self.game_modes:
+                if mode.bounds.collidelist(self.renderer.rects) != -1:
+                    mode.draw(self.screen, self.font_large, self.font_medium)
+            self.stats.lap("cards")
+        
+        if self.overlay.visible:
+            self.overlay.draw(self.screen)
+            self.stats.skip()
+        self.renderer.present()
+        self.stats.lap("present")
+        return True
+    
+    def process(self, events):
+        """Handle one batch of events and draw a frame; False once the screen has handed over"""
+        self.stats.begin_frame()
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.quit()
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    self.quit()
+                elif event.key == OVERLAY_KEY:
+                    self.overlay.toggle()
+                    self.renderer.mark_all()
+                else:
+                    if not self.handle_input(event):
+                        return False  # Exit to volleyball
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if not self.handle_input(event):
+                    return False  # Exit to volleyball
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.renderer.mark_all()
+        
+        self.stats.lap("events")
+        self.stats.end_frame(self.render_frame())
+        return True
+    
+    def busy(self):
+        """Whether the next frame has something to draw"""
+        return self.renderer.has_changes or self.overlay.visible
+    
+    def run(self):
+        while self.process(self.scheduler.poll(self.busy())):
+            self.scheduler.tick()
+    
+    def quit(self):
+        exit_report(self.scheduler.report(), assets.report())
+        self.stats.close()
+        if self.main_app is not None:
+            # The host destroys the Tk root and its pending after() calls, then quits pygame
+            self.main_app.host.close()
+        else:
+            pygame.quit()
+            sys.exit()
 
 # Volleyball Scoreboard Application (Modified)
 class VolleyballScoreboard:
-    def __init__(self, main_app):
+    def __init__(self, main_app, parent=None, now=time.monotonic):
         self.main_app = main_app
-        self.root = tk.Tk()
-        self.root.title("Foosball Scoreboard")
-        self.root.geometry("1200x800")
-        self.root.configure(bg='#1e3a5f')
+        if parent is None:
+            # Standalone window; under the display host the screen is built into a page of its root
+            self.root = tk.Tk()
+            self.root.title("Foosball Scoreboard")
+            self.root.geometry("1200x800")
+            self.root.configure(bg='#1e3a5f')
+            parent = self.root
+        else:
+            self.root = parent.winfo_toplevel()
+        self.parent = parent
         
         # Game state variables
         self.home_score = tk.IntVar(value=0)
@@ -304,13 +407,19 @@ class VolleyballScoreboard:
         self.game_minutes = tk.IntVar(value=15)
         self.game_seconds = tk.IntVar(value=0)
         self.timer_running = False
-        self.timer_thread = None
+        self.tick_id = None  # the one pending after() that ticks the running clock
+        # The time left is kept by the clock, read from now; game_minutes and game_seconds follow it
+        # in whole seconds
+        self.clock = GameClock(15, 0, now=now, tenths_below=TENTHS_BELOW_SECONDS)
+        
+        # Writes to the variables and labels above go through this and reach Tk once per idle moment
+        self.updates = UpdateScheduler(self.root)
         
         self.setup_ui()
         
     def setup_ui(self):
         # Create main container
-        main_frame = tk.Frame(self.root, bg='#1e3a5f')
+        main_frame = tk.Frame(self.parent, bg='#1e3a5f')
         main_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Header section
@@ -579,13 +688,14 @@ class VolleyballScoreboard:
         
         minutes_frame = tk.Frame(time_frame, bg='#666666', relief='raised', bd=2)
         minutes_frame.pack(side='left', padx=(0, 5))
-        self.minutes_label = tk.Label(minutes_frame, textvariable=self.game_minutes, 
+        self.minutes_label = tk.Label(minutes_frame, text="15", 
                                     font=('Arial', 24, 'bold'), fg='white', bg='#666666', 
                                     padx=15, pady=10)
         self.minutes_label.pack()
         
-        tk.Label(time_frame, text=":", font=('Arial', 24, 'bold'), 
-                fg='white', bg='#4a6fa5').pack(side='left')
+        self.separator_label = tk.Label(time_frame, text=":", font=('Arial', 24, 'bold'), 
+                                       fg='white', bg='#4a6fa5')
+        self.separator_label.pack(side='left')
         
         seconds_frame = tk.Frame(time_frame, bg='#666666', relief='raised', bd=2)
         seconds_frame.pack(side='left', padx=(5, 0))
@@ -593,6 +703,9 @@ class VolleyballScoreboard:
                                     font=('Arial', 24, 'bold'), fg='white', bg='#666666', 
                                     padx=15, pady=10)
         self.seconds_label.pack()
+        # Each label is only reconfigured when its own text changes; see update_clock_display
+        self.clock_labels = (self.minutes_label, self.separator_label, self.seconds_label)
+        self.clock_texts = ("15", ":", "00")
         
         # Reset button
         reset_canvas = tk.Canvas(clock_container, width=60, height=60, bg='white', highlightthickness=0)
@@ -625,48 +738,48 @@ class VolleyballScoreboard:
     # Game logic methods
     def change_score(self, team, delta):
         if team == 'HOME':
-            new_score = max(0, self.home_score.get() + delta)
-            self.home_score.set(new_score)
+            new_score = max(0, self.updates.get(self.home_score) + delta)
+            self.updates.set(self.home_score, new_score)
         else:
-            new_score = max(0, self.away_score.get() + delta)
-            self.away_score.set(new_score)
+            new_score = max(0, self.updates.get(self.away_score) + delta)
+            self.updates.set(self.away_score, new_score)
             
     def change_sets(self, team, delta):
         if team == 'HOME':
-            new_sets = max(0, self.home_sets.get() + delta)
-            self.home_sets.set(new_sets)
+            new_sets = max(0, self.updates.get(self.home_sets) + delta)
+            self.updates.set(self.home_sets, new_sets)
         else:
-            new_sets = max(0, self.away_sets.get() + delta)
-            self.away_sets.set(new_sets)
+            new_sets = max(0, self.updates.get(self.away_sets) + delta)
+            self.updates.set(self.away_sets, new_sets)
             
     def change_timeouts(self, team, delta):
         if team == 'HOME':
-            new_timeouts = max(0, min(3, self.home_timeouts.get() + delta))
-            self.home_timeouts.set(new_timeouts)
+            new_timeouts = max(0, min(3, self.updates.get(self.home_timeouts) + delta))
+            self.updates.set(self.home_timeouts, new_timeouts)
         else:
-            new_timeouts = max(0, min(3, self.away_timeouts.get() + delta))
-            self.away_timeouts.set(new_timeouts)
+            new_timeouts = max(0, min(3, self.updates.get(self.away_timeouts) + delta))
+            self.updates.set(self.away_timeouts, new_timeouts)
             
     def change_serve(self, team):
-        self.serve_side.set(team)
+        self.updates.set(self.serve_side, team)
         print(f"Serve changed to {team}")
         
     def next_set(self):
-        current = self.current_set.get()
+        current = self.updates.get(self.current_set)
         if current < 5:
-            self.current_set.set(current + 1)
+            self.updates.set(self.current_set, current + 1)
             self.update_set_label()
             
     def prev_set(self):
-        current = self.current_set.get()
+        current = self.updates.get(self.current_set)
         if current > 1:
-            self.current_set.set(current - 1)
+            self.updates.set(self.current_set, current - 1)
             self.update_set_label()
             
     def update_set_label(self):
-        set_num = self.current_set.get()
+        set_num = self.updates.get(self.current_set)
         ordinals = ["", "1st", "2nd", "3rd", "4th", "5th"]
-        self.set_label.config(text=f"{ordinals[set_num]} Set")
+        self.updates.configure(self.set_label, text=f"{ordinals[set_num]} Set")
         
     def sound_horn(self, event):
         print("Horn sounded!")
@@ -679,36 +792,51 @@ class VolleyballScoreboard:
             self.start_timer()
             
     def start_timer(self):
-        if not self.timer_running:
+        if not self.timer_running and self.clock.start():
             self.timer_running = True
-            self.timer_thread = threading.Thread(target=self.run_timer)
-            self.timer_thread.daemon = True
-            self.timer_thread.start()
+            self.schedule_tick()
             
     def stop_timer(self):
         self.timer_running = False
-        
-    def run_timer(self):
-        while self.timer_running:
-            time.sleep(1)
-            if self.timer_running:
-                current_seconds = self.game_seconds.get()
-                current_minutes = self.game_minutes.get()
+        if self.clock.pause():
+            # The tick for a change just before the stop may still be waiting; show where it stopped
+            self.update_clock_display()
+        if self.tick_id is not None:
+            self.root.after_cancel(self.tick_id)
+            self.tick_id = None
+        
+    def schedule_tick(self):
+        # Called on the Tk thread only; wakes up when the shown second changes, and never twice
+        if self.tick_id is not None:
+            self.root.after_cancel(self.tick_id)
+            self.tick_id = None
+        delay = self.clock.next_refresh()
+        if delay is not None:
+            self.tick_id = self.root.after(max(1, math.ceil(delay * 1000)), self.count_down)
                 
-                if current_seconds > 0:
-                    self.game_seconds.set(current_seconds - 1)
-                elif current_minutes > 0:
-                    self.game_minutes.set(current_minutes - 1)
-                    self.game_seconds.set(59)
-                else:
-                    self.timer_running = False
-                    
-                # Update seconds display
-                self.root.after(0, self.update_seconds_display)
-                
-    def update_seconds_display(self):
-        seconds = self.game_seconds.get()
-        self.seconds_label.config(text=f"{seconds:02d}")
+    def count_down(self):
+        """Show the time left on the clock, stopping the timer at zero"""
+        self.tick_id = None
+        if self.clock.update():
+            self.timer_running = False
+        minutes, seconds = self.clock.display()
+        self.updates.set(self.game_minutes, minutes)
+        self.updates.set(self.game_seconds, seconds)
+        self.update_clock_display()
+        if self.timer_running:
+            self.schedule_tick()
+        
+    def update_clock_display(self):
+        """Redraw the clock labels whose text changed: minutes:seconds, or seconds.tenths at the end"""
+        minutes, seconds, tenths = self.clock.shown()
+        if tenths is None:
+            texts = (str(minutes), ":", f"{seconds:02d}")
+        else:
+            texts = (str(minutes * 60 + seconds), ".", str(tenths))
+        for label, text, shown in zip(self.clock_labels, texts, self.clock_texts):
+            if text != shown:
+                self.updates.configure(label, text=text)
+        self.clock_texts = texts
         
     def reset_timer(self, event):
         self.stop_timer()
@@ -716,25 +844,25 @@ class VolleyballScoreboard:
         
     def set_timer(self, minutes, seconds):
         self.stop_timer()
-        self.game_minutes.set(minutes)
-        self.game_seconds.set(seconds)
-        self.update_seconds_display()
+        self.clock.set(minutes, seconds)
+        self.updates.set(self.game_minutes, minutes)
+        self.updates.set(self.game_seconds, seconds)
+        self.update_clock_display()
         
     def reset_game(self):
         self.stop_timer()
-        self.home_score.set(0)
-        self.away_score.set(0)
-        self.home_sets.set(0)
-        self.away_sets.set(0)
-        self.home_timeouts.set(2)
-        self.away_timeouts.set(2)
-        self.current_set.set(1)
+        self.updates.set(self.home_score, 0)
+        self.updates.set(self.away_score, 0)
+        self.updates.set(self.home_sets, 0)
+        self.updates.set(self.away_sets, 0)
+        self.updates.set(self.home_timeouts, 2)
+        self.updates.set(self.away_timeouts, 2)
+        self.updates.set(self.current_set, 1)
         self.update_set_label()
         self.set_timer(15, 0)
         
     def back_to_rumbleverse(self):
         self.stop_timer()
-        self.root.destroy()
         self.main_app.back_to_rumbleverse()
         
     def run(self):
@@ -744,6 +872,7 @@ class VolleyballScoreboard:
         
     def on_closing(self):
         self.stop_timer()
+        exit_report(self.updates.report())
         self.root.destroy()
         sys.exit()
 
@@ -757,4 +886,4 @@ if __name__ == "__main__":
     print("=====================================")
     
     app = GameApplication()
-    app.start_rumbleverse()
+    app.run()
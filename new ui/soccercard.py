@@ -1,10 +1,13 @@
 import tkinter as tk
 from tkinter import ttk
-import threading
+import math
 import time
+from update_scheduler import UpdateScheduler
+from exit_report import exit_report
+from game_clock import TENTHS_BELOW_SECONDS, GameClock
 
 class foosballScoreboard:
-    def __init__(self):
+    def __init__(self, now=time.monotonic):
         self.root = tk.Tk()
         self.root.title("TableSoccer Scoreboard")
         self.root.geometry("1200x800")
@@ -24,7 +27,13 @@ class foosballScoreboard:
         self.game_minutes = tk.IntVar(value=15)
         self.game_seconds = tk.IntVar(value=0)
         self.timer_running = False
-        self.timer_thread = None
+        self.tick_id = None  # the one pending after() that ticks the running clock
+        # The time left is kept by the clock, read from now; game_minutes and game_seconds follow it
+        # in whole seconds
+        self.clock = GameClock(15, 0, now=now, tenths_below=TENTHS_BELOW_SECONDS)
+        
+        # Writes to the variables and labels above go through this and reach Tk once per idle moment
+        self.updates = UpdateScheduler(self.root)
         
         self.setup_ui()
         
@@ -297,13 +306,14 @@ class foosballScoreboard:
         
         minutes_frame = tk.Frame(time_frame, bg='#666666', relief='raised', bd=2)
         minutes_frame.pack(side='left', padx=(0, 5))
-        self.minutes_label = tk.Label(minutes_frame, textvariable=self.game_minutes, 
+        self.minutes_label = tk.Label(minutes_frame, text="15", 
                                     font=('Arial', 24, 'bold'), fg='white', bg='#666666', 
                                     padx=15, pady=10)
         self.minutes_label.pack()
         
-        tk.Label(time_frame, text=":", font=('Arial', 24, 'bold'), 
-                fg='white', bg='#4a6fa5').pack(side='left')
+        self.separator_label = tk.Label(time_frame, text=":", font=('Arial', 24, 'bold'), 
+                                       fg='white', bg='#4a6fa5')
+        self.separator_label.pack(side='left')
         
         seconds_frame = tk.Frame(time_frame, bg='#666666', relief='raised', bd=2)
         seconds_frame.pack(side='left', padx=(5, 0))
@@ -311,6 +321,9 @@ class foosballScoreboard:
                                     font=('Arial', 24, 'bold'), fg='white', bg='#666666', 
                                     padx=15, pady=10)
         self.seconds_label.pack()
+        # Each label is only reconfigured when its own text changes; see update_clock_display
+        self.clock_labels = (self.minutes_label, self.separator_label, self.seconds_label)
+        self.clock_texts = ("15", ":", "00")
         
         # Reset button
         reset_canvas = tk.Canvas(clock_container, width=60, height=60, bg='white', highlightthickness=0)
@@ -343,41 +356,41 @@ class foosballScoreboard:
     # Game logic methods
     def change_score(self, team, delta):
         if team == 'HOME':
-            new_score = max(0, self.home_score.get() + delta)
-            self.home_score.set(new_score)
+            new_score = max(0, self.updates.get(self.home_score) + delta)
+            self.updates.set(self.home_score, new_score)
         else:
-            new_score = max(0, self.away_score.get() + delta)
-            self.away_score.set(new_score)
+            new_score = max(0, self.updates.get(self.away_score) + delta)
+            self.updates.set(self.away_score, new_score)
             
     def change_sets(self, team, delta):
         if team == 'HOME':
-            new_sets = max(0, self.home_sets.get() + delta)
-            self.home_sets.set(new_sets)
+            new_sets = max(0, self.updates.get(self.home_sets) + delta)
+            self.updates.set(self.home_sets, new_sets)
         else:
-            new_sets = max(0, self.away_sets.get() + delta)
-            self.away_sets.set(new_sets)
+            new_sets = max(0, self.updates.get(self.away_sets) + delta)
+            self.updates.set(self.away_sets, new_sets)
             
     def change_timeouts(self, team, delta):
         if team == 'HOME':
-            new_timeouts = max(0, min(3, self.home_timeouts.get() + delta))
-            self.home_timeouts.set(new_timeouts)
+            new_timeouts = max(0, min(3, self.updates.get(self.home_timeouts) + delta))
+            self.updates.set(self.home_timeouts, new_timeouts)
         else:
-            new_timeouts = max(0, min(3, self.away_timeouts.get() + delta))
-            self.away_timeouts.set(new_timeouts)
+            new_timeouts = max(0, min(3, self.updates.get(self.away_timeouts) + delta))
+            self.updates.set(self.away_timeouts, new_timeouts)
             
     def change_serve(self, team):
-        self.serve_side.set(team)
+        self.updates.set(self.serve_side, team)
         print(f"Serve changed to {team}")
         
     def next_set(self):
-        current = self.current_set.get()
+        current = self.updates.get(self.current_set)
         if current < 5:
-            self.current_set.set(current + 1)
+            self.updates.set(self.current_set, current + 1)
             
     def prev_set(self):
-        current = self.current_set.get()
+        current = self.updates.get(self.current_set)
         if current > 1:
-            self.current_set.set(current - 1)
+            self.updates.set(self.current_set, current - 1)
             
     def sound_horn(self, event):
         print("Horn sounded!")
@@ -390,36 +403,51 @@ class foosballScoreboard:
             self.start_timer()
             
     def start_timer(self):
-        if not self.timer_running:
+        if not self.timer_running and self.clock.start():
             self.timer_running = True
-            self.timer_thread = threading.Thread(target=self.run_timer)
-            self.timer_thread.daemon = True
-            self.timer_thread.start()
+            self.schedule_tick()
             
     def stop_timer(self):
         self.timer_running = False
-        
-    def run_timer(self):
-        while self.timer_running:
-            time.sleep(1)
-            if self.timer_running:
-                current_seconds = self.game_seconds.get()
-                current_minutes = self.game_minutes.get()
-                
-                if current_seconds > 0:
-                    self.game_seconds.set(current_seconds - 1)
-                elif current_minutes > 0:
-                    self.game_minutes.set(current_minutes - 1)
-                    self.game_seconds.set(59)
-                else:
-                    self.timer_running = False
-                    
-                # Update seconds display
-                self.root.after(0, self.update_seconds_display)
+        if self.clock.pause():
+            # The tick for a change just before the stop may still be waiting; show where it stopped
+            self.update_clock_display()
+        if self.tick_id is not None:
+            self.root.after_cancel(self.tick_id)
+            self.tick_id = None
+        
+    def schedule_tick(self):
+        # Called on the Tk thread only; wakes up when the shown second changes, and never twice
+        if self.tick_id is not None:
+            self.root.after_cancel(self.tick_id)
+            self.tick_id = None
+        delay = self.clock.next_refresh()
+        if delay is not None:
+            self.tick_id = self.root.after(max(1, math.ceil(delay * 1000)), self.count_down)
                 
-    def update_seconds_display(self):
-        seconds = self.game_seconds.get()
-        self.seconds_label.config(text=f"{seconds:02d}")
+    def count_down(self):
+        """Show the time left on the clock, stopping the timer at zero"""
+        self.tick_id = None
+        if self.clock.update():
+            self.timer_running = False
+        minutes, seconds = self.clock.display()
+        self.updates.set(self.game_minutes, minutes)
+        self.updates.set(self.game_seconds, seconds)
+        self.update_clock_display()
+        if self.timer_running:
+            self.schedule_tick()
+        
+    def update_clock_display(self):
+        """Redraw the clock labels whose text changed: minutes:seconds, or seconds.tenths at the end"""
+        minutes, seconds, tenths = self.clock.shown()
+        if tenths is None:
+            texts = (str(minutes), ":", f"{seconds:02d}")
+        else:
+            texts = (str(minutes * 60 + seconds), ".", str(tenths))
+        for label, text, shown in zip(self.clock_labels, texts, self.clock_texts):
+            if text != shown:
+                self.updates.configure(label, text=text)
+        self.clock_texts = texts
         
     def reset_timer(self, event):
         self.stop_timer()
@@ -427,23 +455,25 @@ class foosballScoreboard:
         
     def set_timer(self, minutes, seconds):
         self.stop_timer()
-        self.game_minutes.set(minutes)
-        self.game_seconds.set(seconds)
-        self.update_seconds_display()
+        self.clock.set(minutes, seconds)
+        self.updates.set(self.game_minutes, minutes)
+        self.updates.set(self.game_seconds, seconds)
+        self.update_clock_display()
         
     def reset_game(self):
         self.stop_timer()
-        self.home_score.set(0)
-        self.away_score.set(0)
-        self.home_sets.set(0)
-        self.away_sets.set(0)
-        self.home_timeouts.set(2)
-        self.away_timeouts.set(2)
-        self.current_set.set(1)
+        self.updates.set(self.home_score, 0)
+        self.updates.set(self.away_score, 0)
+        self.updates.set(self.home_sets, 0)
+        self.updates.set(self.away_sets, 0)
+        self.updates.set(self.home_timeouts, 2)
+        self.updates.set(self.away_timeouts, 2)
+        self.updates.set(self.current_set, 1)
         self.set_timer(15, 0)
         
     def run(self):
         self.root.mainloop()
+        exit_report(self.updates.report())
 
 # Run the application
 if __name__ == "__main__":
@@ -0,0 +1,216 @@
+import heapq
+import itertools
+import math
+import time
+from typing import Callable, List, Optional, Tuple
+
+from game_clock import GameClock
+
+# Any number of countdowns on one Tk after() for the earliest deadline
+
+
+class TimerHandle:
+    """A scheduled callback; cancel() it any time before it fires"""
+
+    __slots__ = ("deadline", "callback", "args", "cancelled", "fired", "service")
+
+    def __init__(self, service: "TimerService", deadline: float, callback: Callable, args: tuple):
+        self.service = service
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self.fired = False
+
+    @property
+    def active(self) -> bool:
+        return not (self.cancelled or self.fired)
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - self.service.now())
+
+    def cancel(self) -> bool:
+        return self.service.cancel(self)
+
+
+class TimerService:
+    """A min-heap of deadlines, dispatched from the Tk event loop.
+
+    call_later(delay, callback, *args) and call_at(deadline, ...) return a
+    TimerHandle. However many timers are pending, exactly one widget.after()
+    is armed, for the earliest deadline; when it fires, every callback that is
+    due runs in deadline order on the Tk thread and the next one is armed.
+    Cancelling only marks the handle, and cancelled entries are dropped when
+    they reach the top of the heap (or in one pass once they outnumber the
+    live ones), so cancel-and-restart on every tap stays O(log n).
+
+    Must be used from the Tk thread. Without a widget nothing is armed and the
+    owner calls run_due() itself, sleeping at most next_delay() in between.
+    """
+
+    def __init__(self, widget=None, now: Callable[[], float] = time.monotonic):
+        self.widget = widget
+        self.now = now
+        self.heap: List[Tuple[float, int, TimerHandle]] = []
+        self.order = itertools.count()  # keeps equal deadlines first-come, first-served
+        self.live = 0
+        self.after_id = None
+        self.armed_for: Optional[float] = None
+        self.dispatching = False  # run_due() arms the next wakeup once, after the last callback
+        self.wakeups = 0
+        self.fired = 0
+        self.cancelled = 0
+        self.most_pending = 0
+
+    def call_later(self, delay: float, callback: Callable, *args) -> TimerHandle:
+        return self.call_at(self.now() + max(0.0, delay), callback, *args)
+
+    def call_at(self, deadline: float, callback: Callable, *args) -> TimerHandle:
+        handle = TimerHandle(self, deadline, callback, args)
+        heapq.heappush(self.heap, (deadline, next(self.order), handle))
+        self.live += 1
+        self.most_pending = max(self.most_pending, self.live)
+        if not self.dispatching and (self.armed_for is None or deadline < self.armed_for):
+            self._arm()
+        return handle
+
+    def cancel(self, handle: Optional[TimerHandle]) -> bool:
+        """Cancel a pending timer; False if it already fired or was cancelled (or is None)"""
+        if handle is None or not handle.active:
+            return False
+        handle.cancelled = True
+        self.live -= 1
+        self.cancelled += 1
+        if len(self.heap) > 64 and len(self.heap) > 2 * self.live:
+            self.heap = [entry for entry in self.heap if entry[2].active]
+            heapq.heapify(self.heap)
+        if not self.dispatching and handle.deadline == self.armed_for:
+            self._arm()
+        return True
+
+    def next_delay(self) -> Optional[float]:
+        """Seconds until the earliest pending timer, or None when there is none"""
+        self._drop_cancelled()
+        if not self.heap:
+            return None
+        return max(0.0, self.heap[0][0] - self.now())
+
+    def run_due(self) -> int:
+        """Run every callback whose deadline has passed; returns how many ran"""
+        ran = 0
+        self.dispatching = True
+        try:
+            now = self.now()
+            while self.heap and self.heap[0][0] <= now:
+                _, _, handle = heapq.heappop(self.heap)
+                if not handle.active:
+                    continue
+                handle.fired = True
+                self.live -= 1
+                self.fired += 1
+                ran += 1
+                handle.callback(*handle.args)
+        finally:
+            self.dispatching = False
+            self._arm()
+        return ran
+
+    def pending(self) -> List[TimerHandle]:
+        """The live timers, earliest first"""
+        return [handle for _, _, handle in sorted(self.heap) if handle.active]
+
+    def clear(self):
+        """Cancel every pending timer, e.g. when the application closes"""
+        for _, _, handle in self.heap:
+            if handle.active:
+                handle.cancelled = True
+                self.cancelled += 1
+        self.heap.clear()
+        self.live = 0
+        self._arm()
+
+    def _drop_cancelled(self):
+        while self.heap and not self.heap[0][2].active:
+            heapq.heappop(self.heap)
+
+    def _arm(self):
+        """Keep one after() armed for the earliest live deadline"""
+        self._drop_cancelled()
+        deadline = self.heap[0][0] if self.heap else None
+        if deadline == self.armed_for or self.widget is None:
+            self.armed_for = deadline
+            return
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+        self.armed_for = deadline
+        if deadline is not None:
+            delay_ms = max(0, math.ceil((deadline - self.now()) * 1000))
+            self.after_id = self.widget.after(delay_ms, self._wake)
+
+    def _wake(self):
+        self.after_id = None
+        self.armed_for = None
+        self.wakeups += 1
+        self.run_due()
+
+    def stats(self) -> dict:
+        return {
+            "pending": self.live,
+            "most_pending": self.most_pending,
+            "fired": self.fired,
+            "cancelled": self.cancelled,
+            "wakeups": self.wakeups,
+        }
+
+    def report(self) -> str:
+        return ("Timers: {fired} fired, {cancelled} cancelled, {pending} pending (at most {most_pending}) "
+                "in {wakeups} wakeups").format(**self.stats())
+
+
+class Countdown:
+    """A whole-second countdown on a TimerService, e.g. a timeout or a shot clock.
+
+    on_tick(seconds_left) is called when started and whenever the shown
+    second changes, on_done() once it reaches zero. The time left comes from
+    a GameClock on the service's time source, so it does not drift however
+    late the wakeups are.
+    """
+
+    def __init__(self, timers: TimerService, seconds: float, on_tick: Callable[[int], None],
+                 on_done: Optional[Callable[[], None]] = None):
+        self.timers = timers
+        self.seconds = seconds
+        self.on_tick = on_tick
+        self.on_done = on_done
+        self.clock = GameClock(0, seconds, now=timers.now)
+        self.handle: Optional[TimerHandle] = None
+
+    @property
+    def running(self) -> bool:
+        return self.clock.running
+
+    def seconds_left(self) -> int:
+        return math.ceil(round(self.clock.remaining(), 6))
+
+    def start(self, seconds: Optional[float] = None):
+        """(Re)start from the full time, or from seconds"""
+        self.cancel()
+        self.clock.set(0, self.seconds if seconds is None else seconds)
+        self.clock.start()
+        self._tick()
+
+    def cancel(self):
+        self.timers.cancel(self.handle)
+        self.handle = None
+        self.clock.pause()
+
+    def _tick(self):
+        self.handle = None
+        done = self.clock.update() or not self.clock.running
+        self.on_tick(self.seconds_left())
+        if done:
+            if self.on_done is not None:
+                self.on_done()
+            return
+        self.handle = self.timers.call_later(self.clock.next_refresh(), self._tick)
@@ -0,0 +1,93 @@
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+# Batched writes to Tk variables and widget options for the Tk scoreboards
+
+
+class UpdateScheduler:
+    """Collects scoreboard writes and applies them in one after_idle flush.
+
+    set(variable, value) and configure(widget, **options) are used in place
+    of variable.set() and widget.config(). Nothing reaches Tk until the first
+    idle moment after the write, where the latest value for each variable or
+    option is applied once; a burst such as reset_game(), or taps faster than
+    the display refreshes, costs one round of traces, geometry and redraw
+    instead of one per write. get(variable) returns the value still waiting
+    to be applied, so read-modify-write actions see their own writes.
+
+    Must be used from the Tk thread. With enabled=False every write is applied
+    straight away, as before.
+    """
+
+    def __init__(self, widget, enabled: bool = True):
+        self.widget = widget
+        self.enabled = enabled
+        self.pending: Dict[Hashable, Tuple[Callable[[Any], None], Any]] = {}
+        self.flush_id = None
+        self.writes = 0
+        self.applied = 0
+        self.flushes = 0
+
+    def set(self, variable, value):
+        # Keyed by the Tcl name: tk.Variable defines __eq__ and so is not hashable
+        self._queue(str(variable), variable.set, value)
+
+    def get(self, variable):
+        entry = self.pending.get(str(variable))
+        return variable.get() if entry is None else entry[1]
+
+    def configure(self, widget, **options):
+        for option, value in options.items():
+            self._queue((str(widget), option), lambda value, option=option: widget.config(**{option: value}), value)
+
+    def flush(self):
+        """Apply every pending write now"""
+        if self.flush_id is not None:
+            self.widget.after_cancel(self.flush_id)
+            self.flush_id = None
+        pending, self.pending = self.pending, {}
+        for apply, value in pending.values():
+            apply(value)
+        if pending:
+            self.applied += len(pending)
+            self.flushes += 1
+
+    def cancel(self):
+        """Drop pending writes, e.g. when the screen is destroyed"""
+        if self.flush_id is not None:
+            self.widget.after_cancel(self.flush_id)
+            self.flush_id = None
+        self.pending.clear()
+
+    def _queue(self, key: Hashable, apply: Callable[[Any], None], value):
+        self.writes += 1
+        if not self.enabled:
+            apply(value)
+            self.applied += 1
+            self.flushes += 1
+            return
+        self.pending[key] = (apply, value)
+        if self.flush_id is None:
+            self.flush_id = self.widget.after_idle(self._idle_flush)
+
+    def _idle_flush(self):
+        self.flush_id = None
+        self.flush()
+
+    @property
+    def coalesced(self) -> int:
+        """Writes that never reached Tk because a later one replaced them"""
+        return self.writes - self.applied - len(self.pending)
+
+    def stats(self) -> dict:
+        return {
+            "writes": self.writes,
+            "applied": self.applied,
+            "coalesced": self.coalesced,
+            "flushes": self.flushes,
+            "writes_per_flush": round(self.writes / self.flushes, 2) if self.flushes else None,
+        }
+
+    def report(self) -> str:
+        stats = self.stats()
+        return ("Scoreboard updates: {writes} writes, {applied} applied in {flushes} flushes, "
+                "{coalesced} coalesced").format(**stats)
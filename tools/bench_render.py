@@ -0,0 +1,335 @@
+# Headless rendering benchmark for the pygame menu screens.
+#
+# Drives every pygame menu (new ui/main_menu.py, new ui/scorecard.py,
+# new ui/Gamemode UI.py and the MainMenuUI in tablesoccer v7) under the SDL
+# dummy video driver at several resolutions, feeds each one scripted input and
+# reports frame time percentiles and draw calls per frame as JSON.
+#
+# Each frame is one step of the display host's pump: the scripted input is
+# posted to the pygame event queue, the screen's IdleScheduler polls it and
+# process() handles it and draws. The first --warmup frames (the first one
+# builds the background cache) are run the same way but not measured;
+# busy_frames counts the measured frames after which the host would pump
+# again rather than wait for input.
+#
+#   python tools/bench_render.py --frames 300 --output bench.json
+#
+# Compare the JSON from two builds before rolling a build out to the kiosks.
+
+import os
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import contextlib
+import importlib.machinery
+import importlib.util
+import io
+import json
+import platform
+import sys
+import time
+
+import pygame
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NEW_UI = os.path.join(ROOT, "new ui")
+sys.path.insert(0, NEW_UI)
+
+DEFAULT_RESOLUTIONS = "1400x800,1920x1080,800x480"
+DEFAULT_WARMUP = 30
+DRAW_FUNCTIONS = ("rect", "circle", "line", "lines", "aaline", "aalines", "polygon", "ellipse", "arc")
+
+
+def load_script(path, name):
+    """Import a script by path (the UI files have spaces or no .py extension)"""
+    loader = importlib.machinery.SourceFileLoader(name, path)
+    spec = importlib.util.spec_from_loader(name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+class DrawCounter:
+    """Counts pygame.draw calls and blits/fills on the screen for the current frame"""
+
+    def __init__(self):
+        self.primitives = 0
+        self.blits = 0
+        self.fills = 0
+
+    def reset(self):
+        self.primitives = self.blits = self.fills = 0
+
+    @property
+    def total(self):
+        return self.primitives + self.blits + self.fills
+
+
+COUNTER = DrawCounter()
+
+
+class CountingSurface(pygame.Surface):
+    """Offscreen stand-in for the display surface that counts blits and fills"""
+
+    def blit(self, *args, **kwargs):
+        COUNTER.blits += 1
+        return super().blit(*args, **kwargs)
+
+    def blits(self, *args, **kwargs):
+        result = super().blits(*args, **kwargs)
+        COUNTER.blits += len(result) if result else 0
+        return result
+
+    def fill(self, *args, **kwargs):
+        COUNTER.fills += 1
+        return super().fill(*args, **kwargs)
+
+
+class InstrumentedDisplay:
+    """Patches pygame so the screens draw into a CountingSurface.
+
+    flip() and update() copy the canvas to the real (dummy) display first, so
+    presenting still costs what it does on a device.
+    """
+
+    def __init__(self):
+        self.real_screen = None
+        self.canvas = None
+        self.flips = 0
+        self.updates = 0
+        self._originals = {}
+
+    def __enter__(self):
+        display = pygame.display
+        self._originals = {
+            "set_mode": display.set_mode,
+            "flip": display.flip,
+            "update": display.update,
+        }
+        display.set_mode = self.set_mode
+        display.flip = self.flip
+        display.update = self.update
+        for name in DRAW_FUNCTIONS:
+            original = getattr(pygame.draw, name)
+            self._originals["draw." + name] = original
+            setattr(pygame.draw, name, self._counted(original))
+        return self
+
+    def __exit__(self, *exc_info):
+        display = pygame.display
+        display.set_mode = self._originals["set_mode"]
+        display.flip = self._originals["flip"]
+        display.update = self._originals["update"]
+        for name in DRAW_FUNCTIONS:
+            setattr(pygame.draw, name, self._originals["draw." + name])
+
+    @staticmethod
+    def _counted(function):
+        def wrapper(*args, **kwargs):
+            COUNTER.primitives += 1
+            return function(*args, **kwargs)
+        return wrapper
+
+    def set_mode(self, size=(0, 0), *args, **kwargs):
+        self.real_screen = self._originals["set_mode"](size, *args, **kwargs)
+        self.canvas = CountingSurface(self.real_screen.get_size(), 0, self.real_screen)
+        return self.canvas
+
+    def flip(self):
+        self.flips += 1
+        pygame.Surface.blit(self.real_screen, self.canvas, (0, 0))
+        return self._originals["flip"]()
+
+    def update(self, rects=None):
+        if rects is None:
+            return self.flip()
+        self.updates += 1
+        rect_list = [rects] if isinstance(rects, pygame.Rect) else list(rects)
+        for rect in rect_list:
+            pygame.Surface.blit(self.real_screen, self.canvas, rect, rect)
+        return self._originals["update"](rect_list)
+
+
+def key_event(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)
+
+
+def scripted_events(scenario, frame, card_count):
+    """Input fed to the screen before the given frame of a scenario"""
+    if scenario == "navigate":
+        # Walk right across every card and back again, one step every 10 frames
+        if frame % 10 == 0 and frame > 0:
+            step = (frame // 10 - 1) % (2 * (card_count - 1))
+            return [key_event(pygame.K_RIGHT if step < card_count - 1 else pygame.K_LEFT)]
+    elif scenario == "expose":
+        # Every frame a full redraw, as the loops did before dirty rects
+        return [pygame.event.Event(pygame.WINDOWEXPOSED)]
+    return []
+
+
+class ScreenTarget:
+    """One pygame screen: how to size it, build it and feed it input"""
+
+    def __init__(self, name, module, factory, cards_attr):
+        self.name = name
+        self.module = module
+        self.factory = factory
+        self.cards_attr = cards_attr
+
+    def configure(self, width, height):
+        self.module.SCREEN_WIDTH = width
+        self.module.SCREEN_HEIGHT = height
+        if hasattr(self.module, "scale"):
+            # v7 lays everything out through S(), driven by the module-level scale
+            self.module.scale = min(width / self.module.BASE_WIDTH, height / self.module.BASE_HEIGHT)
+
+    def build(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.factory()
+
+    def step(self, ui, events):
+        """One frame as the display host's pump runs it; False if the screen handed over"""
+        for event in events:
+            pygame.event.post(event)
+        if not ui.process(ui.scheduler.poll(True)):
+            return False
+        ui.scheduler.tick(sleep=False)
+        return True
+
+
+def load_targets(names):
+    targets = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        if "main_menu" in names:
+            import main_menu
+            targets.append(ScreenTarget("main_menu", main_menu, lambda: main_menu.RumbleVerseUI(), "game_modes"))
+        if "scorecard" in names:
+            scorecard = load_script(os.path.join(NEW_UI, "scorecard.py"), "bench_scorecard")
+            targets.append(ScreenTarget("scorecard", scorecard, lambda: scorecard.RumbleVerseUI(None), "game_modes"))
+        if "gamemode" in names:
+            gamemode = load_script(os.path.join(NEW_UI, "Gamemode UI.py"), "bench_gamemode")
+            targets.append(ScreenTarget("gamemode", gamemode, lambda: gamemode.RumbleVerseUI(None), "game_modes"))
+        if "v7" in names:
+            v7 = load_script(os.path.join(ROOT, "tablesoccer v7"), "bench_v7")
+            targets.append(ScreenTarget("v7", v7, lambda: v7.MainMenuUI(None), "menu_options"))
+    return targets
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def summarise(values, digits=3):
+    ordered = sorted(values)
+    return {
+        "mean": round(sum(ordered) / len(ordered), digits),
+        "p50": round(percentile(ordered, 0.50), digits),
+        "p95": round(percentile(ordered, 0.95), digits),
+        "p99": round(percentile(ordered, 0.99), digits),
+        "max": round(ordered[-1], digits),
+    }
+
+
+def run_scenario(target, display, width, height, scenario, frames, warmup=DEFAULT_WARMUP):
+    target.configure(width, height)
+    ui = target.build()
+    card_count = len(getattr(ui, target.cards_attr))
+    pygame.event.clear()  # whatever set_mode() queued belongs to no frame
+
+    frame_ms = []
+    draw_calls = []
+    busy_frames = 0
+    for frame in range(warmup + frames):
+        if frame == warmup:
+            display.flips = display.updates = 0
+        events = scripted_events(scenario, frame, card_count)
+        COUNTER.reset()
+        start = time.perf_counter()
+        if not target.step(ui, events):
+            raise RuntimeError(f"{target.name} handed over to another screen in the {scenario} scenario")
+        if frame < warmup:
+            continue
+        frame_ms.append((time.perf_counter() - start) * 1000.0)
+        draw_calls.append(COUNTER.total)
+        if ui.scheduler.next_delay(ui.busy()) is not None:
+            busy_frames += 1
+
+    return {
+        "screen": target.name,
+        "resolution": f"{width}x{height}",
+        "scenario": scenario,
+        "frames": frames,
+        "warmup": warmup,
+        "busy_frames": busy_frames,
+        "frame_ms": summarise(frame_ms),
+        "draw_calls": summarise(draw_calls, 1),
+        "flips": display.flips,
+        "partial_updates": display.updates,
+    }
+
+
+def parse_resolutions(text):
+    resolutions = []
+    for item in text.split(","):
+        width, height = item.lower().split("x")
+        resolutions.append((int(width), int(height)))
+    return resolutions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless rendering benchmark for the pygame menu screens")
+    parser.add_argument("--resolutions", default=DEFAULT_RESOLUTIONS,
+                        help=f"comma separated WIDTHxHEIGHT list (default {DEFAULT_RESOLUTIONS})")
+    parser.add_argument("--screens", default="main_menu,scorecard,gamemode,v7",
+                        help="comma separated subset of main_menu,scorecard,gamemode,v7")
+    parser.add_argument("--scenarios", default="idle,navigate,expose",
+                        help="comma separated subset of idle,navigate,expose")
+    parser.add_argument("--frames", type=int, default=300, help="frames per scenario (default 300)")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP,
+                        help=f"unmeasured frames before each scenario (default {DEFAULT_WARMUP})")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    targets = load_targets(args.screens.split(","))
+    results = []
+    with InstrumentedDisplay() as display:
+        for target in targets:
+            for width, height in parse_resolutions(args.resolutions):
+                for scenario in args.scenarios.split(","):
+                    result = run_scenario(target, display, width, height, scenario, args.frames, args.warmup)
+                    results.append(result)
+                    print(f"{target.name:10} {result['resolution']:>10} {scenario:9} "
+                          f"p50 {result['frame_ms']['p50']:7.3f} ms  p99 {result['frame_ms']['p99']:7.3f} ms  "
+                          f"draw calls/frame {result['draw_calls']['mean']:6.1f}", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "sdl": ".".join(map(str, pygame.get_sdl_version())),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "frames": args.frames,
+            "warmup": args.warmup,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
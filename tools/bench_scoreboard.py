@@ -0,0 +1,380 @@
+# Scoreboard benchmark: the Tk TableSoccerScoreboard against the canvas and
+# pygame ones.
+#
+# Builds each scoreboard from new ui/Gamemode UI.py in a fresh process, plays
+# the same scripted match on it (goals, games won, timeouts, possession, game
+# number, clock ticks and presets) and reports the time per rendered frame
+# and the resident memory the scoreboard adds, as JSON.
+#
+#   python tools/bench_scoreboard.py --frames 600 --output scoreboard.json
+#
+# A Tk frame is the action plus root.update() until the widgets or canvas
+# items are redrawn; a pygame frame is the action plus process(), which
+# repaints the changed panels and pushes them to the display. pygame uses the
+# SDL dummy driver; the two Tk variants need an X display (run under Xvfb on
+# a headless machine) and are skipped with a note without one.
+#
+# --scenario final-minute instead runs the clock from 1:05 to zero on fake
+# time, waking each scoreboard whenever its clock says the display changes
+# (once a second, ten times a second below 1:00), and reports the wakeups
+# per second and the CPU share that costs in real time. With --max-cpu the
+# exit status is 1 if any variant needs more, e.g. on the Pi:
+#
+#   python tools/bench_scoreboard.py --scenario final-minute --max-cpu 5
+
+import os
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import contextlib
+import importlib.machinery
+import importlib.util
+import io
+import json
+import platform
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NEW_UI = os.path.join(ROOT, "new ui")
+VARIANTS = ("tk", "canvas", "pygame")
+TK_VARIANTS = ("tk", "canvas")
+SCENARIOS = ("match", "final-minute")
+FINAL_MINUTE_START = (1, 5)
+
+# One lap of the scripted match; each entry is (action, arguments)
+MATCH = (
+    ("score", ("HOME", 1)),
+    ("clock", ()),
+    ("score", ("AWAY", 1)),
+    ("possession", ("AWAY",)),
+    ("timeouts", ("HOME", -1)),
+    ("clock", ()),
+    ("score", ("HOME", 1)),
+    ("sets", ("HOME", 1)),
+    ("next_game", ()),
+    ("possession", ("HOME",)),
+    ("timeouts", ("HOME", 1)),
+    ("preset", (1, 0)),
+    ("clock", ()),
+    ("prev_game", ()),
+    ("sets", ("HOME", -1)),
+    ("preset", (15, 0)),
+)
+
+
+def load_script(path, name):
+    """Import a script by path (the UI files have spaces or no .py extension)"""
+    loader = importlib.machinery.SourceFileLoader(name, path)
+    spec = importlib.util.spec_from_loader(name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+def resident_kb():
+    """Resident set size of this process in KB"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def summarise(values, digits=3):
+    ordered = sorted(values)
+    return {
+        "mean": round(sum(ordered) / len(ordered), digits),
+        "p50": round(percentile(ordered, 0.50), digits),
+        "p95": round(percentile(ordered, 0.95), digits),
+        "p99": round(percentile(ordered, 0.99), digits),
+        "max": round(ordered[-1], digits),
+    }
+
+
+class TkVariant:
+    """Plays the match on TableSoccerScoreboard inside a plain Tk root"""
+
+    def __init__(self, module):
+        from game_clock import FakeClock
+        self.root = module.tk.Tk()
+        self.root.geometry(f"{module.SCREEN_WIDTH}x{module.SCREEN_HEIGHT}")
+        # A clock tick is one second of fake time, as for the other variants
+        self.now = FakeClock()
+        self.board = module.TableSoccerScoreboard(None, self.root, now=self.now)
+        self.root.update()
+
+    def apply(self, action, args):
+        board = self.board
+        if action == "score":
+            board.change_score(*args)
+        elif action == "sets":
+            board.change_sets(*args)
+        elif action == "timeouts":
+            board.change_timeouts(*args)
+        elif action == "possession":
+            board.change_serve(*args)
+        elif action == "next_game":
+            board.next_set()
+        elif action == "prev_game":
+            board.prev_set()
+        elif action == "preset":
+            board.set_timer(*args)
+        elif action == "clock":
+            board.clock.start()
+            self.now.advance(1.0)
+            board.count_down()
+
+    @property
+    def clock(self):
+        return self.board.clock
+
+    def start_clock(self, minutes, seconds):
+        self.board.set_timer(minutes, seconds)
+        self.board.clock.start()
+
+    def wake_clock(self):
+        # What the scoreboard's tick timer runs
+        self.board.count_down()
+
+    def frame(self):
+        self.root.update()
+
+    def close(self):
+        self.root.destroy()
+
+
+class PygameVariant:
+    """Plays the match on the pygame scoreboard with the state it renders from"""
+
+    def __init__(self, module):
+        import pygame
+        pygame.init()
+        self.board = module.PygameScoreboard(None, size=(module.SCREEN_WIDTH, module.SCREEN_HEIGHT),
+                                             now=self.fake_clock())
+        self.board.process([])
+
+    def fake_clock(self):
+        # A clock tick is one second of fake time, so frames do not wait for real ones
+        from game_clock import FakeClock
+        self.now = FakeClock()
+        return self.now
+
+    def apply(self, action, args):
+        state = self.board.state
+        if action == "score":
+            state.change_score(*args)
+        elif action == "sets":
+            state.change_sets(*args)
+        elif action == "timeouts":
+            state.change_timeouts(*args)
+        elif action == "possession":
+            state.change_possession(*args)
+        elif action == "next_game":
+            state.next_game()
+        elif action == "prev_game":
+            state.prev_game()
+        elif action == "preset":
+            state.set_clock(*args)
+        elif action == "clock":
+            state.start_clock()
+            self.now.advance(1.0)
+            state.update_clock()
+
+    @property
+    def clock(self):
+        return self.board.state.clock
+
+    def start_clock(self, minutes, seconds):
+        self.board.state.set_clock(minutes, seconds)
+        self.board.state.start_clock()
+
+    def wake_clock(self):
+        # What the scoreboard's TimerService does once the tick is due
+        self.board.timers.run_due()
+
+    def frame(self):
+        self.board.process([])
+
+    def close(self):
+        import pygame
+        pygame.quit()
+
+
+class CanvasVariant(PygameVariant):
+    """Plays the match on the canvas scoreboard, through the same MatchState actions"""
+
+    def __init__(self, module):
+        self.root = module.tk.Tk()
+        self.root.geometry(f"{module.SCREEN_WIDTH}x{module.SCREEN_HEIGHT}")
+        self.board = module.CanvasScoreboard(None, self.root, size=(module.SCREEN_WIDTH, module.SCREEN_HEIGHT),
+                                             now=self.fake_clock())
+        self.root.update()
+
+    def frame(self):
+        self.board.refresh()
+        self.root.update()
+
+    def close(self):
+        self.board.stop_timer()
+        self.board.stop_countdowns()
+        self.root.destroy()
+
+
+def play_match(board, frames):
+    frame_ms = []
+    for frame in range(frames):
+        action, args = MATCH[frame % len(MATCH)]
+        start = time.perf_counter()
+        board.apply(action, args)
+        board.frame()
+        frame_ms.append((time.perf_counter() - start) * 1000.0)
+    return {"frame_ms": summarise(frame_ms)}
+
+
+def play_final_minute(board):
+    """Run the clock down to zero on fake time, waking when the display changes"""
+    board.start_clock(*FINAL_MINUTE_START)
+    board.frame()
+    clock = board.clock
+    phases = {"seconds": {"wakes": 0, "cpu_s": 0.0, "frame_ms": []},
+              "tenths": {"wakes": 0, "cpu_s": 0.0, "frame_ms": []}}
+    simulated = {"seconds": 0.0, "tenths": 0.0}
+    while clock.running:
+        phase = "tenths" if clock.in_tenths() else "seconds"
+        delay = clock.next_refresh()
+        board.now.advance(delay)
+        simulated[phase] += delay
+        start, cpu_start = time.perf_counter(), time.process_time()
+        board.wake_clock()
+        board.frame()
+        phases[phase]["cpu_s"] += time.process_time() - cpu_start
+        phases[phase]["frame_ms"].append((time.perf_counter() - start) * 1000.0)
+        phases[phase]["wakes"] += 1
+
+    result = {}
+    for phase, values in phases.items():
+        seconds = simulated[phase] or 1.0
+        result[phase] = {
+            "wakes": values["wakes"],
+            "wakes_per_s": round(values["wakes"] / seconds, 2),
+            "frame_ms": summarise(values["frame_ms"]),
+            # CPU spent on the clock display as a share of the real time it covers
+            "cpu_percent": round(100.0 * values["cpu_s"] / seconds, 3),
+        }
+    return {"final_minute": result, "cpu_percent": max(phase["cpu_percent"] for phase in result.values())}
+
+
+def run_child(variant, frames, scenario="match"):
+    """Measure one variant in this process and print its result as JSON"""
+    sys.path.insert(0, NEW_UI)
+    os.chdir(NEW_UI)
+    with contextlib.redirect_stdout(io.StringIO()):
+        module = load_script(os.path.join(NEW_UI, "Gamemode UI.py"), "bench_gamemode")
+    before_kb = resident_kb()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        board = {"tk": TkVariant, "canvas": CanvasVariant, "pygame": PygameVariant}[variant](module)
+    build_ms = (time.perf_counter() - started) * 1000.0
+    built_kb = resident_kb()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        if scenario == "final-minute":
+            measured = play_final_minute(board)
+        else:
+            measured = play_match(board, frames)
+    after_kb = resident_kb()
+    board.close()
+
+    print(json.dumps({
+        "variant": variant,
+        "scenario": scenario,
+        "frames": frames,
+        "build_ms": round(build_ms, 1),
+        **measured,
+        "rss_kb": {"before": before_kb, "built": built_kb, "after": after_kb,
+                   "added": after_kb - before_kb},
+    }))
+
+
+def run_variant(variant, frames, scenario="match"):
+    if variant in TK_VARIANTS and not os.environ.get("DISPLAY") and sys.platform.startswith("linux"):
+        return {"variant": variant, "skipped": "no X display (run under Xvfb)"}
+    process = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", variant,
+                              "--frames", str(frames), "--scenario", scenario], capture_output=True, text=True)
+    if process.returncode != 0:
+        return {"variant": variant, "skipped": (process.stderr.strip().splitlines() or ["failed"])[-1]}
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Frame time and memory of the Tk and pygame scoreboards")
+    parser.add_argument("--variants", default=",".join(VARIANTS),
+                        help="comma separated subset of " + ",".join(VARIANTS))
+    parser.add_argument("--frames", type=int, default=600, help="frames per variant (default 600)")
+    parser.add_argument("--scenario", choices=SCENARIOS, default="match",
+                        help="scripted match (default) or the final minute of the clock")
+    parser.add_argument("--max-cpu", type=float,
+                        help="final-minute: exit with status 1 if a variant needs more CPU percent than this")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    parser.add_argument("--child", choices=VARIANTS, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        run_child(args.child, args.frames, args.scenario)
+        return 0
+
+    results = []
+    over_budget = False
+    for variant in args.variants.split(","):
+        result = run_variant(variant, args.frames, args.scenario)
+        results.append(result)
+        if "skipped" in result:
+            print(f"{variant:7} skipped: {result['skipped']}", file=sys.stderr)
+        elif args.scenario == "final-minute":
+            phases = result["final_minute"]
+            print(f"{variant:7} " + "  ".join(
+                f"{phase} {values['wakes_per_s']:5.2f}/s p99 {values['frame_ms']['p99']:6.3f} ms "
+                f"cpu {values['cpu_percent']:6.3f}%" for phase, values in phases.items()), file=sys.stderr)
+            if args.max_cpu is not None and result["cpu_percent"] > args.max_cpu:
+                over_budget = True
+                print(f"{variant:7} needs {result['cpu_percent']}% CPU, over the {args.max_cpu}% budget",
+                      file=sys.stderr)
+        else:
+            print(f"{variant:7} p50 {result['frame_ms']['p50']:7.3f} ms  p99 {result['frame_ms']['p99']:7.3f} ms  "
+                  f"build {result['build_ms']:6.1f} ms  memory +{result['rss_kb']['added']} KB", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "frames": args.frames,
+            "scenario": args.scenario,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
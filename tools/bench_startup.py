@@ -0,0 +1,368 @@
+# Time-to-first-frame benchmark for every runnable UI.
+#
+# Starts each entry point (new ui/main_menu.py, new ui/scorecard.py,
+# new ui/soccercard.py, new ui/Gamemode UI.py and tablesoccer v7) in a fresh
+# interpreter under the SDL dummy video driver and records
+#
+#   import_ms       executing the script's module body, toolkit imports included
+#   toolkit_ms      pygame.init/display.init/font.init/set_mode and tk.Tk()
+#   first_frame_ms  from the start of the import to the first pygame
+#                   display.flip()/update(), or for Tk-only screens to the
+#                   widget tree being built when mainloop() is entered
+#   boot_ms         the same, measured from spawning the interpreter
+#
+# Tk runs for real when DISPLAY is set (use Xvfb for a virtual display), and
+# otherwise against a small stand-in that builds and counts the widget tree
+# and runs after() callbacks, so the harness also works on a bare machine.
+#
+#   python tools/bench_startup.py --runs 5 --output startup.json
+#   python tools/bench_startup.py --baseline startup.json
+#
+# With --baseline the medians are compared with an earlier --output file and
+# the exit status is 1 if any entry point got slower than the tolerance.
+
+import os
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import importlib.machinery
+import importlib.util
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NEW_UI = os.path.join(ROOT, "new ui")
+
+# name: (script, working directory, what counts as the first frame, how __main__ starts it)
+ENTRY_POINTS = {
+    "main_menu": ("new ui/main_menu.py", NEW_UI, "pygame", lambda module: module.RumbleVerseUI().run()),
+    "scorecard": ("new ui/scorecard.py", NEW_UI, "pygame", lambda module: module.GameApplication().run()),
+    "soccercard": ("new ui/soccercard.py", NEW_UI, "tk", lambda module: module.foosballScoreboard().run()),
+    "gamemode": ("new ui/Gamemode UI.py", NEW_UI, "pygame", lambda module: module.GameApplication().run()),
+    "v7": ("tablesoccer v7", ROOT, "pygame", lambda module: module.MultiLevelGameApplication().run()),
+}
+METRICS = ("import_ms", "toolkit_ms", "first_frame_ms", "boot_ms")
+
+
+def load_script(path, name):
+    """Import a script by path (the UI files have spaces or no .py extension)"""
+    loader = importlib.machinery.SourceFileLoader(name, path)
+    spec = importlib.util.spec_from_loader(name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+class FirstFrame(SystemExit):
+    """Raised from the first presented frame to stop the entry point.
+
+    A SystemExit so that neither the screens' broad exception handlers nor
+    Tk's callback error reporting swallow it.
+    """
+
+
+class Probe:
+    """Collects the timings of one entry point run inside the child process"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.toolkit_ms = 0.0
+        self.frame_at = None
+
+    def timed(self, function):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.toolkit_ms += (time.perf_counter() - start) * 1000.0
+        return wrapper
+
+    def first_frame(self, *args, **kwargs):
+        if self.frame_at is None:
+            self.frame_at = (time.perf_counter(), time.time())
+        raise FirstFrame()
+
+
+def tk_stand_in(probe, first_frame):
+    """A tkinter replacement that builds a widget tree without a display"""
+
+    class Widget:
+        created = 0
+
+        def __init__(self, master=None, *args, **options):
+            Widget.created += 1
+            self.master = master
+            self.children = []
+            self.options = options
+            if master is not None:
+                master.children.append(self)
+
+        def __getattr__(self, name):
+            # pack, grid, bind, configure, create_oval, ...: accept and ignore
+            return lambda *args, **kwargs: None
+
+        def winfo_children(self):
+            return list(self.children)
+
+        def winfo_toplevel(self):
+            return self if self.master is None else self.master.winfo_toplevel()
+
+        def winfo_id(self):
+            return 0
+
+        def cget(self, option):
+            return self.options.get(option, "")
+
+        def config(self, **options):
+            self.options.update(options)
+
+        configure = config
+
+        def destroy(self):
+            if self.master is not None and self in self.master.children:
+                self.master.children.remove(self)
+
+        def after(self, delay_ms, callback=None, *args):
+            return loop.after(delay_ms, callback, *args)
+
+        def after_idle(self, callback, *args):
+            return loop.after(0, callback, *args)
+
+        def after_cancel(self, identifier):
+            loop.cancel(identifier)
+
+        def mainloop(self, n=0):
+            if first_frame == "tk":
+                probe.first_frame()
+            loop.run()
+
+    class Loop:
+        """after() callbacks in due order, until the first frame or a timeout"""
+
+        def __init__(self):
+            self.queue = {}
+            self.next_id = 0
+
+        def after(self, delay_ms, callback, *args):
+            self.next_id += 1
+            self.queue[self.next_id] = (time.perf_counter() + delay_ms / 1000.0, self.next_id, callback, args)
+            return self.next_id
+
+        def cancel(self, identifier):
+            self.queue.pop(identifier, None)
+
+        def run(self, timeout=10.0):
+            deadline = time.perf_counter() + timeout
+            while self.queue and time.perf_counter() < deadline:
+                due, identifier, callback, args = min(self.queue.values())
+                del self.queue[identifier]
+                time.sleep(max(0.0, due - time.perf_counter()))
+                if callback is not None:
+                    callback(*args)
+            raise RuntimeError("no frame was drawn")
+
+    class Variable:
+        def __init__(self, master=None, value=None, name=None):
+            self.value = value
+
+        def get(self):
+            return self.value
+
+        def set(self, value):
+            self.value = value
+
+    loop = Loop()
+    tkinter = types.ModuleType("tkinter")
+    ttk = types.ModuleType("tkinter.ttk")
+    for name in ("Button", "Canvas", "Entry", "Frame", "Label", "Toplevel", "Scrollbar", "Listbox", "Text"):
+        setattr(tkinter, name, type(name, (Widget,), {}))
+    for name in ("Button", "Frame", "Label", "Style", "Progressbar", "Combobox"):
+        setattr(ttk, name, type(name, (Widget,), {}))
+    tkinter.Tk = type("Tk", (Widget,), {"__init__": probe.timed(Widget.__init__)})
+    tkinter.Misc = Widget
+    tkinter.StringVar = tkinter.IntVar = tkinter.BooleanVar = tkinter.DoubleVar = Variable
+    tkinter.TclError = RuntimeError
+    tkinter.END = "end"
+    tkinter.ttk = ttk
+    sys.modules["tkinter"] = tkinter
+    sys.modules["tkinter.ttk"] = ttk
+    return tkinter
+
+
+def count_widgets(tkinter):
+    root = getattr(tkinter, "_default_root", None)
+    if root is None:
+        return None
+    count, pending = 0, [root]
+    while pending:
+        widget = pending.pop()
+        count += 1
+        pending.extend(widget.winfo_children())
+    return count
+
+
+def child(name, tk_mode, spawned_at):
+    """Run one entry point up to its first frame and print the timings as JSON"""
+    script, directory, first_frame, start = ENTRY_POINTS[name]
+    probe = Probe()
+    if tk_mode == "stand-in":
+        tkinter = tk_stand_in(probe, first_frame)
+    if tk_mode == "real":
+        import tkinter
+        tkinter.Tk.__init__ = probe.timed(tkinter.Tk.__init__)
+        if first_frame == "tk":
+            def first_update(widget, n=0):
+                widget.update()
+                probe.first_frame()
+            tkinter.Misc.mainloop = first_update
+    if first_frame == "pygame":
+        import pygame
+        for owner, function in ((pygame, "init"), (pygame.display, "init"), (pygame.font, "init"),
+                                (pygame.display, "set_mode")):
+            setattr(owner, function, probe.timed(getattr(owner, function)))
+        pygame.display.flip = pygame.display.update = probe.first_frame
+
+    os.chdir(directory)
+    sys.path.insert(0, NEW_UI)
+    real_stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+    try:
+        module = load_script(os.path.join(ROOT, script), f"startup_{name}")
+        imported = time.perf_counter()
+        start(module)
+    except FirstFrame:
+        pass
+    finally:
+        sys.stdout = real_stdout
+    if probe.frame_at is None:
+        raise RuntimeError(f"{name} returned without drawing a frame")
+
+    frame_perf, frame_wall = probe.frame_at
+    widgets = tkinter.Misc.created if tk_mode == "stand-in" else count_widgets(tkinter)
+    print(json.dumps({
+        "import_ms": (imported - probe.started) * 1000.0,
+        "toolkit_ms": probe.toolkit_ms,
+        "first_frame_ms": (frame_perf - probe.started) * 1000.0,
+        "boot_ms": (frame_wall - spawned_at) * 1000.0,
+        "widgets": widgets,
+    }))
+
+
+def measure(name, tk_mode, cold):
+    env = dict(os.environ)
+    with tempfile.TemporaryDirectory() as cache:
+        if cold:
+            # No display profile or pre-scaled assets from earlier runs
+            env["DISPLAY_PROFILE_CACHE"] = os.path.join(cache, "display_profile.json")
+            env["ASSET_CACHE_DIR"] = os.path.join(cache, "assets")
+        command = [sys.executable, os.path.abspath(__file__), "--child", name, "--tk", tk_mode,
+                   "--spawned-at", repr(time.time())]
+        completed = subprocess.run(command, env=env, capture_output=True, text=True, timeout=120)
+    if completed.returncode != 0:
+        raise RuntimeError(f"{name} failed:\n{completed.stderr.strip()}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def median(values):
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    return ordered[middle] if len(ordered) % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def summarise(name, runs):
+    result = {"entry_point": name, "runs": len(runs), "widgets": runs[-1]["widgets"]}
+    for metric in METRICS:
+        values = [run[metric] for run in runs]
+        result[metric] = {"median": round(median(values), 1), "min": round(min(values), 1),
+                          "max": round(max(values), 1)}
+    return result
+
+
+def regressions(results, baseline, tolerance, min_delta_ms):
+    """(entry point, metric, baseline median, new median) for every metric that got slower"""
+    before = {result["entry_point"]: result for result in baseline["results"]}
+    found = []
+    for result in results:
+        old = before.get(result["entry_point"])
+        if old is None:
+            continue
+        for metric in METRICS:
+            was, now = old[metric]["median"], result[metric]["median"]
+            if now > was * (1.0 + tolerance) and now - was > min_delta_ms:
+                found.append((result["entry_point"], metric, was, now))
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time-to-first-frame benchmark for every runnable UI")
+    parser.add_argument("--entry-points", default=",".join(ENTRY_POINTS),
+                        help=f"comma separated subset of {','.join(ENTRY_POINTS)}")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per entry point (default 5)")
+    parser.add_argument("--tk", choices=("auto", "real", "stand-in"), default="auto",
+                        help="real Tk needs DISPLAY; auto uses it when DISPLAY is set")
+    parser.add_argument("--cold", action="store_true", help="start every run without the on-disk caches")
+    parser.add_argument("--baseline", help="earlier --output file to compare the medians with")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed slowdown as a fraction of the baseline (default 0.2)")
+    parser.add_argument("--min-delta-ms", type=float, default=20.0,
+                        help="ignore slowdowns smaller than this, to stay clear of noise (default 20)")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--spawned-at", type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    tk_mode = args.tk
+    if tk_mode == "auto":
+        tk_mode = "real" if os.environ.get("DISPLAY") else "stand-in"
+    if args.child:
+        child(args.child, tk_mode, args.spawned_at)
+        return 0
+
+    results = []
+    for name in args.entry_points.split(","):
+        result = summarise(name, [measure(name, tk_mode, args.cold) for _ in range(args.runs)])
+        results.append(result)
+        print(f"{name:10} import {result['import_ms']['median']:7.1f} ms  toolkit {result['toolkit_ms']['median']:7.1f} ms  "
+              f"first frame {result['first_frame_ms']['median']:7.1f} ms  boot {result['boot_ms']['median']:7.1f} ms",
+              file=sys.stderr)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "tk": tk_mode,
+            "cold": args.cold,
+            "runs": args.runs,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline["meta"].get("tk") != tk_mode or baseline["meta"].get("cold") != args.cold:
+        print("Baseline was recorded with different --tk/--cold settings", file=sys.stderr)
+    found = regressions(results, baseline, args.tolerance, args.min_delta_ms)
+    for name, metric, was, now in found:
+        print(f"REGRESSION {name} {metric}: {was:.1f} ms -> {now:.1f} ms", file=sys.stderr)
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+# Drift check for the match clock (new ui/game_clock.py).
+#
+# Runs the GameClock against a fake time source for simulated hours and
+# checks that it does not drift:
+#
+#   jitter   a 15 minute countdown refreshed the way the scoreboards do it,
+#            each wake-up late by a random amount; the clock must expire at
+#            exactly 15:00 of running time and show every second once
+#   pauses   thousands of random pause/resume cycles at arbitrary fractions
+#            of a second; the time left must match the running time summed
+#            independently
+#   refresh  with a 0.1 s display step the wake-ups land on every tenth
+#   tenths   a 15 minute countdown that shows tenths in its final minute wakes
+#            once a second until 1:00 and ten times a second after, and
+#            every wake-up shows something new
+#
+# For comparison it also reports how far the old sleep(1)-and-decrement
+# timer would have drifted under the same jitter.
+#
+#   python tools/check_game_clock.py --hours 6
+#
+# Exits with status 1 if any check fails.
+
+import argparse
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "new ui"))
+
+from game_clock import FakeClock, GameClock  # noqa: E402
+
+TOLERANCE = 1e-6  # seconds; float rounding only
+
+
+def check_jitter(rng, jitter):
+    """A 15 minute game refreshed late by up to jitter seconds each time"""
+    now = FakeClock()
+    clock = GameClock(15, 0, now=now)
+    clock.start()
+    shown = [clock.display()]
+    old_timer_elapsed = 0.0
+    while clock.running:
+        now.advance(clock.next_refresh() + rng.uniform(0, jitter))
+        old_timer_elapsed += 1.0 + rng.uniform(0, jitter)  # time.sleep(1) plus the same kind of lateness
+        clock.update()
+        display = clock.display()
+        if display != shown[-1]:
+            shown.append(display)
+
+    expected = [divmod(second, 60) for second in range(15 * 60, -1, -1)]
+    failures = []
+    if shown != expected:
+        failures.append(f"shown {len(shown)} distinct times, expected {len(expected)}")
+    # The last wake-up is late by at most one jitter; the clock itself reached zero at exactly 900 s
+    if not 900.0 <= now() <= 900.0 + jitter + TOLERANCE:
+        failures.append(f"expired after {now():.6f} s of running time")
+    return failures, {"expired_after_s": round(now(), 6),
+                      "old_timer_drift_s": round(old_timer_elapsed - 900.0, 3)}
+
+
+def check_pauses(rng, hours):
+    """Random pause/resume cycles; the time left must equal the duration minus the running time"""
+    now = FakeClock(1000.0)
+    duration = hours * 3600.0 + 60.0
+    clock = GameClock(0, duration, now=now)
+    running_time = 0.0
+    cycles = 0
+    worst = 0.0
+    while running_time < hours * 3600.0:
+        clock.start()
+        stretch = rng.uniform(0.001, 10.0)
+        now.advance(stretch)
+        running_time += stretch
+        clock.pause()
+        now.advance(rng.uniform(0.0, 30.0))  # paused time must not count
+        cycles += 1
+        worst = max(worst, abs(clock.remaining() - (duration - running_time)))
+    failures = []
+    if worst > TOLERANCE:
+        failures.append(f"time left off by {worst:.9f} s after {cycles} pauses")
+    return failures, {"cycles": cycles, "simulated_hours": round(now() / 3600.0, 2),
+                      "max_error_s": worst}
+
+
+def check_refresh():
+    """With a 0.1 s display step the clock asks to be woken every tenth"""
+    now = FakeClock()
+    clock = GameClock(1, 0, refresh=0.1, now=now)
+    clock.start()
+    now.advance(0.05)  # start mid-tenth
+    wakes = 0
+    while clock.running:
+        delay = clock.next_refresh()
+        if delay > 0.1 + TOLERANCE:
+            return [f"asked to sleep {delay:.6f} s with a 0.1 s display step"], {}
+        now.advance(delay)
+        clock.update()
+        wakes += 1
+    failures = []
+    if wakes != 600:
+        failures.append(f"{wakes} wake-ups for 60 s at 0.1 s, expected 600")
+    if abs(now() - 60.0) > TOLERANCE:
+        failures.append(f"expired after {now():.6f} s")
+    return failures, {"wakes": wakes}
+
+
+def check_tenths(rng, jitter):
+    """Whole seconds down to 1:00, then tenths; one display change per wake-up"""
+    now = FakeClock()
+    clock = GameClock(15, 0, now=now, tenths_below=60)
+    clock.start()
+    shown = [clock.shown()]
+    wakes = 0
+    while clock.running:
+        now.advance(clock.next_refresh() + rng.uniform(0, jitter))
+        clock.update()
+        wakes += 1
+        display = clock.shown()
+        if display != shown[-1]:
+            shown.append(display)
+
+    expected = [divmod(second, 60) + (None,) for second in range(15 * 60, 59, -1)]
+    expected += [(0,) + divmod(tenth, 10) for tenth in range(599, -1, -1)]
+    failures = []
+    if shown != expected:
+        failures.append(f"shown {len(shown)} distinct times, expected {len(expected)}")
+    if wakes > len(expected) - 1:
+        failures.append(f"{wakes} wake-ups for {len(expected) - 1} display changes")
+    return failures, {"wakes": wakes, "wakes_at_1hz": 15 * 60 - 60, "wakes_at_10hz": 600}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Drift check for the match clock")
+    parser.add_argument("--hours", type=float, default=6.0, help="simulated running time for the pause check (default 6)")
+    parser.add_argument("--jitter-ms", type=float, default=50.0, help="maximum lateness of a wake-up (default 50)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    checks = (
+        ("jitter", lambda: check_jitter(rng, args.jitter_ms / 1000.0)),
+        ("pauses", lambda: check_pauses(rng, args.hours)),
+        ("refresh", check_refresh),
+        ("tenths", lambda: check_tenths(rng, args.jitter_ms / 1000.0)),
+    )
+    failed = False
+    for name, check in checks:
+        failures, details = check()
+        failed = failed or bool(failures)
+        summary = ", ".join(f"{key} {value}" for key, value in details.items())
+        print(f"{name:8} {'FAIL' if failures else 'ok':4}  {summary}")
+        for failure in failures:
+            print(f"         {failure}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
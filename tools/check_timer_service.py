@@ -0,0 +1,179 @@
+# Check for the timer service (new ui/timer_service.py).
+#
+# Drives a TimerService on a fake time source and a fake widget whose after()
+# calls are only recorded, firing each armed wakeup late by a random amount:
+#
+#   order      thousands of timers with random deadlines, a share of them
+#              cancelled; every live one must fire once, never early, in
+#              deadline order, with one wakeup per distinct earliest deadline
+#   restarts   one timer cancelled and restarted on every simulated tap (the
+#              idle return); the heap must stay small and one after() armed
+#   countdowns many Countdowns at once; each must show every second once and
+#              finish on time, sharing the wakeups
+#
+#   python tools/check_timer_service.py --timers 20000
+#
+# Exits with status 1 if any check fails.
+
+import argparse
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "new ui"))
+
+from game_clock import FakeClock  # noqa: E402
+from timer_service import Countdown, TimerService  # noqa: E402
+
+TOLERANCE = 1e-6  # seconds; float rounding only
+AFTER_RESOLUTION = 0.001  # after() takes whole milliseconds, rounded up
+
+
+class FakeWidget:
+    """Records after() calls; run_next() advances the clock to the earliest one and fires it"""
+
+    def __init__(self, now, rng, jitter):
+        self.now = now
+        self.rng = rng
+        self.jitter = jitter
+        self.armed = {}
+        self.next_id = 0
+        self.arms = 0
+
+    def after(self, delay_ms, callback):
+        self.next_id += 1
+        self.arms += 1
+        self.armed[self.next_id] = (self.now() + delay_ms / 1000.0, callback)
+        return self.next_id
+
+    def after_cancel(self, identifier):
+        self.armed.pop(identifier, None)
+
+    def run_next(self) -> bool:
+        if not self.armed:
+            return False
+        identifier = min(self.armed, key=lambda key: self.armed[key][0])
+        due, callback = self.armed.pop(identifier)
+        self.now.advance(max(0.0, due - self.now()) + self.rng.uniform(0, self.jitter))
+        callback()
+        return True
+
+
+def check_order(rng, timers, jitter):
+    now = FakeClock(100.0)
+    widget = FakeWidget(now, rng, jitter)
+    service = TimerService(widget, now=now)
+    fired = []
+
+    def fire(index, deadline):
+        fired.append((index, deadline, now()))
+
+    handles = []
+    for index in range(timers):
+        deadline = 100.0 + round(rng.uniform(0, 600), 1)  # tenths, so many timers share a deadline
+        handles.append((service.call_at(deadline, fire, index, deadline), deadline))
+    cancelled = set(rng.sample(range(timers), timers // 3))
+    for index in cancelled:
+        handles[index][0].cancel()
+    while widget.run_next():
+        pass
+
+    failures = []
+    expected = sorted((deadline, index) for index, (_, deadline) in enumerate(handles) if index not in cancelled)
+    if sorted((deadline, index) for index, deadline, _ in fired) != expected:
+        failures.append(f"{len(fired)} fired, expected {len(expected)} (cancelled ones must not fire)")
+    if any(at < deadline - TOLERANCE for _, deadline, at in fired):
+        failures.append("a timer fired before its deadline")
+    if [deadline for _, deadline, _ in fired] != sorted(deadline for _, deadline, _ in fired):
+        failures.append("timers fired out of deadline order")
+    distinct = len({deadline for deadline, _ in expected})
+    if service.wakeups > distinct:
+        failures.append(f"{service.wakeups} wakeups for {distinct} distinct deadlines")
+    if service.live or service.heap:
+        failures.append(f"{service.live} timers still pending")
+    return failures, {"timers": timers, "fired": len(fired), "wakeups": service.wakeups,
+                      "distinct_deadlines": distinct, "after_calls": widget.arms}
+
+
+def check_restarts(rng, taps):
+    now = FakeClock()
+    widget = FakeWidget(now, rng, 0.0)
+    service = TimerService(widget, now=now)
+    handle = None
+    largest_heap = 0
+    for _ in range(taps):
+        service.cancel(handle)
+        handle = service.call_later(120.0, lambda: None)
+        now.advance(rng.uniform(0, 0.5))
+        largest_heap = max(largest_heap, len(service.heap))
+    failures = []
+    if largest_heap > 130:
+        failures.append(f"heap grew to {largest_heap} entries for one live timer")
+    if len(widget.armed) != 1:
+        failures.append(f"{len(widget.armed)} after() calls armed for one timer")
+    return failures, {"taps": taps, "largest_heap": largest_heap}
+
+
+def check_countdowns(rng, count, jitter):
+    now = FakeClock()
+    widget = FakeWidget(now, rng, jitter)
+    service = TimerService(widget, now=now)
+    shown = [[] for _ in range(count)]
+    finished = [None] * count
+    lengths = [rng.randint(5, 60) for _ in range(count)]
+    countdowns = []
+    for index, seconds in enumerate(lengths):
+        def on_done(index=index):
+            finished[index] = now()
+        countdown = Countdown(service, seconds, shown[index].append, on_done)
+        countdowns.append(countdown)
+    started = []
+    for countdown in countdowns:
+        now.advance(rng.uniform(0, 0.01))  # started a moment apart
+        started.append(now())
+        countdown.start()
+    while widget.run_next():
+        pass
+
+    failures = []
+    for index, seconds in enumerate(lengths):
+        if shown[index] != list(range(seconds, -1, -1)):
+            failures.append(f"countdown {index} showed {shown[index][:5]}... for {seconds} s")
+            break
+        if finished[index] is None or finished[index] > started[index] + seconds + AFTER_RESOLUTION + jitter + TOLERANCE:
+            failures.append(f"countdown {index} of {seconds} s finished at {finished[index]}")
+            break
+    ticks = sum(len(values) for values in shown)
+    return failures, {"countdowns": count, "ticks": ticks, "wakeups": service.wakeups}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the timer service")
+    parser.add_argument("--timers", type=int, default=20000, help="timers in the order check (default 20000)")
+    parser.add_argument("--taps", type=int, default=100000, help="restarts in the restart check (default 100000)")
+    parser.add_argument("--countdowns", type=int, default=200, help="concurrent countdowns (default 200)")
+    parser.add_argument("--jitter-ms", type=float, default=20.0, help="maximum lateness of a wakeup (default 20)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    jitter = args.jitter_ms / 1000.0
+    checks = (
+        ("order", lambda: check_order(rng, args.timers, jitter)),
+        ("restarts", lambda: check_restarts(rng, args.taps)),
+        ("countdowns", lambda: check_countdowns(rng, args.countdowns, jitter)),
+    )
+    failed = False
+    for name, check in checks:
+        failures, details = check()
+        failed = failed or bool(failures)
+        summary = ", ".join(f"{key} {value}" for key, value in details.items())
+        print(f"{name:10} {'FAIL' if failures else 'ok':4}  {summary}")
+        for failure in failures:
+            print(f"           {failure}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
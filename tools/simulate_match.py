@@ -0,0 +1,555 @@
+# Fast-forward match simulation for the scoreboards.
+#
+# Replays scripted matches (goals, games won, timeouts, possession, game
+# changes, clock presets from set_timer, starts and stops) on simulated time.
+# Every scoreboard reads its clock from one FakeClock, the Tk ones run against
+# the stand-in from tools/stress_timer_toggle.py whose after() queue follows
+# that clock, and the harness jumps from one wakeup to the next instead of
+# waiting, each wakeup late by a random amount up to --jitter-ms. A 15 minute
+# match takes a fraction of a second. For each scoreboard and script it checks
+#
+#   state       scores, games won, timeouts, game, possession and clock end as scripted
+#   display     every clock wakeup shows the time left at that moment and one
+#               step on from the last, so no second or tenth is skipped or
+#               shown twice; the labels show the same once Tk has caught up
+#   expiry      the clock reaches zero when the script says, late by at most
+#               one after() millisecond and the jitter
+#   countdowns  the timeout and the shot clock (Gamemode UI, MatchState) finish on time
+#   speed       over all scripts, each scoreboard's simulated time runs at
+#               least --min-speedup times real time
+#
+# Scoreboards: the four widget ones (as in stress_timer_toggle.py) and pygame,
+# the pygame scoreboard on a MatchState, which the canvas scoreboard shares,
+# with its TimerService run as the standalone loop does.
+#
+#   python tools/simulate_match.py --min-speedup 1000
+#   python tools/simulate_match.py --script matches.json
+#
+# A script file holds more scripts in the form of SCRIPTS below, as JSON:
+# {"name": {"events": [[at, action, args...], ...], "expect": {...}}}.
+# Exits with status 1 if any check fails.
+
+import os
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NEW_UI = os.path.join(ROOT, "new ui")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, NEW_UI)
+
+from game_clock import TENTHS_BELOW_SECONDS, FakeClock  # noqa: E402
+from stress_timer_toggle import load_script, tk_stand_in  # noqa: E402
+
+TOLERANCE = 1e-6  # seconds; float rounding only
+AFTER_RESOLUTION = 0.001  # after() takes whole milliseconds, rounded up
+MOST_WAKES = 1000000  # per replay; more means something keeps rescheduling itself
+
+# name: (script, how to build the scoreboard from the module, a Tk root and now)
+BOARDS = {
+    "gamemode": ("new ui/Gamemode UI.py", lambda module, root, now: module.TableSoccerScoreboard(None, root, now=now)),
+    "volleyball": ("new ui/scorecard.py", lambda module, root, now: module.VolleyballScoreboard(None, root, now=now)),
+    "foosball": ("new ui/soccercard.py", lambda module, root, now: module.foosballScoreboard(now=now)),
+    "v7": ("tablesoccer v7", lambda module, root, now: module.TableSoccerScoreboard(None, module.tk.Frame(root),
+                                                                                     now=now)),
+    "pygame": (None, None),
+}
+
+# Each event is (at, action, arguments...), at in seconds from the start of the
+# script. Gamemode UI stops the clock for a timeout, so the scripts stop it
+# there for every scoreboard. zero_at lists when the clock reaches 0.0.
+SCRIPTS = {
+    "full-match": {
+        "events": (
+            (0, "preset", 15, 0),
+            (0, "start"),
+            (61.3, "score", "HOME", 1),
+            (95.0, "possession", "AWAY"),
+            (130.25, "score", "AWAY", 1),
+            (200.0, "stop"),  # ball off the table
+            (245.5, "start"),
+            (400.0, "timeouts", "AWAY", -1),
+            (400.0, "stop"),
+            (430.0, "start"),
+            (512.7, "score", "AWAY", 1),
+            (610.0, "score", "HOME", 1),
+            (700.05, "possession", "HOME"),
+            (950.05, "score", "HOME", 1),  # in the final minute, shown in tenths
+            (960.0, "stop"),
+            (962.4, "start"),
+        ),
+        "expect": {"score": (3, 2), "sets": (0, 0), "timeouts": (2, 1), "game": 1, "possession": "HOME",
+                   "clock": (0, 0, 0), "running": False, "zero_at": (977.9,)},
+    },
+    "final-minute": {
+        "events": (
+            (0, "preset", 1, 5),
+            (0, "start"),
+            (5.55, "stop"),  # halfway through 59.5
+            (7.0, "start"),
+            (12.34, "score", "AWAY", 1),
+            (30.02, "stop"),
+            (31.0, "start"),
+            (50.0, "score", "HOME", 1),
+        ),
+        "expect": {"score": (1, 1), "sets": (0, 0), "timeouts": (2, 2), "game": 1, "possession": "HOME",
+                   "clock": (0, 0, 0), "running": False, "zero_at": (67.43,)},
+    },
+    "presets": {
+        "events": (
+            (0, "preset", 0, 5),
+            (0, "start"),
+            (6.0, "preset", 0, 0),
+            (6.0, "start"),  # nothing left to run
+            (6.1, "timeouts", "AWAY", -5),
+            (6.1, "stop"),
+            (6.2, "timeouts", "HOME", 5),
+            (6.3, "score", "HOME", -3),
+            (6.4, "next_game"), (6.4, "next_game"), (6.4, "next_game"),
+            (6.4, "next_game"), (6.4, "next_game"), (6.4, "next_game"),
+            (6.5, "prev_game"), (6.5, "prev_game"),
+            (6.6, "sets", "AWAY", -1),
+            (6.7, "sets", "HOME", 2),
+            (6.8, "possession", "AWAY"),
+            (7.0, "preset", 2, 30),
+            (7.5, "start"),
+            (9.0, "preset", 0, 59),  # a preset stops a running clock
+            (10.0, "start"),
+        ),
+        "expect": {"score": (0, 0), "sets": (2, 0), "timeouts": (3, 0), "game": 3, "possession": "AWAY",
+                   "clock": (0, 0, 0), "running": False, "zero_at": (5.0, 69.0)},
+    },
+    "three-games": {
+        "events": (
+            (0, "preset", 2, 0),
+            (0, "start"),
+            (33.3, "score", "HOME", 1),
+            (101.0, "score", "HOME", 1),
+            (125.0, "sets", "HOME", 1),
+            (125.0, "next_game"),
+            (150.0, "preset", 2, 0),
+            (150.0, "start"),
+            (170.0, "score", "AWAY", 1),
+            (230.0, "timeouts", "HOME", -1),
+            (230.0, "stop"),
+            (260.0, "start"),
+            (299.9, "score", "AWAY", 1),
+            (305.0, "sets", "AWAY", 1),
+            (305.0, "next_game"),
+            (310.0, "preset", 2, 0),
+            (310.0, "start"),
+            (311.0, "possession", "AWAY"),
+            (400.0, "score", "HOME", 1),
+            (435.0, "sets", "HOME", 1),
+            (435.0, "next_game"),
+        ),
+        "expect": {"score": (3, 2), "sets": (2, 1), "timeouts": (1, 2), "game": 4, "possession": "AWAY",
+                   "clock": (0, 0, 0), "running": False, "zero_at": (120.0, 300.0, 430.0)},
+    },
+}
+
+
+def parse_clock(parts):
+    """(minutes, seconds, tenths) from the clock's texts, ("15", ":", "00") or ("59", ".", "9")"""
+    first, separator, last = parts
+    if separator == ":":
+        return int(first), int(last), None
+    minutes, seconds = divmod(int(first), 60)
+    return minutes, seconds, int(last)
+
+
+def shown_at(remaining):
+    """What the clock should show with this much left: tenths below TENTHS_BELOW_SECONDS, whole seconds above"""
+    tenths = math.ceil(round(remaining * 10, 6))
+    if tenths < TENTHS_BELOW_SECONDS * 10:
+        seconds, tenth = divmod(tenths, 10)
+        return divmod(seconds, 60) + (tenth,)
+    return divmod(math.ceil(round(remaining, 6)), 60) + (None,)
+
+
+def in_tenths(shown):
+    minutes, seconds, tenths = shown
+    return (minutes * 60 + seconds) * 10 + (tenths or 0)
+
+
+class Replay:
+    """Plays one script on one scoreboard and collects what went wrong.
+
+    Keeps its own record of the clock (the time left when last started, and
+    since when), independent of the scoreboard's GameClock, to check every
+    wakeup against.
+    """
+
+    def __init__(self, now, rng, jitter):
+        self.now = now
+        self.rng = rng
+        self.jitter = jitter
+        self.base = now()
+        self.left = 15 * 60.0
+        self.started_at = None
+        self.shown = None
+        self.wakes = 0
+        self.zeros = []
+        self.countdowns = {}  # name: (started at, seconds)
+        self.finished = 0
+        self.failures = []
+
+    def elapsed(self):
+        return self.now() - self.base
+
+    def fail(self, message):
+        if len(self.failures) < 10:
+            self.failures.append(message)
+
+    def remaining(self):
+        if self.started_at is None:
+            return self.left
+        return max(0.0, self.left - (self.now() - self.started_at))
+
+    def follow(self, action, args):
+        """Keep the reference clock in step with a scripted action"""
+        if action == "preset":
+            self.started_at = None
+            self.left = args[0] * 60 + args[1]
+        elif action == "start" and self.started_at is None and self.left > 0:
+            self.started_at = self.now()
+        elif action == "stop" and self.started_at is not None:
+            self.left = self.remaining()
+            self.started_at = None
+
+    def late(self, due, limit):
+        """When a wakeup due then runs: up to jitter late, but not past the next scripted event"""
+        at = due + self.rng.uniform(0, self.jitter)
+        return at if limit is None else min(at, limit)
+
+    def wake(self, shown, running):
+        """A clock wakeup showed shown; running is whether the scoreboard's clock still runs"""
+        self.wakes += 1
+        if self.wakes > MOST_WAKES:
+            raise RuntimeError(f"more than {MOST_WAKES} wakeups")
+        expected = shown_at(self.remaining())
+        if shown != expected:
+            self.fail(f"at {self.elapsed():.3f} s the clock showed {shown}, {expected} was left")
+        elif self.shown is not None:
+            previous = in_tenths(self.shown)
+            step = 1 if previous <= TENTHS_BELOW_SECONDS * 10 else 10
+            if in_tenths(shown) != previous - step:
+                self.fail(f"at {self.elapsed():.3f} s the clock went from {self.shown} to {shown}")
+        self.shown = shown
+        if not running and self.started_at is not None:
+            self.zeros.append(round(self.elapsed(), 6))
+            self.left = 0.0
+            self.started_at = None
+
+    def countdown_started(self, name, seconds):
+        self.countdowns[name] = (self.now(), seconds)
+
+    def countdown_done(self, name):
+        started, seconds = self.countdowns.pop(name)
+        took = self.now() - started
+        if not seconds - TOLERANCE <= took <= seconds + AFTER_RESOLUTION + self.jitter + TOLERANCE:
+            self.fail(f"{name} of {seconds} s took {took:.4f} s")
+        self.finished += 1
+
+    def check(self, expect, final):
+        for key, value in expect.items():
+            if key == "zero_at":
+                continue
+            if final[key] != value:
+                self.fail(f"{key} ended as {final[key]}, expected {value}")
+        zero_at = expect.get("zero_at", ())
+        if len(self.zeros) != len(zero_at):
+            self.fail(f"clock reached zero at {self.zeros}, expected {list(zero_at)}")
+        for reached, expected in zip(self.zeros, zero_at):
+            if not expected - TOLERANCE <= reached <= expected + AFTER_RESOLUTION + self.jitter + TOLERANCE:
+                self.fail(f"clock reached zero at {reached} s, expected {expected} s")
+        if self.countdowns:
+            self.fail(f"{', '.join(self.countdowns)} never finished")
+
+
+def time_countdowns(owner, replay):
+    """Report the starts and ends of owner's timeout and shot clock, where it has them"""
+    for name in ("timeout_countdown", "shot_clock"):
+        countdown = getattr(owner, name, None)
+        if countdown is None:
+            continue
+
+        def timed_start(seconds=None, name=name, countdown=countdown, start=countdown.start):
+            replay.countdown_started(name, countdown.seconds if seconds is None else seconds)
+            start(seconds)
+
+        def timed_done(name=name, on_done=countdown.on_done):
+            replay.countdown_done(name)
+            on_done()
+        countdown.start = timed_start
+        countdown.on_done = timed_done
+
+
+class TkBoard:
+    """A widget scoreboard on the Tk stand-in, its after() queue run on simulated time"""
+
+    def __init__(self, name, module, tkinter, now):
+        _, build = BOARDS[name]
+        self.loop = tkinter.loop
+        self.now = now
+        self.root = tkinter.Tk()
+        self.board = build(module, self.root, now)
+        self.root = getattr(self.board, "root", self.root)
+        self.replay = None
+
+    def attach(self, replay):
+        self.replay = replay
+        board = self.board
+        count_down = board.count_down
+
+        def timed_count_down():
+            count_down()
+            replay.wake(self.shown(), board.timer_running)
+        board.count_down = timed_count_down  # schedule_tick looks it up on each reschedule
+
+        time_countdowns(board, replay)
+
+    def apply(self, action, args):
+        board = self.board
+        if action == "score":
+            board.change_score(*args)
+        elif action == "sets":
+            board.change_sets(*args)
+        elif action == "timeouts":
+            board.change_timeouts(*args)
+        elif action == "possession":
+            board.change_serve(*args)
+        elif action == "next_game":
+            board.next_set()
+        elif action == "prev_game":
+            board.prev_set()
+        elif action == "preset":
+            board.set_timer(*args)
+        elif action == "start":
+            board.start_timer()
+        elif action == "stop":
+            board.stop_timer()
+        else:
+            raise ValueError(f"unknown action {action!r}")
+
+    def run_until(self, limit):
+        """Run the after() callbacks due by limit, or all of them with None"""
+        while True:
+            due = self.loop.next_due()
+            if due is None or (limit is not None and due > limit):
+                return
+            at = self.replay.late(due, limit)
+            if at > self.now():
+                self.now.advance(at - self.now())
+            self.loop.run_next()
+
+    def shown(self):
+        return parse_clock(self.board.clock_texts)
+
+    def final(self):
+        """The state as Tk shows it, once the pending variable and label writes went out"""
+        self.run_until(self.now())
+        board = self.board
+        labels = tuple(label.cget("text") for label in board.clock_labels)
+        if labels != board.clock_texts:
+            self.replay.fail(f"clock labels show {labels}, the scoreboard thinks {board.clock_texts}")
+        return {
+            "score": (board.home_score.get(), board.away_score.get()),
+            "sets": (board.home_sets.get(), board.away_sets.get()),
+            "timeouts": (board.home_timeouts.get(), board.away_timeouts.get()),
+            "game": board.current_set.get(),
+            "possession": board.serve_side.get(),
+            "clock": parse_clock(labels),
+            "running": board.timer_running,
+        }
+
+    def close(self):
+        if hasattr(self.board, "stop_countdowns"):
+            self.board.stop_countdowns()
+        self.board.stop_timer()
+        self.run_until(None)
+
+
+class PygameBoard:
+    """The pygame scoreboard and its MatchState, its own TimerService run on simulated time"""
+
+    def __init__(self, now):
+        import pygame
+        from pygame_scoreboard import PygameScoreboard
+        pygame.init()
+        self.now = now
+        self.board = PygameScoreboard(None, now=now)
+        self.state = self.board.state
+        self.timers = self.board.timers
+        self.board.process([])
+        self.replay = None
+
+    def attach(self, replay):
+        self.replay = replay
+        board = self.board
+        tick = board.tick
+
+        def timed_tick():
+            tick()
+            replay.wake(self.shown(), self.state.clock_running)
+        board.tick = timed_tick  # schedule_tick looks it up on each reschedule
+        time_countdowns(self.state, replay)
+
+    def apply(self, action, args):
+        state = self.state
+        if action == "score":
+            state.change_score(*args)
+        elif action == "sets":
+            state.change_sets(*args)
+        elif action == "timeouts":
+            state.change_timeouts(*args)
+        elif action == "possession":
+            state.change_possession(*args)
+        elif action == "next_game":
+            state.next_game()
+        elif action == "prev_game":
+            state.prev_game()
+        elif action == "preset":
+            state.set_clock(*args)
+        elif action == "start":
+            state.start_clock()
+        elif action == "stop":
+            state.stop_clock()
+        else:
+            raise ValueError(f"unknown action {action!r}")
+        self.board.process([])
+
+    def run_until(self, limit):
+        while True:
+            delay = self.timers.next_delay()
+            if delay is None or (limit is not None and self.now() + delay > limit):
+                return
+            at = self.replay.late(self.now() + delay, limit)
+            if at > self.now():
+                self.now.advance(at - self.now())
+            self.board.process([])  # a frame of the standalone loop runs the due timers
+
+    def shown(self):
+        return parse_clock(self.state.clock_parts)
+
+    def final(self):
+        state = self.state
+        return {
+            "score": (state.scores["HOME"], state.scores["AWAY"]),
+            "sets": (state.sets["HOME"], state.sets["AWAY"]),
+            "timeouts": (state.timeouts["HOME"], state.timeouts["AWAY"]),
+            "game": state.game,
+            "possession": state.possession,
+            "clock": self.shown(),
+            "running": state.clock_running,
+        }
+
+    def close(self):
+        import pygame
+        self.board.stop_countdowns()
+        self.board.stop_timer()
+        self.run_until(None)
+        pygame.quit()
+
+
+def replay(board, script, now, rng, jitter):
+    """Play script on board at simulated speed; returns the failures and a summary"""
+    run = Replay(now, rng, jitter)
+    board.attach(run)
+    run.shown = board.shown()
+    started = time.perf_counter()
+    for event in sorted(script["events"], key=lambda event: event[0]):
+        at, action, args = run.base + event[0], event[1], tuple(event[2:])
+        board.run_until(at)
+        now.advance(at - now())
+        run.follow(action, args)
+        board.apply(action, args)
+        board.run_until(now())  # anything the action left due at once, e.g. Tk's idle writes
+        run.shown = board.shown()
+    board.run_until(None)
+    wall = time.perf_counter() - started
+    run.check(script["expect"], board.final())
+    simulated = run.elapsed()
+    return run.failures, {"simulated_s": round(simulated, 3), "wall_s": round(wall, 4),
+                          "speedup": round(simulated / wall) if wall else None,
+                          "wakes": run.wakes, "countdowns": run.finished}
+
+
+def load_scripts(path):
+    """More scripts from a JSON file, with lists where SCRIPTS has tuples"""
+    with open(path) as f:
+        scripts = json.load(f)
+    for script in scripts.values():
+        script["expect"] = {key: tuple(tuple(item) if isinstance(item, list) else item for item in value)
+                            if isinstance(value, list) else value for key, value in script["expect"].items()}
+    return scripts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay scripted matches on the scoreboards at simulated speed")
+    parser.add_argument("--boards", default=",".join(BOARDS), help="comma separated subset of " + ",".join(BOARDS))
+    parser.add_argument("--scripts", help="comma separated subset of the scripts (default all)")
+    parser.add_argument("--script", action="append", default=[], help="JSON file with more scripts")
+    parser.add_argument("--jitter-ms", type=float, default=5.0,
+                        help="maximum lateness of a wakeup, below a tenth of a second (default 5)")
+    parser.add_argument("--min-speedup", type=float, default=1000.0,
+                        help="fail if a scoreboard's simulated time runs less than this many times real time "
+                             "over all scripts (default 1000)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    scripts = dict(SCRIPTS)
+    for path in args.script:
+        scripts.update(load_scripts(path))
+    names = args.scripts.split(",") if args.scripts else list(scripts)
+    rng = random.Random(args.seed)
+    jitter = args.jitter_ms / 1000.0
+    # One simulated clock for the whole run; Tk runs against the stand-in on it
+    now = FakeClock(1000.0)
+    tkinter = tk_stand_in(now)[0]
+    os.chdir(NEW_UI)
+
+    failed = False
+    modules = {}
+    for board_name in args.boards.split(","):
+        path = BOARDS[board_name][0]
+        simulated = wall = 0.0
+        for script_name in names:
+            with contextlib.redirect_stdout(io.StringIO()):
+                if path is None:
+                    board = PygameBoard(now)
+                else:
+                    if path not in modules:
+                        modules[path] = load_script(os.path.join(ROOT, path), f"simulate_{board_name}")
+                    board = TkBoard(board_name, modules[path], tkinter, now)
+                failures, details = replay(board, scripts[script_name], now, rng, jitter)
+                board.close()
+            simulated += details["simulated_s"]
+            wall += details["wall_s"]
+            failed = failed or bool(failures)
+            summary = ", ".join(f"{key} {value}" for key, value in details.items())
+            print(f"{board_name:10} {script_name:12} {'FAIL' if failures else 'ok':4}  {summary}")
+            for failure in failures:
+                print(f"           {failure}")
+        speedup = simulated / wall if wall else math.inf
+        slow = speedup < args.min_speedup
+        failed = failed or slow
+        print(f"{board_name:10} {'(all)':12} {'FAIL' if slow else 'ok':4}  simulated_s {simulated:.3f}, "
+              f"wall_s {wall:.4f}, speedup {speedup:.0f}")
+        if slow:
+            print(f"           only {speedup:.0f}x real time, below {args.min_speedup:g}x")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
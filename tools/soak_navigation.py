@@ -0,0 +1,199 @@
+# Navigation soak test for the Raspberry Pi build (tablesoccer v7).
+#
+# Drives MultiLevelGameApplication through a fixed loop of legal navigations
+# (main menu, login, pay modes, QR payment, game modes, scoreboard and back)
+# from inside its Tk event loop and samples resident memory, live Python
+# objects and the call stack depth at each navigation. With the single event
+# loop all three should stay flat; nested mainloop() calls show up as a
+# growing stack depth.
+#
+#   python tools/soak_navigation.py --navigations 10000 --output soak.json
+#
+# Tk needs an X display (run under Xvfb on a headless machine); pygame uses
+# the SDL dummy driver. Exits with status 1 if memory grows by more than
+# --max-growth-kb between the start and the end of the run, if a navigation
+# is rejected, or if the stack is deeper or shallower after a round trip
+# through ROUTE than at the start: at the start of every lap, and at each
+# navigation compared with the same navigation on the first lap.
+
+import os
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import contextlib
+import gc
+import importlib.machinery
+import importlib.util
+import json
+import platform
+import sys
+import time
+import traceback
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# One lap through every screen; each entry is (application method, arguments)
+ROUTE = (
+    ("show_login_screen", ("RANKED",)),
+    ("show_paymodes", (False,)),
+    ("show_qr_code", ()),
+    ("back_to_paymodes", ()),
+    ("show_game_modes", ()),
+    ("start_tablesoccer", ()),
+    ("back_to_main_menu", ()),
+    ("show_paymodes", (True,)),
+    ("show_game_modes", ()),
+    ("back_to_paymodes", ()),
+    ("back_to_main_menu", ()),
+)
+
+
+def load_script(path, name):
+    """Import a script by path (tablesoccer v7 has a space and no .py extension)"""
+    loader = importlib.machinery.SourceFileLoader(name, path)
+    spec = importlib.util.spec_from_loader(name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+def resident_kb():
+    """Resident set size of this process in KB"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        import resource
+        # Peak rather than current outside Linux, still enough to spot growth
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class SoakDriver:
+    """Performs one navigation per Tk callback and samples the process as it goes"""
+
+    def __init__(self, app, navigations, sample_every):
+        self.app = app
+        self.navigations = navigations
+        self.sample_every = sample_every
+        self.done = 0
+        self.stack_depths = []
+        self.samples = []
+        self.failures = 0
+        self.start_depth = None  # stack depth at the start of the first lap
+        self.route_depths = {}  # route position: stack depth at its navigation on the first lap
+        self.depth_changes = []  # (navigations, depth at the start, depth now) for every mismatch
+        self._navigate = app.navigate
+        app.navigate = self.navigate
+
+    def navigate(self, target):
+        depth = len(traceback.extract_stack())
+        self.stack_depths.append(depth)
+        first = self.route_depths.setdefault(self.done % len(ROUTE), depth)
+        if depth != first:
+            self.depth_changes.append((self.done, first, depth))
+        moved = self._navigate(target)
+        if not moved:
+            self.failures += 1
+        return moved
+
+    def step(self):
+        if self.done % len(ROUTE) == 0:
+            # Back at the main menu after a round trip: the stack must be as deep as when we started
+            depth = len(traceback.extract_stack())
+            if self.start_depth is None:
+                self.start_depth = depth
+            elif depth != self.start_depth:
+                self.depth_changes.append((self.done, self.start_depth, depth))
+        method, args = ROUTE[self.done % len(ROUTE)]
+        getattr(self.app, method)(*args)
+        self.done += 1
+
+        if self.done % self.sample_every == 0:
+            gc.collect()
+            self.samples.append({
+                "navigations": self.done,
+                "rss_kb": resident_kb(),
+                "gc_objects": len(gc.get_objects()),
+                "max_stack_depth": max(self.stack_depths),
+            })
+            self.stack_depths = []
+        if self.done >= self.navigations:
+            self.app.root.quit()
+        else:
+            # Give the main menu a frame or two and Tk its pending events between navigations
+            self.app.root.after(1, self.step)
+
+
+def growth(samples, field, warmup):
+    """Difference between the mean of the last and the first tenth of the samples after warmup"""
+    values = [sample[field] for sample in samples if sample["navigations"] > warmup]
+    if len(values) < 2:
+        return 0
+    window = max(1, len(values) // 10)
+    return sum(values[-window:]) / window - sum(values[:window]) / window
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Navigation soak test for tablesoccer v7")
+    parser.add_argument("--navigations", type=int, default=10000, help="navigations to perform (default 10000)")
+    parser.add_argument("--sample-every", type=int, default=100, help="navigations between samples (default 100)")
+    parser.add_argument("--warmup", type=int, default=500,
+                        help="navigations before memory is expected to be flat (default 500)")
+    parser.add_argument("--max-growth-kb", type=int, default=2048,
+                        help="allowed resident memory growth after warmup (default 2048)")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)  # The screens load assets relative to the repository root
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        v7 = load_script(os.path.join(ROOT, "tablesoccer v7"), "soak_v7")
+        app = v7.MultiLevelGameApplication()
+        app.initialize_fullscreen_window()
+        app.start_main_menu()
+        driver = SoakDriver(app, args.navigations, args.sample_every)
+        started = time.perf_counter()
+        app.root.after(1, driver.step)
+        app.root.mainloop()
+        elapsed = time.perf_counter() - started
+
+    depths = [sample["max_stack_depth"] for sample in driver.samples]
+    rss_growth = growth(driver.samples, "rss_kb", args.warmup)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "navigations": driver.done,
+            "seconds": round(elapsed, 1),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "summary": {
+            "rejected_navigations": driver.failures,
+            "rss_growth_kb": round(rss_growth, 1),
+            "gc_object_growth": round(growth(driver.samples, "gc_objects", args.warmup), 1),
+            "stack_depth_min": min(depths) if depths else None,
+            "stack_depth_max": max(depths) if depths else None,
+            "stack_depth_changes": len(driver.depth_changes),
+            "first_stack_depth_change": driver.depth_changes[0] if driver.depth_changes else None,
+            "screens": app.screens.stats(),
+        },
+        "samples": driver.samples,
+    }
+    output = json.dumps(report, indent=2, default=str)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    print(f"{driver.done} navigations in {elapsed:.1f}s: memory growth {rss_growth:.0f} KB, "
+          f"stack depth {report['summary']['stack_depth_min']}-{report['summary']['stack_depth_max']}, "
+          f"{len(driver.depth_changes)} depth changes after a round trip", file=sys.stderr)
+
+    app.root.destroy()
+    return 1 if rss_growth > args.max_growth_kb or driver.failures or driver.depth_changes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,295 @@
+# Stress test for the Tk scoreboards' game clock.
+#
+# Builds each widget scoreboard (TableSoccerScoreboard from new ui/Gamemode
+# UI.py, VolleyballScoreboard from new ui/scorecard.py, foosballScoreboard
+# from new ui/soccercard.py and TableSoccerScoreboard from tablesoccer v7),
+# toggles its clock 10,000 times with the Tk event loop pumped in between,
+# then lets it run for a few seconds, and checks that
+#
+#   threads  no thread is started, however fast the clock is toggled
+#   ticks    at most one count_down is ever pending, exactly one while the
+#            clock runs and none while it is stopped
+#   off-Tk   no Tk widget or variable is touched from another thread
+#   seconds  a running clock ticks once per shown second
+#
+# Tk runs for real when DISPLAY is set (use Xvfb for a virtual display), and
+# otherwise against a small stand-in that runs after() callbacks when due.
+#
+#   python tools/stress_timer_toggle.py --toggles 10000
+#
+# Exits with status 1 if any check fails.
+
+import os
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import contextlib
+import importlib.machinery
+import importlib.util
+import io
+import random
+import sys
+import threading
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NEW_UI = os.path.join(ROOT, "new ui")
+
+# name: (script, how to build the scoreboard from the module and a Tk root)
+BOARDS = {
+    "gamemode": ("new ui/Gamemode UI.py", lambda module, root: module.TableSoccerScoreboard(None, root)),
+    "volleyball": ("new ui/scorecard.py", lambda module, root: module.VolleyballScoreboard(None, root)),
+    "foosball": ("new ui/soccercard.py", lambda module, root: module.foosballScoreboard()),
+    "v7": ("tablesoccer v7", lambda module, root: module.TableSoccerScoreboard(None, module.tk.Frame(root))),
+}
+
+
+def load_script(path, name):
+    """Import a script by path (the UI files have spaces or no .py extension)"""
+    loader = importlib.machinery.SourceFileLoader(name, path)
+    spec = importlib.util.spec_from_loader(name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+def tk_stand_in(now=time.monotonic):
+    """A tkinter replacement whose after() queue is run by update() and counted by pending().
+
+    after() deadlines are read from now, so with a fake clock the queue runs on
+    simulated time; tkinter.loop.next_due() and run_next() step through it (see
+    tools/simulate_match.py).
+    """
+    off_thread = []
+
+    def on_tk_thread(name):
+        if threading.current_thread() is not threading.main_thread():
+            off_thread.append(f"{name} from {threading.current_thread().name}")
+
+    class Widget:
+        def __init__(self, master=None, *args, **options):
+            on_tk_thread(type(self).__name__)
+            self.master = master
+            self.options = options
+
+        def __getattr__(self, name):
+            # pack, grid, bind, create_oval, ...: accept and ignore
+            on_tk_thread(name)
+            return lambda *args, **kwargs: None
+
+        def winfo_toplevel(self):
+            return self if self.master is None else self.master.winfo_toplevel()
+
+        def cget(self, option):
+            return self.options.get(option, "")
+
+        def config(self, **options):
+            on_tk_thread("config")
+            self.options.update(options)
+
+        configure = config
+
+        def after(self, delay_ms, callback=None, *args):
+            on_tk_thread("after")
+            return loop.after(delay_ms, callback, *args)
+
+        def after_idle(self, callback, *args):
+            on_tk_thread("after_idle")
+            return loop.after(0, callback, *args)
+
+        def after_cancel(self, identifier):
+            on_tk_thread("after_cancel")
+            loop.queue.pop(identifier, None)
+
+        def update(self):
+            loop.run_due()
+
+    class Loop:
+        def __init__(self):
+            self.queue = {}
+            self.next_id = 0
+
+        def after(self, delay_ms, callback, *args):
+            self.next_id += 1
+            self.queue[self.next_id] = (now() + delay_ms / 1000.0, self.next_id, callback, args)
+            return self.next_id
+
+        def run_due(self):
+            due = now()
+            for entry in sorted(entry for entry in self.queue.values() if entry[0] <= due):
+                if self.queue.pop(entry[1], None) is not None:
+                    entry[2](*entry[3])
+
+        def next_due(self):
+            """Deadline of the earliest after() callback, or None when the queue is empty"""
+            return min((entry[0] for entry in self.queue.values()), default=None)
+
+        def run_next(self):
+            """Run the earliest callback, whatever the time; the caller moves the clock to it first"""
+            entry = min(self.queue.values())
+            del self.queue[entry[1]]
+            entry[2](*entry[3])
+
+    class Variable:
+        def __init__(self, master=None, value=None, name=None):
+            on_tk_thread("Variable")
+            self.value = value
+
+        def get(self):
+            on_tk_thread("Variable.get")
+            return self.value
+
+        def set(self, value):
+            on_tk_thread("Variable.set")
+            self.value = value
+
+    loop = Loop()
+    tkinter = types.ModuleType("tkinter")
+    ttk = types.ModuleType("tkinter.ttk")
+    for name in ("Tk", "Button", "Canvas", "Entry", "Frame", "Label", "Toplevel", "Scrollbar", "Listbox", "Text"):
+        setattr(tkinter, name, type(name, (Widget,), {}))
+    for name in ("Button", "Frame", "Label", "Style", "Progressbar", "Combobox"):
+        setattr(ttk, name, type(name, (Widget,), {}))
+    tkinter.Misc = Widget
+    tkinter.StringVar = tkinter.IntVar = tkinter.BooleanVar = tkinter.DoubleVar = Variable
+    tkinter.TclError = RuntimeError
+    tkinter.END = "end"
+    tkinter.ttk = ttk
+    tkinter.loop = loop
+    sys.modules["tkinter"] = tkinter
+    sys.modules["tkinter.ttk"] = ttk
+
+    def pending(root, name):
+        return sum(1 for entry in loop.queue.values() if getattr(entry[2], "__name__", "") == name)
+
+    return tkinter, pending, off_thread
+
+
+def real_tk():
+    import tkinter
+
+    def pending(root, name):
+        # tkinter registers after() callbacks as Tcl commands named <id><function name>
+        count = 0
+        for identifier in root.tk.splitlist(root.tk.call("after", "info")):
+            script = root.tk.splitlist(root.tk.call("after", "info", identifier))[0]
+            count += str(script).endswith(name)
+        return count
+
+    return tkinter, pending, []
+
+
+def stress(name, tkinter, pending, off_thread, toggles, run_seconds, rng):
+    script, build = BOARDS[name]
+    with contextlib.redirect_stdout(io.StringIO()):
+        module = load_script(os.path.join(ROOT, script), f"stress_{name}")
+        root = tkinter.Tk()
+        board = build(module, root)
+        root = getattr(board, "root", root)
+        root.update()
+    toggle = board.toggle_timer
+    if toggle.__code__.co_argcount == 2:
+        toggle = lambda toggle=board.toggle_timer: toggle(None)  # noqa: E731  (bound to <Button-1>)
+
+    ticks = []
+    count_down = board.count_down
+
+    def counted_count_down():
+        ticks.append(time.monotonic())
+        count_down()
+    board.count_down = counted_count_down  # schedule_tick looks it up on each reschedule
+
+    def waiting_ticks():
+        if hasattr(board, "timers"):
+            # Ticks through a TimerService, which keeps its own single after()
+            return sum(handle.callback.__name__ == "counted_count_down" for handle in board.timers.pending())
+        return pending(root, "counted_count_down")
+
+    baseline = threading.active_count()
+    most_threads = baseline
+    most_pending = 0
+    wrong_pending = 0
+    started = time.perf_counter()
+    for _ in range(toggles):
+        toggle()
+        # Hold the new state for up to a couple of milliseconds so some ticks land between toggles
+        hold_until = time.perf_counter() + rng.uniform(0.0, 0.002)
+        while True:
+            root.update()
+            if time.perf_counter() >= hold_until:
+                break
+        waiting = waiting_ticks()
+        most_pending = max(most_pending, waiting)
+        wrong_pending += waiting != (1 if board.timer_running else 0)
+        most_threads = max(most_threads, threading.active_count())
+    toggle_s = time.perf_counter() - started
+
+    # A clean run: one tick per shown second, and nothing left behind once stopped
+    board.set_timer(15, 0)
+    board.start_timer()
+    ticks.clear()
+    deadline = time.monotonic() + run_seconds
+    while time.monotonic() < deadline:
+        root.update()
+        time.sleep(0.001)
+    board.stop_timer()
+    root.update()
+    left_pending = waiting_ticks()
+    most_threads = max(most_threads, threading.active_count())
+
+    failures = []
+    if most_threads > baseline:
+        failures.append(f"{most_threads - baseline} threads started while toggling")
+    if most_pending > 1:
+        failures.append(f"up to {most_pending} ticks pending at once")
+    if wrong_pending:
+        failures.append(f"{wrong_pending} toggles left a running clock without its tick or a stopped one with it")
+    if off_thread:
+        failures.append(f"{len(off_thread)} Tk calls off the Tk thread, e.g. {off_thread[0]}")
+    if not int(run_seconds) - 1 <= len(ticks) <= int(run_seconds):
+        failures.append(f"{len(ticks)} ticks in {run_seconds} s of running")
+    if left_pending:
+        failures.append(f"{left_pending} ticks still pending after stop_timer()")
+    with contextlib.redirect_stdout(io.StringIO()):
+        with contextlib.suppress(Exception):
+            root.destroy()
+    return failures, {"toggles": toggles, "seconds": round(toggle_s, 2),
+                      "threads": f"{baseline}->{most_threads}", "max_pending": most_pending,
+                      "ticks": len(ticks)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Toggle the Tk scoreboards' clock and check for thread and tick buildup")
+    parser.add_argument("--boards", default=",".join(BOARDS), help="comma separated subset of " + ",".join(BOARDS))
+    parser.add_argument("--toggles", type=int, default=10000, help="clock toggles per scoreboard (default 10000)")
+    parser.add_argument("--run-seconds", type=float, default=3.0, help="clean run after the toggles (default 3)")
+    parser.add_argument("--tk", choices=("auto", "real", "stand-in"), default="auto")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    tk_mode = args.tk
+    if tk_mode == "auto":
+        tk_mode = "real" if os.environ.get("DISPLAY") or not sys.platform.startswith("linux") else "stand-in"
+    tkinter, pending, off_thread = tk_stand_in() if tk_mode == "stand-in" else real_tk()
+    sys.path.insert(0, NEW_UI)
+    os.chdir(NEW_UI)
+
+    rng = random.Random(args.seed)
+    failed = False
+    print(f"Tk: {tk_mode}")
+    for name in args.boards.split(","):
+        failures, details = stress(name, tkinter, pending, off_thread, args.toggles, args.run_seconds, rng)
+        failed = failed or bool(failures)
+        summary = ", ".join(f"{key} {value}" for key, value in details.items())
+        print(f"{name:10} {'FAIL' if failures else 'ok':4}  {summary}")
+        for failure in failures:
+            print(f"           {failure}")
+        off_thread.clear()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())